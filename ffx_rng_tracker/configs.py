@@ -35,6 +35,7 @@ class Configs:
     seed: int | None
     game_version: GameVersion
     continue_ps2_seed_search: bool
+    seeds_cache_size: int
     speedrun_category: SpeedrunCategory | str
     default_theme: str
     font_size: int
@@ -123,6 +124,8 @@ class Configs:
             cls.game_version = GameVersion.HD
         cls.continue_ps2_seed_search = cls.getboolean(
             section, 'continue ps2 seed search', False)
+        cls.seeds_cache_size = max(
+            cls.getint(section, 'seeds cache size', 4), 0)
         speedrun_category = cls.get(section, 'category', 'AnyPercent')
         try:
             speedrun_category = SpeedrunCategory(speedrun_category)
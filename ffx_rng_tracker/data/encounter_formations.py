@@ -23,6 +23,25 @@ class Formation:
         monsters = get_monsters_dict()
         return [monsters[m] for m in self.monsters_names]
 
+    def get_condition(self,
+                      condition_rng: int,
+                      initiative: bool = False,
+                      ) -> EncounterCondition:
+        """Returns the condition of the encounter given the lowest
+        8 bits of its rng value and if a character in the party
+        has initiative.
+        """
+        if self.forced_condition is not None:
+            return self.forced_condition
+        if initiative:
+            condition_rng -= 33
+        if condition_rng < 32:
+            return EncounterCondition.PREEMPTIVE
+        elif condition_rng < 255 - 32:
+            return EncounterCondition.NORMAL
+        else:
+            return EncounterCondition.AMBUSH
+
 
 @dataclass
 class Zone:
@@ -37,6 +56,10 @@ class Zone:
     def __str__(self) -> str:
         return self.name
 
+    def get_formation(self, rng_value: int) -> Formation:
+        """Returns the formation of the encounter given its rng value."""
+        return self.formations[rng_value % len(self.formations)]
+
 
 @dataclass
 class Boss:
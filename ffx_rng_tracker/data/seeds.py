@@ -1,35 +1,303 @@
+import heapq
+import json
+import mmap
+import multiprocessing
 import os
-import pprint
-from collections.abc import Iterable
-from itertools import islice
+import shutil
+import struct
+import sys
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import compress, islice, product
 from logging import getLogger
+from threading import Event
+from typing import Self
 
 from ..configs import Configs
-from ..errors import InvalidDamageValueError, SeedNotFoundError
-from ..tracker import FFXRNGTracker
-from ..utils import open_cp1252
-from .constants import GameVersion
-
-type Node = dict[int, Node] | int
-type PrunedNode = dict[str, PrunedNode] | str
-
-
-def prune(node: Node) -> PrunedNode:
-    """prune branches with a single child to a leaf recursively"""
-    # if the node is a leaf return it
-    if isinstance(node, int):
-        return f'{node:010}'
-    elif len(node) == 1:
-        # get the only value in the dict and prune it
-        k, v = next(iter(node.items()))
-        child = prune(v)
-        # if it got pruned to a leaf return it
-        if isinstance(child, str):
-            return child
-        # otherwise return the node since it cant be pruned further
-        return {f'{k:02}': child}
-    # if there is more than one child then reduce all of them
-    return {f'{k:02}': prune(v) for k, v in node.items()}
+from ..errors import (InvalidDamageValueError, SeedNotFoundError,
+                      SeedSearchCancelledError)
+from ..tracker import (BatchRNGTracker, FFXRNGTracker, get_lanes_ones,
+                       pack_lanes, rotate_rng_lanes, unpack_lanes)
+from .constants import EncounterCondition, GameVersion
+from .encounter_formations import BOSSES, SIMULATIONS, ZONES, Formation
+
+# called with the number of tasks done and the total number of tasks
+type ProgressCallback = Callable[[int, int], None]
+
+
+class SeedsIndex:
+    """Read-only memory-mapped view of a binary seeds file.
+
+    The file is a sequence of fixed-width records sorted by key:
+    the 8 damage rolls of a seed packed in 6 bytes (6 bits per roll,
+    first roll in the highest bits) followed by the seed as an
+    unsigned 32-bit integer, both big-endian.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, 'rb') as file_object:
+            if os.fstat(file_object.fileno()).st_size:
+                self._data = mmap.mmap(
+                    file_object.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # empty files can't be memory-mapped
+                self._data = b''
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._data) // SEEDS_FILE_RECORD.size
+
+    def __getitem__(self, index: int) -> bytes:
+        """Returns the key of the record at index."""
+        if not (0 <= index < len(self)):
+            raise IndexError(index)
+        offset = index * SEEDS_FILE_RECORD.size
+        return self._data[offset:offset + SEEDS_KEY_SIZE]
+
+    def get_seed(self, index: int) -> int:
+        """Returns the seed of the record at index."""
+        offset = index * SEEDS_FILE_RECORD.size
+        return SEEDS_FILE_RECORD.unpack_from(self._data, offset)[1]
+
+    def find(self,
+             damage_rolls: Iterable[int],
+             start: int = 0,
+             stop: int | None = None,
+             ) -> range:
+        """Returns the range of indexes of the records whose damage
+        rolls start with damage_rolls, the search can be restricted
+        to the records between start and stop.
+        """
+        if stop is None:
+            stop = len(self)
+        key = 0
+        n_of_rolls = 0
+        for damage_roll in damage_rolls:
+            key = key << 6 | damage_roll
+            n_of_rolls += 1
+        shift = 6 * (8 - n_of_rolls)
+        lowest_key = (key << shift).to_bytes(SEEDS_KEY_SIZE)
+        highest_key = (((key + 1) << shift) - 1).to_bytes(SEEDS_KEY_SIZE)
+        start = bisect_left(self, lowest_key, start, stop)
+        stop = bisect_right(self, highest_key, start, stop)
+        return range(start, stop)
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+class SeedsOrigins:
+    """Read-only memory-mapped view of a binary seeds origins file.
+
+    The file is a sequence of fixed-width records sorted by seed:
+    the seed and the first frame that produces it as unsigned
+    32-bit integers followed by the datetime as an unsigned
+    8-bit integer, all big-endian.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, 'rb') as file_object:
+            if os.fstat(file_object.fileno()).st_size:
+                self._data = mmap.mmap(
+                    file_object.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # empty files can't be memory-mapped
+                self._data = b''
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._data) // SEEDS_ORIGINS_RECORD.size
+
+    def __getitem__(self, index: int) -> int:
+        """Returns the seed of the record at index."""
+        if not (0 <= index < len(self)):
+            raise IndexError(index)
+        offset = index * SEEDS_ORIGINS_RECORD.size
+        return SEEDS_ORIGINS_RECORD.unpack_from(self._data, offset)[0]
+
+    def get_origin(self, seed: int) -> tuple[int, int] | None:
+        """Returns the first frame and datetime that produce seed
+        or None if the seed is not in the file.
+        """
+        index = bisect_left(self, seed)
+        if index == len(self) or self[index] != seed:
+            return None
+        offset = index * SEEDS_ORIGINS_RECORD.size
+        _, frame, date_time = SEEDS_ORIGINS_RECORD.unpack_from(
+            self._data, offset)
+        return frame, date_time
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+class SeedCandidates:
+    """Seeds of a seeds file whose damage rolls start with the
+    damage rolls of the damage values passed to update.
+
+    The records matching every prefix of the damage rolls are
+    cached, so adding or changing the last damage value only
+    narrows the records of the previous ones.
+    """
+
+    def __init__(self, seeds_index: SeedsIndex) -> None:
+        self.seeds_index = seeds_index
+        self.damage_rolls: list[int] = []
+        # indexes of the records matching the first n damage rolls
+        self._ranges = [range(len(seeds_index))]
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    @property
+    def indexes(self) -> range:
+        """Indexes of the records of the candidates."""
+        return self._ranges[-1]
+
+    def update(self, damage_values: Iterable[int]) -> None:
+        """Narrows the candidates to the seeds with damage_values,
+        only the first 8 damage values are used.
+
+        Raises InvalidDamageValueError if one of the
+        damage values is not valid.
+        """
+        # the keys of the records have 8 damage rolls
+        damage_rolls = damage_value_to_rolls(list(damage_values)[:8])
+        unchanged_rolls = 0
+        for old_roll, roll in zip(self.damage_rolls, damage_rolls):
+            if old_roll != roll:
+                break
+            unchanged_rolls += 1
+        del self._ranges[unchanged_rolls + 1:]
+        for n_of_rolls in range(unchanged_rolls + 1, len(damage_rolls) + 1):
+            indexes = self.seeds_index.find(
+                damage_rolls[:n_of_rolls], self.indexes.start,
+                self.indexes.stop)
+            self._ranges.append(indexes)
+        self.damage_rolls = damage_rolls
+
+    def get_seeds(self, amount: int | None = None) -> list[int]:
+        """Returns the seeds of the first amount candidates
+        or of all of them if amount is None.
+        """
+        indexes = self.indexes
+        if amount is not None:
+            indexes = indexes[:amount]
+        return [self.seeds_index.get_seed(i) for i in indexes]
+
+
+@dataclass(frozen=True)
+class ObservedEncounter:
+    """Encounter seen in game, name is the name of a boss,
+    simulation or zone as used by the encounter command,
+    formation and condition are None if they weren't seen.
+    """
+    name: str
+    formation: Formation | None = None
+    condition: EncounterCondition | None = None
+    initiative: bool = False
+
+
+@dataclass(frozen=True)
+class EncounterFilter:
+    """Matches the seeds whose rng value of rng index 1
+    at position modulo modulus is in residues.
+    """
+    position: int
+    modulus: int
+    residues: frozenset[int]
+
+
+class EncountersIndex:
+    """Read-only memory-mapped view of a binary encounters file.
+
+    The file has ENCOUNTERS_FILE_VALUES columns, column n holds
+    the n-th rng value of rng index 1 of every seed of a seeds file,
+    in the same order as its records, as unsigned 32-bit integers
+    in native byte order.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        with open(file_path, 'rb') as file_object:
+            if os.fstat(file_object.fileno()).st_size:
+                self._data = mmap.mmap(
+                    file_object.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # empty files can't be memory-mapped
+                self._data = b''
+        self._values = memoryview(self._data).cast('I')
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._values) // ENCOUNTERS_FILE_VALUES
+
+    def get_column(self, position: int) -> memoryview:
+        """Returns the rng values at position of every seed."""
+        size = len(self)
+        return self._values[position * size:(position + 1) * size]
+
+    def filter(self,
+               filters: Iterable[EncounterFilter],
+               indexes: Iterable[int] | None = None,
+               ) -> list[int]:
+        """Returns the indexes of the seeds that match every filter,
+        the search can be restricted to indexes.
+        """
+        if indexes is not None:
+            indexes = list(indexes)
+        for encounter_filter in filters:
+            if indexes is None:
+                indexes = self.filter_column(encounter_filter)
+                continue
+            column = self.get_column(encounter_filter.position)
+            modulus = encounter_filter.modulus
+            residues = encounter_filter.residues
+            indexes = [i for i in indexes
+                       if column[i] % modulus in residues]
+        if indexes is None:
+            return list(range(len(self)))
+        return indexes
+
+    def filter_column(self, encounter_filter: EncounterFilter) -> list[int]:
+        """Returns the indexes of every seed that matches the filter."""
+        column = self.get_column(encounter_filter.position)
+        modulus = encounter_filter.modulus
+        residues = encounter_filter.residues
+        if 256 % modulus:
+            return [i for i, v in enumerate(column)
+                    if v % modulus in residues]
+        # the residue only depends on the lowest byte of the value,
+        # the lowest bytes of the column are checked all at once
+        table = bytes(b % modulus in residues for b in range(256))
+        first_byte = 0 if sys.byteorder == 'little' else 3
+        lowest_bytes = bytes(column.cast('B')[first_byte::4])
+        matches = lowest_bytes.translate(table)
+        return list(compress(range(len(column)), matches))
+
+    def close(self) -> None:
+        self._values.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
 
 
 def damage_rolls_to_values(damage_rolls: Iterable[int]) -> list[int]:
@@ -94,17 +362,89 @@ def damage_value_to_rolls(damage_values: Iterable[int]) -> list[int]:
     return indexes
 
 
-def get_seed_from_string(damage_values_string: str,
-                         continue_search: bool = False,
-                         ) -> int:
+def parse_damage_values(damage_values_string: str) -> list[int]:
+    """splits the string in integers, commas, dashes, slashes
+    and dots are valid separators
+
+    raises SeedNotFoundError if one of the values is not an integer
+    """
     for symbol in (',', '-', '/', '\\', '.'):
         damage_values_string = damage_values_string.replace(symbol, ' ')
-    seed_info = damage_values_string.split()
     try:
-        seed_info = [int(i) for i in seed_info]
+        return [int(i) for i in damage_values_string.split()]
     except ValueError as error:
         error = str(error).split(': ', 1)[1]
         raise SeedNotFoundError(f'{error} is not a valid damage value')
+
+
+def parse_observed_encounters(encounters_string: str,
+                              ) -> list[ObservedEncounter]:
+    """splits the string in encounters separated by semicolons,
+    every encounter is the name used by the encounter command
+    optionally followed by the formation as shown by the trackers,
+    the condition and "initiative" if it was equipped, e.g.
+    "sinscales; ammes; underwater_ruins piranha, piranha#2 ambush"
+
+    raises SeedNotFoundError if an encounter or formation
+    doesn't exist
+    """
+    conditions = {c.lower(): c for c in EncounterCondition}
+    encounters = []
+    for encounter_string in encounters_string.split(';'):
+        words = encounter_string.lower().split()
+        if not words:
+            continue
+        name, *words = words
+        initiative = False
+        condition = None
+        while words and words[-1] in ('initiative', *conditions):
+            word = words.pop()
+            if word == 'initiative':
+                initiative = True
+            else:
+                condition = conditions[word]
+        if name in ZONES:
+            formations = ZONES[name].formations
+        elif name in BOSSES:
+            formations = [BOSSES[name].formation]
+        elif name in SIMULATIONS:
+            formations = [SIMULATIONS[name].monsters]
+        else:
+            raise SeedNotFoundError(f'No encounter named "{name}"')
+        formation = None
+        if words:
+            formation_name = ' '.join(words)
+            for possible_formation in formations:
+                if str(possible_formation).lower() == formation_name:
+                    formation = possible_formation
+                    break
+            else:
+                raise SeedNotFoundError(
+                    f'No formation "{formation_name}" in "{name}"')
+        encounters.append(
+            ObservedEncounter(name, formation, condition, initiative))
+    return encounters
+
+
+def get_seed_from_string(damage_values_string: str,
+                         continue_search: bool = False,
+                         progress_callback: ProgressCallback | None = None,
+                         cancel_event: Event | None = None,
+                         ) -> int:
+    """returns the seed of the damage values, of the encounters
+    parsed by parse_observed_encounters if the string has letters
+    or the seed number itself
+    """
+    if any(c.isalpha() for c in damage_values_string):
+        encounters = parse_observed_encounters(damage_values_string)
+        seeds = get_seeds_from_encounters(
+            encounters, progress_callback, cancel_event)
+        if len(seeds) > 1:
+            raise SeedNotFoundError(
+                f'{len(seeds)} seeds match the encounters, '
+                'input more encounters')
+        return seeds[0]
+    seed_info = parse_damage_values(damage_values_string)
     if len(seed_info) == 0:
         raise SeedNotFoundError('Input damage values or a Seed Number first')
     elif len(seed_info) == 1:
@@ -113,11 +453,14 @@ def get_seed_from_string(damage_values_string: str,
             return seed
         raise SeedNotFoundError(
             'Seed must be an integer between 0 and 4294967295')
-    return get_seed(seed_info, Configs.continue_ps2_seed_search)
+    return get_seed(
+        seed_info, continue_search, progress_callback, cancel_event)
 
 
 def get_seed(damage_values: Iterable[int],
              continue_search: bool = False,
+             progress_callback: ProgressCallback | None = None,
+             cancel_event: Event | None = None,
              ) -> int:
     """damage_values needs to have at least 3 or 8 items
     depending on what Configs.game_version is set to
@@ -125,6 +468,9 @@ def get_seed(damage_values: Iterable[int],
     if continue_search is true when the seed is not found in the
     seeds file search_seed is called with the same dvs
 
+    progress_callback and cancel_event are passed to make_seeds_file
+    and search_seed
+
     returns an integer between 0 and (2**32 - 1)
 
     raises SeedNotFoundError if there are less than 3 or 8 items
@@ -136,6 +482,41 @@ def get_seed(damage_values: Iterable[int],
         raise SeedNotFoundError(
             f'Need at least {dvs_needed} damage values')
 
+    logger = getLogger(__name__)
+    seeds_file_path = get_seeds_file(progress_callback, cancel_event)
+
+    damage_values = damage_values[:dvs_needed]
+    damage_rolls = damage_value_to_rolls(damage_values)
+    with SeedsIndex(seeds_file_path) as seeds_index:
+        indexes = seeds_index.find(damage_rolls)
+        if indexes:
+            seed = seeds_index.get_seed(indexes[0])
+    if indexes:
+        logger.info(f'Found seed {seed} in seeds file'
+                    f' from DVs "{damage_values}"'
+                    )
+    else:
+        logger.warning(
+            f'Failed to find seed in seeds file from DVs "{damage_values}".')
+        if Configs.game_version is GameVersion.HD or not continue_search:
+            raise SeedNotFoundError('Seed not found (seeds file exhausted)')
+        seed = search_seed(damage_rolls,
+                           progress_callback=progress_callback,
+                           cancel_event=cancel_event,
+                           )
+        logger.info(f'Found seed {seed} from seed search'
+                    f' from DVs "{damage_values}"'
+                    )
+    return seed
+
+
+def get_seeds_file(progress_callback: ProgressCallback | None = None,
+                   cancel_event: Event | None = None,
+                   ) -> str:
+    """returns the path of the seeds file of Configs.game_version,
+    the file and the seeds origins file are created with
+    make_seeds_file and make_seeds_origins_file if they don't exist
+    """
     logger = getLogger(__name__)
     if not os.path.exists(SEEDS_DIRECTORY_PATH):
         logger.warning('Seeds files directory not found.')
@@ -148,48 +529,148 @@ def get_seed(damage_values: Iterable[int],
         logger.warning('Seeds file not found.')
         make_seeds_file(
             seeds_file_path, POSSIBLE_XORED_DATETIMES[Configs.game_version],
-            FRAMES_FROM_BOOT[Configs.game_version]
+            FRAMES_FROM_BOOT[Configs.game_version],
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
             )
         logger.info('Done creating seeds file.')
 
-    damage_values = damage_values[:dvs_needed]
-    damage_rolls = damage_value_to_rolls(damage_values)
-    with open_cp1252(seeds_file_path) as file_object:
-        seeds = file_object.read().splitlines()
-    i = 0
-    needle = f'{damage_rolls[i]:02}'
-    for line in seeds:
-        if not line.startswith(needle):
-            continue
-        seed = int(line[-10:])
-        drs_check = get_damage_rolls(FFXRNGTracker(seed))[:dvs_needed]
-        if damage_rolls == drs_check:
-            logger.info(f'Found seed {seed} in seeds file'
-                        f' from DVs "{damage_values}"'
-                        )
-            break
-        i += 1
-        needle += f'{damage_rolls[i]:02}'
-    else:
-        logger.warning(
-            f'Failed to find seed in seeds file from DVs "{damage_values}".')
-        if Configs.game_version is GameVersion.HD or not continue_search:
-            raise SeedNotFoundError('Seed not found (seeds file exhausted)')
-        seed = search_seed(damage_rolls)
-        logger.info(f'Found seed {seed} from seed search'
-                    f' from DVs "{damage_values}"'
-                    )
-    return seed
+    seeds_origins_file_path = SEEDS_ORIGINS_FILE_PATHS[Configs.game_version]
+
+    if not os.path.exists(seeds_origins_file_path):
+        logger.warning('Seeds origins file not found.')
+        make_seeds_origins_file(
+            seeds_origins_file_path,
+            POSSIBLE_XORED_DATETIMES[Configs.game_version],
+            FRAMES_FROM_BOOT[Configs.game_version],
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+            )
+        logger.info('Done creating seeds origins file.')
+    return seeds_file_path
+
+
+def get_seed_origin(seed: int) -> tuple[int, int] | None:
+    """returns the first frame and datetime that produce seed,
+    returns None if the seeds origins file of Configs.game_version
+    doesn't exist or if it doesn't have the seed
+    """
+    file_path = SEEDS_ORIGINS_FILE_PATHS[Configs.game_version]
+    if not os.path.exists(file_path):
+        return None
+    with SeedsOrigins(file_path) as seeds_origins:
+        return seeds_origins.get_origin(seed)
+
+
+def get_seeds_from_encounters(
+        encounters: Iterable[ObservedEncounter],
+        progress_callback: ProgressCallback | None = None,
+        cancel_event: Event | None = None,
+        ) -> list[int]:
+    """encounters are all the encounters since the start of the game,
+    in order, with the formations and conditions that were seen
+
+    the seeds file and the encounters file are created if they
+    don't exist, progress_callback and cancel_event are passed to
+    make_seeds_file and make_encounters_file
+
+    returns the seeds in the seeds file whose encounters match,
+    only the first ENCOUNTERS_FILE_VALUES rng values of every seed
+    are checked
+
+    raises SeedNotFoundError if no formation or condition of the
+    encounters can be checked or if no seed matches
+    """
+    filters = get_encounters_filters(encounters)
+    if not filters:
+        raise SeedNotFoundError('Input encounter formations or conditions')
+    seeds_file_path = get_seeds_file(progress_callback, cancel_event)
+    encounters_file_path = ENCOUNTERS_FILE_PATHS[Configs.game_version]
+    if not os.path.exists(encounters_file_path):
+        getLogger(__name__).warning('Encounters file not found.')
+        make_encounters_file(
+            encounters_file_path, seeds_file_path,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+            )
+    with (SeedsIndex(seeds_file_path) as seeds_index,
+          EncountersIndex(encounters_file_path) as encounters_index):
+        indexes = encounters_index.filter(filters)
+        seeds = [seeds_index.get_seed(i) for i in indexes]
+    if not seeds:
+        raise SeedNotFoundError('No seed matches the encounters')
+    return seeds
 
 
-def search_seed(damage_rolls: Iterable[int]) -> int:
+def get_encounters_filters(encounters: Iterable[ObservedEncounter],
+                           ) -> list[EncounterFilter]:
+    """returns the filters of the rng values of rng index 1 that
+    match the formations and conditions of encounters, with the
+    ones that leave out the most seeds first
+
+    random encounters use 2 rng values (formation and condition),
+    other encounters only use 1 (condition), positions past
+    ENCOUNTERS_FILE_VALUES are left out
+    """
+    filters = []
+    position = 0
+    for encounter in encounters:
+        if encounter.name in ZONES:
+            zone = ZONES[encounter.name]
+            formations = zone.formations
+            if encounter.formation is not None:
+                residues = frozenset(i for i, f in enumerate(formations)
+                                     if f == encounter.formation)
+                filters.append(
+                    EncounterFilter(position, len(formations), residues))
+                formations = [encounter.formation]
+            position += 1
+        elif encounter.name in BOSSES:
+            formations = [BOSSES[encounter.name].formation]
+        elif encounter.name in SIMULATIONS:
+            formations = [SIMULATIONS[encounter.name].monsters]
+        else:
+            raise SeedNotFoundError(f'No encounter named "{encounter.name}"')
+        # the condition can't be checked on its own if it depends
+        # on a formation that wasn't seen
+        if (encounter.condition is not None
+                and len({f.forced_condition for f in formations}) == 1):
+            residues = frozenset(
+                r for r in range(256)
+                if formations[0].get_condition(r, encounter.initiative)
+                is encounter.condition)
+            filters.append(EncounterFilter(position, 256, residues))
+        position += 1
+    filters = [f for f in filters
+               if f.position < ENCOUNTERS_FILE_VALUES
+               and len(f.residues) < f.modulus]
+    filters.sort(key=lambda f: len(f.residues) / f.modulus)
+    return filters
+
+
+def search_seed(damage_rolls: Iterable[int],
+                processes: int | None = None,
+                progress_callback: ProgressCallback | None = None,
+                cancel_event: Event | None = None,
+                ) -> int:
     """damage_rolls needs to have 8 items
 
+    the frames range is split in shards that are searched on
+    processes worker processes (one per cpu if None, in this
+    process if 1), the search stops as soon as the seed with the
+    lowest frame is found
+
+    progress_callback is called with the number of shards done
+    and the total number of shards every time a shard is done,
+    the search can be stopped by setting cancel_event
+
     returns an integer between 0 and (2**32 - 1)
 
     raises SeedNotFoundError if Configs.game_version is set to HD,
     if there are less than 8 items in damage_rolls or if the seed
     is not found in the seed range
+
+    raises SeedSearchCancelledError if cancel_event is set
     """
     if Configs.game_version is GameVersion.HD:
         raise SeedNotFoundError('No seeds available past frame 0 on HD port.')
@@ -197,26 +678,133 @@ def search_seed(damage_rolls: Iterable[int]) -> int:
     if len(damage_rolls) < dvs_needed:
         raise SeedNotFoundError(
             f'Need at least {dvs_needed} damage values')
-    tracker = FFXRNGTracker(0)
+    damage_rolls = list(damage_rolls)
     starting_frame = FRAMES_FROM_BOOT[Configs.game_version]
     ending_frame = starting_frame + (60 * 60 * 10)
     date_times = POSSIBLE_XORED_DATETIMES[Configs.game_version]
     logger = getLogger(__name__)
     logger.info(f'Starting seed search in frames range'
                 f' {starting_frame}-{ending_frame}.')
-    seeds = set()
-    for frame in range(starting_frame, ending_frame):
-        if frame % 3600 == 0:
-            logger.debug(f'Checked up to frame {frame}.')
-        for date_time in date_times:
-            seed = datetime_to_seed(date_time, frame)
-            if seed in seeds:
-                continue
-            seeds.add(seed)
-            tracker.seed = seed
-            if damage_rolls == get_damage_rolls(tracker):
-                return seed
-    raise SeedNotFoundError(f'Seed not found (searched up to frame {frame})')
+    shards = [
+        (damage_rolls, date_times, frames)
+        for frames in split_frames(
+            starting_frame, ending_frame, SEARCH_SHARD_FRAMES)
+        ]
+    shards_seeds: dict[range, int | None] = {}
+    results = run_shards(
+        _search_seed_shard, shards, processes, cancel_event)
+    for done, ((_, _, frames), seed) in enumerate(results, 1):
+        logger.debug(f'Checked frames {frames.start}-{frames.stop}'
+                     f' ({done}/{len(shards)} shards).')
+        if progress_callback is not None:
+            progress_callback(done, len(shards))
+        shards_seeds[frames] = seed
+        # a seed can be returned only when
+        # all the shards before its own are done
+        for *_, shard_frames in shards:
+            if shard_frames not in shards_seeds:
+                break
+            if shards_seeds[shard_frames] is not None:
+                results.close()
+                return shards_seeds[shard_frames]
+    raise SeedNotFoundError(
+        f'Seed not found (searched up to frame {ending_frame - 1})')
+
+
+def _search_seed_shard(damage_rolls: list[int],
+                       date_times: list[int],
+                       frames: range,
+                       ) -> int | None:
+    """returns the first seed in the frames range whose damage rolls
+    start with damage_rolls or None if there isn't one or if the
+    search was cancelled
+    """
+    for frame in range(frames.start, frames.stop, SEARCH_BLOCK_FRAMES):
+        if shard_cancelled():
+            return None
+        block = range(frame, min(frame + SEARCH_BLOCK_FRAMES, frames.stop))
+        seeds = datetimes_to_seeds(date_times, block)
+        for seed in filter_seeds(seeds, damage_rolls):
+            return seed
+    return None
+
+
+def split_frames(starting_frame: int,
+                 ending_frame: int,
+                 shard_size: int,
+                 ) -> list[range]:
+    """splits the frames range in ranges of at most shard_size frames"""
+    return [range(frame, min(frame + shard_size, ending_frame))
+            for frame in range(starting_frame, ending_frame, shard_size)]
+
+
+def run_shards[T](function: Callable[..., T],
+                  shards: list[tuple],
+                  processes: int | None = None,
+                  cancel_event: Event | None = None,
+                  ) -> Iterator[tuple[tuple, T]]:
+    """calls function with the arguments of every shard on a pool
+    of processes worker processes (one per cpu if None, in this
+    process if 1), yields the shards and their results in order
+    of completion
+
+    closing the generator early cancels the shards that didn't
+    start yet and signals the running ones to stop
+
+    raises SeedSearchCancelledError when cancel_event is set
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(shards))
+    if processes <= 1:
+        for shard in shards:
+            _check_cancel_event(cancel_event)
+            yield shard, function(*shard)
+        return
+    workers_cancel_event = multiprocessing.Event()
+    with ProcessPoolExecutor(processes,
+                             initializer=_init_shard_worker,
+                             initargs=(workers_cancel_event,
+                                       Configs.get_configs()),
+                             ) as executor:
+        futures = {executor.submit(function, *s): s for s in shards}
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending,
+                                     timeout=SHARDS_POLL_INTERVAL,
+                                     return_when=FIRST_COMPLETED,
+                                     )
+                _check_cancel_event(cancel_event)
+                for future in done:
+                    yield futures[future], future.result()
+        finally:
+            workers_cancel_event.set()
+            executor.shutdown(cancel_futures=True)
+
+
+def _check_cancel_event(cancel_event: Event | None) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise SeedSearchCancelledError('Seed search cancelled')
+
+
+# set in the worker processes started by run_shards
+_shard_cancel_event = None
+
+
+def _init_shard_worker(cancel_event, configs: dict[str, object]) -> None:
+    global _shard_cancel_event
+    _shard_cancel_event = cancel_event
+    # worker processes that are spawned don't inherit the configs
+    for name, value in configs.items():
+        setattr(Configs, name, value)
+
+
+def shard_cancelled() -> bool:
+    """returns True when the functions called by run_shards
+    in worker processes should stop early
+    """
+    return _shard_cancel_event is not None and _shard_cancel_event.is_set()
 
 
 def datetime_to_seed(datetime: int, frames: int) -> int:
@@ -226,6 +814,126 @@ def datetime_to_seed(datetime: int, frames: int) -> int:
     return ((seed >> 0x10) + (seed << 0x10)) & 0xffffffff
 
 
+def datetimes_to_seeds(date_times: Iterable[int],
+                       frames: Iterable[int],
+                       ) -> list[int]:
+    """same as datetime_to_seed but calculates the seeds for every
+    combination of frames and date_times at once, ordered by frame
+    """
+    date_times = [(date_time + 1) & 0xffffffff for date_time in date_times]
+    frames = [(frame + 1) & 0xffffffff for frame in frames]
+    date_times_lanes = pack_lanes(date_times)
+    size = 8 * len(date_times)
+    # the lanes of every frame one after the other
+    lanes = int.from_bytes(
+        b''.join((date_times_lanes * frame).to_bytes(size, 'little')
+                 for frame in frames),
+        'little')
+    amount = len(frames) * len(date_times)
+    ones = get_lanes_ones(amount)
+    mask = ones * 0xffffffff
+    lanes = (lanes & mask) * 0x420C56D7 + ones * 0x2E0A
+    lanes = (lanes & mask) * 0x5D588B65 + ones * 0x3C35
+    lanes = rotate_rng_lanes(lanes & mask, ones)
+    return unpack_lanes(lanes, amount).tolist()
+
+
+def filter_seeds(seeds: list[int],
+                 damage_rolls: Iterable[int],
+                 ) -> list[int]:
+    """returns the seeds whose damage rolls start with damage_rolls
+
+    the first roll (Auron's first attack) is calculated for all
+    the seeds at once, only the seeds that match it get their
+    other damage rolls calculated
+    """
+    damage_rolls = list(damage_rolls)
+    if not damage_rolls:
+        return seeds
+    # the keys have the 8 damage rolls of get_damage_rolls
+    if len(damage_rolls) > 8:
+        return []
+    # auron's first damage roll comes from the 2nd and 3rd values
+    # of rng index 22
+    batch_tracker = BatchRNGTracker(seeds)
+    batch_tracker.advance_rng_lanes(22)
+    first_rolls = _get_damage_rolls_lanes(
+        batch_tracker.advance_rng_lanes(22),
+        batch_tracker.advance_rng_lanes(22),
+        22, get_lanes_ones(len(seeds)))
+    matches = bytes(r == damage_rolls[0] for r in range(256))
+    first_rolls = first_rolls.to_bytes(8 * len(seeds), 'little')[::8]
+    seeds = list(compress(seeds, first_rolls.translate(matches)))
+    keys_start = 0
+    for damage_roll in damage_rolls:
+        keys_start = keys_start << 6 | damage_roll
+    shift = 6 * (8 - len(damage_rolls))
+    keys = unpack_lanes(_get_damage_rolls_keys_lanes(seeds), len(seeds))
+    return [seed for seed, key in zip(seeds, keys)
+            if key >> shift == keys_start]
+
+
+def get_damage_rolls_keys(seeds: list[int]) -> list[bytes]:
+    """same as get_damage_rolls but calculates the damage rolls
+    of every seed at once and packs them in the format
+    used by the keys of the seeds file
+    """
+    keys = unpack_lanes(_get_damage_rolls_keys_lanes(seeds), len(seeds))
+    return [k.to_bytes(SEEDS_KEY_SIZE) for k in keys]
+
+
+def _get_damage_rolls_keys_lanes(seeds: list[int]) -> int:
+    """returns the keys of the seeds packed in lanes, every damage
+    roll takes 6 bits and the first one is in the highest bits
+    """
+    batch_tracker = BatchRNGTracker(seeds)
+    ones = get_lanes_ones(len(seeds))
+    tidus_rolls = [batch_tracker.advance_rng_lanes(20) for _ in range(7)]
+    auron_rolls = [batch_tracker.advance_rng_lanes(22) for _ in range(36)]
+    keys = 0
+    # first encounter
+    # get 3 damage rolls from auron and tidus
+    for i in (1, 3, 5):
+        keys = keys << 6 | _get_damage_rolls_lanes(
+            auron_rolls[i], auron_rolls[i + 1], 22, ones)
+        tidus_damage_rolls = _get_damage_rolls_lanes(
+            tidus_rolls[i], tidus_rolls[i + 1], 23, ones)
+        keys = keys << 6 | _translate_lanes(
+            tidus_damage_rolls, len(seeds), _TIDUS_DAMAGE_ROLLS_TABLE)
+    # second encounter after dragon fang
+    # get 2 damage rolls from auron
+    for i in (32, 34):
+        keys = keys << 6 | _get_damage_rolls_lanes(
+            auron_rolls[i], auron_rolls[i + 1], 13, ones)
+    return keys
+
+
+def _get_damage_rolls_lanes(damage_lanes: int,
+                            crit_lanes: int,
+                            crit_chance: int,
+                            ones: int,
+                            ) -> int:
+    """returns (damage & 31) + 32 * (crit % 101 < crit_chance)
+    for every lane
+    """
+    # crit // 101 is (crit * ceil(2**38 / 101)) >> 38
+    # for every crit value below 2**31
+    quotients = crit_lanes * 2721563436 >> 38 & ones * 0x3ffffff
+    remainders = crit_lanes - quotients * 101
+    # bit 7 is set when the remainder is at least crit_chance
+    crits = (remainders + ones * (128 - crit_chance) >> 7 & ones) ^ ones
+    return damage_lanes & ones * 31 | crits << 5
+
+
+def _translate_lanes(lanes: int, amount: int, table: bytes) -> int:
+    """maps the lowest byte of every lane with table
+    like bytes.translate, the other bytes are set to 0
+    """
+    data = bytearray(8 * amount)
+    data[::8] = lanes.to_bytes(8 * amount, 'little')[::8].translate(table)
+    return int.from_bytes(data, 'little')
+
+
 def get_damage_rolls(tracker: FFXRNGTracker) -> list[int]:
     """uses the tracker to calculate the 8 damage rolls
     used to retrieve a seed
@@ -261,9 +969,25 @@ def make_seeds_file(file_path: str,
                     date_times: list[int],
                     ending_frame: int,
                     starting_frame: int = 0,
+                    processes: int | None = None,
+                    progress_callback: ProgressCallback | None = None,
+                    cancel_event: Event | None = None,
                     ) -> None:
     """calculates damage rolls for every seed possible in a range given
     a frames range and a list of datetimes and writes them to file_path
+    in the format read by SeedsIndex
+
+    the records are calculated and sorted in chunks of frames that are
+    written to a partial directory and then merged into file_path, so
+    the memory used doesn't depend on the size of the frames range, the
+    chunks are calculated on processes worker processes (one per cpu
+    if None, in this process if 1), if the calculation is stopped
+    the next call resumes it from the chunks already done
+
+    progress_callback is called with the number of chunks done
+    and the total number of chunks every time a chunk is done,
+    setting cancel_event stops the calculation and raises
+    SeedSearchCancelledError
 
     returns immediately if file_path already exists
     """
@@ -274,50 +998,282 @@ def make_seeds_file(file_path: str,
     logger.info(f'Calculating seeds in frame range'
                 f' {starting_frame}-{ending_frame}'
                 f' for game version {Configs.game_version}.')
-    seeds = set()
-    tracker = FFXRNGTracker(0)
-    root_node: Node = {}
-    for frame in range(starting_frame, ending_frame):
-        if frame % 3600 == 0 and frame != 0:
-            logger.debug(f'Calculated up to frame {frame}.')
-        for date_time in date_times:
-            seed = datetime_to_seed(date_time, frame)
-            if seed in seeds:
-                continue
-            seeds.add(seed)
-            tracker.seed = seed
-            *indexes, last_index = get_damage_rolls(tracker)
-            node = root_node
-            for index in indexes:
-                node = node.setdefault(index, {})
-            node[last_index] = seed
-    data = (pprint.pformat(prune(root_node), width=1)
-            .replace('}', '')
-            .replace(',', '')
-            .replace(':', '')
-            .replace('{', '')
-            .replace(' \'', '')
-            .replace('\'', '')
-            .replace('       ', '  ')
-            )
-    lines = data.splitlines()
-    for index, line in enumerate(lines):
-        count = line.count(' ')
-        if count == 0:
-            continue
-        lines[index] = lines[index - 1][:count] + line[count:]
-    data = '\n'.join(lines)
-    with open_cp1252(file_path, 'w') as file:
-        file.write(data)
+    _make_frames_file(
+        file_path, _write_seeds_chunk, SEEDS_FILE_RECORD.size,
+        SEEDS_FILE_RECORD.size, date_times, starting_frame, ending_frame,
+        processes, progress_callback, cancel_event)
     logger.info(f'Done calculating seeds in frame range'
                 f' {starting_frame}-{ending_frame}.')
 
 
+def make_seeds_origins_file(file_path: str,
+                            date_times: list[int],
+                            ending_frame: int,
+                            starting_frame: int = 0,
+                            processes: int | None = None,
+                            progress_callback: ProgressCallback | None = None,
+                            cancel_event: Event | None = None,
+                            ) -> None:
+    """same as make_seeds_file but writes the first frame and
+    datetime that produce every seed in the format read by SeedsOrigins
+
+    returns immediately if file_path already exists
+    """
+    logger = getLogger(__name__)
+    if os.path.exists(file_path):
+        logger.warning(
+            f'Seeds origins file named "{file_path}" already exists.')
+        return
+    logger.info(f'Calculating seeds origins in frame range'
+                f' {starting_frame}-{ending_frame}'
+                f' for game version {Configs.game_version}.')
+    _make_frames_file(
+        file_path, _write_seeds_origins_chunk, SEEDS_ORIGINS_RECORD.size,
+        SEEDS_ORIGINS_KEY_SIZE, date_times, starting_frame, ending_frame,
+        processes, progress_callback, cancel_event)
+    logger.info(f'Done calculating seeds origins in frame range'
+                f' {starting_frame}-{ending_frame}.')
+
+
+def _make_frames_file(file_path: str,
+                      write_chunk: Callable[[str, list[int], range], None],
+                      record_size: int,
+                      key_size: int,
+                      date_times: list[int],
+                      starting_frame: int,
+                      ending_frame: int,
+                      processes: int | None,
+                      progress_callback: ProgressCallback | None,
+                      cancel_event: Event | None,
+                      ) -> None:
+    """calls write_chunk on worker processes to write the sorted
+    records of chunks of frames to files in a partial directory
+    and merges them into file_path, keeping only the first record
+    of every key
+
+    the chunks that are done are saved in the manifest of the
+    partial directory, if the calculation is stopped (by
+    cancel_event or by closing the program) the next call with
+    the same arguments only calculates the chunks that are missing,
+    the partial directory is removed once file_path is written
+    """
+    logger = getLogger(__name__)
+    partial_directory = file_path + '.partial'
+    manifest_path = os.path.join(partial_directory, 'manifest.json')
+    manifest = {
+        'date_times': date_times,
+        'starting_frame': starting_frame,
+        'ending_frame': ending_frame,
+        'chunk_frames': SEEDS_FILE_CHUNK_FRAMES,
+        'done': [],
+        }
+    try:
+        with open(manifest_path) as file_object:
+            saved_manifest = json.load(file_object)
+    except (OSError, ValueError):
+        saved_manifest = None
+    if (isinstance(saved_manifest, dict)
+            and {**saved_manifest, 'done': []} == manifest):
+        manifest['done'] = saved_manifest['done']
+        logger.info(f'Resuming calculation of "{file_path}"'
+                    f' ({len(manifest['done'])} chunks already done).')
+    else:
+        shutil.rmtree(partial_directory, ignore_errors=True)
+        os.makedirs(partial_directory)
+
+    chunks = [
+        (os.path.join(partial_directory, f'{frames.start}.bin'),
+         date_times, frames)
+        for frames in split_frames(
+            starting_frame, ending_frame, SEEDS_FILE_CHUNK_FRAMES)
+        ]
+    shards = [c for c in chunks if c[2].start not in manifest['done']]
+    done = len(chunks) - len(shards)
+    results = run_shards(write_chunk, shards, processes, cancel_event)
+    for (_, _, frames), _ in results:
+        done += 1
+        manifest['done'].append(frames.start)
+        _write_manifest(manifest_path, manifest)
+        logger.debug(f'Calculated frames {frames.start}-{frames.stop}'
+                     f' ({done}/{len(chunks)} chunks).')
+        if progress_callback is not None:
+            progress_callback(done, len(chunks))
+    merged_file_path = os.path.join(partial_directory, 'merged.bin')
+    _merge_seeds_chunks([path for path, _, _ in chunks], merged_file_path,
+                        record_size, key_size)
+    os.replace(merged_file_path, file_path)
+    shutil.rmtree(partial_directory, ignore_errors=True)
+
+
+def _write_manifest(file_path: str, manifest: dict) -> None:
+    """writes the manifest to a temporary file first, so that
+    file_path always has a complete manifest
+    """
+    temp_file_path = file_path + '.tmp'
+    with open(temp_file_path, 'w') as file_object:
+        json.dump(manifest, file_object)
+    os.replace(temp_file_path, file_path)
+
+
+def make_encounters_file(file_path: str,
+                         seeds_file_path: str,
+                         processes: int | None = None,
+                         progress_callback: ProgressCallback | None = None,
+                         cancel_event: Event | None = None,
+                         ) -> None:
+    """calculates the first ENCOUNTERS_FILE_VALUES rng values of
+    rng index 1 of every seed in the seeds file and writes them
+    to file_path in the format read by EncountersIndex
+
+    the values are calculated in chunks of seeds that are written
+    to temporary files on processes worker processes (one per cpu
+    if None, in this process if 1) and then joined into file_path
+
+    progress_callback is called with the number of chunks done
+    and the total number of chunks every time a chunk is done,
+    setting cancel_event stops the calculation and raises
+    SeedSearchCancelledError
+
+    returns immediately if file_path already exists
+    """
+    logger = getLogger(__name__)
+    if os.path.exists(file_path):
+        logger.warning(f'Encounters file named "{file_path}" already exists.')
+        return
+    with SeedsIndex(seeds_file_path) as seeds_index:
+        n_of_seeds = len(seeds_index)
+    logger.info(f'Calculating encounters of {n_of_seeds} seeds'
+                f' for game version {Configs.game_version}.')
+    directory = os.path.dirname(file_path) or '.'
+    with tempfile.TemporaryDirectory(dir=directory) as temp_directory:
+        shards = [
+            (os.path.join(temp_directory, f'{start}.bin'),
+             seeds_file_path,
+             range(start, min(start + ENCOUNTERS_FILE_CHUNK_SEEDS,
+                              n_of_seeds)))
+            for start in range(0, n_of_seeds, ENCOUNTERS_FILE_CHUNK_SEEDS)
+            ]
+        results = run_shards(
+            _write_encounters_chunk, shards, processes, cancel_event)
+        for done, ((_, _, indexes), _) in enumerate(results, 1):
+            logger.debug(f'Calculated seeds {indexes.start}-{indexes.stop}'
+                         f' ({done}/{len(shards)} chunks).')
+            if progress_callback is not None:
+                progress_callback(done, len(shards))
+        temp_file_path = os.path.join(temp_directory, 'encounters.bin')
+        with open(temp_file_path, 'wb') as file_object:
+            for position in range(ENCOUNTERS_FILE_VALUES):
+                for chunk_file_path, _, indexes in shards:
+                    column_size = len(indexes) * 4
+                    with open(chunk_file_path, 'rb') as chunk_file:
+                        chunk_file.seek(position * column_size)
+                        file_object.write(chunk_file.read(column_size))
+        os.replace(temp_file_path, file_path)
+    logger.info('Done calculating encounters.')
+
+
+def _write_encounters_chunk(file_path: str,
+                            seeds_file_path: str,
+                            indexes: range,
+                            ) -> None:
+    """writes the rng values of rng index 1 of the seeds
+    at indexes in the seeds file, one column per position
+    """
+    if shard_cancelled():
+        return
+    with SeedsIndex(seeds_file_path) as seeds_index:
+        seeds = [seeds_index.get_seed(i) for i in indexes]
+    batch_tracker = BatchRNGTracker(seeds)
+    with open(file_path, 'wb') as file_object:
+        for _ in range(ENCOUNTERS_FILE_VALUES):
+            file_object.write(batch_tracker.advance_rng(1).tobytes())
+
+
+def _write_seeds_chunk(file_path: str,
+                       date_times: list[int],
+                       frames: range,
+                       ) -> None:
+    """writes the sorted records of the seeds in the frames range"""
+    records = set()
+    for frame in range(frames.start, frames.stop, SEARCH_BLOCK_FRAMES):
+        if shard_cancelled():
+            return
+        block = range(frame, min(frame + SEARCH_BLOCK_FRAMES, frames.stop))
+        seeds = datetimes_to_seeds(date_times, block)
+        keys = get_damage_rolls_keys(seeds)
+        records.update(SEEDS_FILE_RECORD.pack(k, s)
+                       for k, s in zip(keys, seeds))
+    with open(file_path, 'wb') as file_object:
+        file_object.write(b''.join(sorted(records)))
+
+
+def _write_seeds_origins_chunk(file_path: str,
+                               date_times: list[int],
+                               frames: range,
+                               ) -> None:
+    """writes the sorted origins records of the seeds in the frames
+    range, only the first frame and datetime of every seed are kept
+    """
+    origins: dict[int, tuple[int, int]] = {}
+    for frame in range(frames.start, frames.stop, SEARCH_BLOCK_FRAMES):
+        if shard_cancelled():
+            return
+        block = range(frame, min(frame + SEARCH_BLOCK_FRAMES, frames.stop))
+        seeds = datetimes_to_seeds(date_times, block)
+        for seed, origin in zip(seeds, product(block, date_times)):
+            origins.setdefault(seed, origin)
+    with open(file_path, 'wb') as file_object:
+        file_object.write(b''.join(SEEDS_ORIGINS_RECORD.pack(s, f, d)
+                                   for s, (f, d) in sorted(origins.items())))
+
+
+def _read_seeds_records(file_path: str,
+                        record_size: int,
+                        ) -> Iterator[bytes]:
+    """yields the records in a seeds file one at a time"""
+    with open(file_path, 'rb') as file_object:
+        while data := file_object.read(record_size * 4096):
+            for offset in range(0, len(data), record_size):
+                yield data[offset:offset + record_size]
+
+
+def _merge_seeds_chunks(chunk_file_paths: list[str],
+                        file_path: str,
+                        record_size: int,
+                        key_size: int,
+                        ) -> None:
+    """merges sorted seeds files into one, only the first record
+    of the records whose first key_size bytes are the same is kept
+    """
+    records = heapq.merge(*[_read_seeds_records(p, record_size)
+                            for p in chunk_file_paths])
+    buffer = []
+    last_key = None
+    with open(file_path, 'wb') as file_object:
+        for record in records:
+            key = record[:key_size]
+            if key == last_key:
+                continue
+            last_key = key
+            buffer.append(record)
+            if len(buffer) >= 4096:
+                file_object.write(b''.join(buffer))
+                buffer.clear()
+        file_object.write(b''.join(buffer))
+
+
 _TIDUS_DAMAGE_VALUES = (
     125, 126, 126, 127, 127, 128, 128, 129, 129, 130, 130,
     131, 131, 132, 132, 133, 134, 134, 135, 135, 136, 136,
     137, 137, 138, 138, 139, 139, 140, 140, 141, 141,
     )
+# tidus damage rolls that give the same damage value are
+# indistinguishable, use the lowest one
+_TIDUS_DAMAGE_ROLLS = tuple(
+    _TIDUS_DAMAGE_VALUES.index(v) for v in _TIDUS_DAMAGE_VALUES)
+# _TIDUS_DAMAGE_ROLLS with the crit bit, as a bytes.translate table
+_TIDUS_DAMAGE_ROLLS_TABLE = bytes(
+    _TIDUS_DAMAGE_ROLLS[r & 31] | r & 32 for r in range(256))
 _AURON_DAMAGE_VALUES = (
     260, 261, 262, 263, 264, 266, 267, 268, 269, 270, 271,
     272, 273, 274, 275, 276, 278, 279, 280, 281, 282, 283,
@@ -341,10 +1297,42 @@ DAMAGE_VALUES_NEEDED = {
     GameVersion.PS2INT: 8,
     GameVersion.HD: 3,
 }
+# number of frames whose seeds are checked at once by search_seed
+SEARCH_BLOCK_FRAMES = 200
+# number of frames searched by each worker process task of search_seed
+SEARCH_SHARD_FRAMES = 1800
+# seconds between checks of the cancel event while waiting for shards
+SHARDS_POLL_INTERVAL = 0.1
+# number of frames whose seeds are sorted in memory at once
+# by each worker process task of make_seeds_file
+SEEDS_FILE_CHUNK_FRAMES = 1800
+# size in bytes of the damage rolls key of a seeds file record
+SEEDS_KEY_SIZE = 6
+SEEDS_FILE_RECORD = struct.Struct(f'>{SEEDS_KEY_SIZE}sI')
 SEEDS_DIRECTORY_PATH = 'ffx_rng_tracker_seeds'
 SEEDS_FILE_PATHS = {
-    GameVersion.PS2JP: SEEDS_DIRECTORY_PATH + '/ps2_seeds.dat',
-    GameVersion.PS2NA: SEEDS_DIRECTORY_PATH + '/ps2_seeds.dat',
-    GameVersion.PS2INT: SEEDS_DIRECTORY_PATH + '/ps2_seeds.dat',
-    GameVersion.HD: SEEDS_DIRECTORY_PATH + '/seeds.dat',
+    GameVersion.PS2JP: SEEDS_DIRECTORY_PATH + '/ps2_seeds.bin',
+    GameVersion.PS2NA: SEEDS_DIRECTORY_PATH + '/ps2_seeds.bin',
+    GameVersion.PS2INT: SEEDS_DIRECTORY_PATH + '/ps2_seeds.bin',
+    GameVersion.HD: SEEDS_DIRECTORY_PATH + '/seeds.bin',
+}
+SEEDS_ORIGINS_RECORD = struct.Struct('>IIB')
+# size in bytes of the seed of a seeds origins file record
+SEEDS_ORIGINS_KEY_SIZE = 4
+SEEDS_ORIGINS_FILE_PATHS = {
+    GameVersion.PS2JP: SEEDS_DIRECTORY_PATH + '/ps2_seeds_origins.bin',
+    GameVersion.PS2NA: SEEDS_DIRECTORY_PATH + '/ps2_seeds_origins.bin',
+    GameVersion.PS2INT: SEEDS_DIRECTORY_PATH + '/ps2_seeds_origins.bin',
+    GameVersion.HD: SEEDS_DIRECTORY_PATH + '/seeds_origins.bin',
+}
+# number of rng values of rng index 1 of every seed in encounters files
+ENCOUNTERS_FILE_VALUES = 16
+# number of seeds calculated by each worker process task
+# of make_encounters_file
+ENCOUNTERS_FILE_CHUNK_SEEDS = 65536
+ENCOUNTERS_FILE_PATHS = {
+    GameVersion.PS2JP: SEEDS_DIRECTORY_PATH + '/ps2_encounters.bin',
+    GameVersion.PS2NA: SEEDS_DIRECTORY_PATH + '/ps2_encounters.bin',
+    GameVersion.PS2INT: SEEDS_DIRECTORY_PATH + '/ps2_encounters.bin',
+    GameVersion.HD: SEEDS_DIRECTORY_PATH + '/encounters.bin',
 }
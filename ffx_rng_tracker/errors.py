@@ -8,3 +8,7 @@ class InvalidDamageValueError(Exception):
 
 class EventParsingError(Exception):
     """Raised when a string cannot be parsed to instantiate an Event object."""
+
+
+class SeedSearchCancelledError(SeedNotFoundError):
+    """Raised when a seed search is cancelled before finding a seed."""
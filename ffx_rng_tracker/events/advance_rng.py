@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -12,5 +12,6 @@ class AdvanceRNG(Event):
         for _ in range(self.number_of_times):
             self._advance_rng(self.rng_index)
 
-    def __str__(self) -> str:
-        return f'Advanced rng{self.rng_index} {self.number_of_times} times'
+    def to_rows(self) -> list[EventRow]:
+        name = f'Advanced rng{self.rng_index} {self.number_of_times} times'
+        return [EventRow(name)]
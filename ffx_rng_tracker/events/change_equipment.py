@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from ..data.constants import EquipmentType
 from ..data.equipment import Equipment
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -12,15 +12,15 @@ class ChangeEquipment(Event):
     def __post_init__(self) -> None:
         self._change_equipment()
 
-    def __str__(self) -> str:
-        string = (f'Equipment: {self.equipment.owner} | '
-                  f'{self.equipment.type_} | '
-                  f'{self.old_equipment.name} '
-                  f'[{self.old_equipment.abilities_string}] -> '
-                  f'{self.equipment.name} '
-                  f'[{self.equipment.abilities_string}]'
-                  )
-        return string
+    def to_rows(self) -> list[EventRow]:
+        columns = (f' {self.equipment.owner} ',
+                   f' {self.equipment.type_} ',
+                   f' {self.old_equipment.name} '
+                   f'[{self.old_equipment.abilities_string}] -> '
+                   f'{self.equipment.name} '
+                   f'[{self.equipment.abilities_string}]',
+                   )
+        return [EventRow('Equipment', columns)]
 
     def _change_equipment(self) -> None:
         actor = self.gamestate.characters[self.equipment.owner]
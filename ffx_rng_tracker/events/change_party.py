@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from ..data.constants import Character
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -13,5 +13,6 @@ class ChangeParty(Event):
         self.gamestate.party.clear()
         self.gamestate.party.extend(self.party)
 
-    def __str__(self) -> str:
-        return f'Party: {', '.join(self.old_party)} -> {', '.join(self.party)}'
+    def to_rows(self) -> list[EventRow]:
+        column = f' {', '.join(self.old_party)} -> {', '.join(self.party)}'
+        return [EventRow('Party', (column, ))]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from ..data.actor import Actor
 from ..data.constants import Character, Stat
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -18,10 +18,12 @@ class ChangeStat(Event):
                 and self.target.character is Character.YUNA):
             self.gamestate.calculate_aeon_stats()
 
-    def __str__(self) -> str:
-        string = (f'Stat: {self.target} | {self.stat} | '
-                  f'{self.old_stat_value} -> {self.stat_value}')
-        return string
+    def to_rows(self) -> list[EventRow]:
+        columns = (f' {self.target} ',
+                   f' {self.stat} ',
+                   f' {self.old_stat_value} -> {self.stat_value}',
+                   )
+        return [EventRow('Stat', columns)]
 
     def _set_stat(self) -> int:
         self.target.set_stat(self.stat, self.stat_value)
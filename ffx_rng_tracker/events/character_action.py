@@ -11,7 +11,7 @@ from ..data.constants import (ELEMENTAL_AFFINITY_MODIFIERS, HIT_CHANCE_TABLE,
                               DamageType, Element, ElementalAffinity,
                               HitChanceFormula, Stat, Status, TargetType)
 from ..data.statuses import NO_RNG_STATUSES, NUL_STATUSES
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -76,7 +76,7 @@ class CharacterAction(Event):
             target.last_attacker = self.user
         self.user.last_targets = self.targets
 
-    def __str__(self) -> str:
+    def to_rows(self) -> list[EventRow]:
         actions = []
         for target, result in zip(self.targets, self.results):
             if not result.hit:
@@ -110,12 +110,15 @@ class CharacterAction(Event):
             if not action:
                 action = ' Does nothing'
             actions.append(f'{target} ->{action}')
-        string = f'{self.user} -> {self.action} [{self.ctb}]: '
-        if actions:
-            string += f'\n{' ' * len(string)}'.join(actions)
-        else:
-            string += 'Does Nothing'
-        return string
+        name = f'{self.user} -> {self.action} [{self.ctb}]'
+        if not actions:
+            return [EventRow(name, (' Does Nothing', ))]
+        rows = [EventRow(name, (f' {actions[0]}', ))]
+        # the other targets are aligned under the first one
+        indentation = ' ' * (len(name) + 2)
+        for action in actions[1:]:
+            rows.append(EventRow(f'{indentation}{action}'))
+        return rows
 
     @property
     def damage_rng_index(self) -> int:
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from .main import Event
+from .main import Event, EventRow, get_rows
 
 
 @dataclass
@@ -9,3 +9,6 @@ class Comment(Event):
 
     def __str__(self) -> str:
         return self.text
+
+    def to_rows(self) -> list[EventRow]:
+        return get_rows(self.text)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from ..data.constants import Character
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -13,8 +13,8 @@ class Death(Event):
             self._advance_rng(10)
         self._update_compatibility()
 
-    def __str__(self) -> str:
-        return f'Character death: {self.character}'
+    def to_rows(self) -> list[EventRow]:
+        return [EventRow('Character death', (f' {self.character}', ))]
 
     def _update_compatibility(self) -> None:
         if self.character is Character.YOJIMBO:
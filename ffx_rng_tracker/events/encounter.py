@@ -1,5 +1,5 @@
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from ..data.actor import MonsterActor
 from ..data.constants import (ICV_VARIANCE, Autoability, Character,
@@ -7,7 +7,15 @@ from ..data.constants import (ICV_VARIANCE, Autoability, Character,
 from ..data.encounter_formations import (BOSSES, FORMATIONS, SIMULATIONS,
                                          ZONES, Formation)
 from ..ui_functions import ctb_sorter
-from .main import Event
+from .main import Event, EventRow
+
+
+@dataclass(frozen=True)
+class EncounterRow(EventRow):
+    """Row of an encounter event, the formations and their
+    conditions are in the columns after the zone name.
+    """
+    formations: tuple[tuple[Formation, EncounterCondition], ...] = ()
 
 
 @dataclass
@@ -27,12 +35,18 @@ class Encounter(Event):
         self.icvs_string = self._get_icvs_string()
         self.gamestate.normalize_ctbs(self.gamestate.get_min_ctb())
 
-    def __str__(self) -> str:
-        string = (f'Encounter: {self.index:>3} | '
-                  f'{FORMATIONS[self.name].name} | '
-                  f'{self.formation} {self.condition} | '
-                  f'{self.icvs_string}')
-        return string
+    def to_rows(self) -> list[EncounterRow]:
+        columns = (f' {self.index:>3} ',
+                   f' {FORMATIONS[self.name].name} ',
+                   f' {self.formation} {self.condition} ',
+                   f' {self.icvs_string}',
+                   )
+        return [EncounterRow('Encounter', columns, self.get_formations())]
+
+    def get_formations(self,
+                       ) -> tuple[tuple[Formation, EncounterCondition], ...]:
+        """Returns the formation of the encounter and its condition."""
+        return (self.formation, self.condition),
 
     def _get_index(self) -> int:
         self.gamestate.encounters_count += 1
@@ -55,19 +69,11 @@ class Encounter(Event):
 
     def _get_condition(self) -> EncounterCondition:
         condition_rng = self._advance_rng(1) & 255
-        if self.formation.forced_condition is not None:
-            return self.formation.forced_condition
-        for character in self.gamestate.party:
-            actor = self.gamestate.characters[character]
-            if Autoability.INITIATIVE in actor.autoabilities:
-                condition_rng -= 33
-                break
-        if condition_rng < 32:
-            return EncounterCondition.PREEMPTIVE
-        elif condition_rng < 255 - 32:
-            return EncounterCondition.NORMAL
-        else:
-            return EncounterCondition.AMBUSH
+        initiative = any(
+            Autoability.INITIATIVE
+            in self.gamestate.characters[c].autoabilities
+            for c in self.gamestate.party)
+        return self.formation.get_condition(condition_rng, initiative)
 
     def _duplicate_monsters_rng_advances(self) -> None:
         monsters = self.formation.monsters
@@ -130,8 +136,9 @@ class Encounter(Event):
 @dataclass
 class SimulatedEncounter(Encounter):
 
-    def __str__(self) -> str:
-        return 'Simulated ' + super().__str__()
+    def to_rows(self) -> list[EncounterRow]:
+        row, = super().to_rows()
+        return [replace(row, name='Simulated Encounter')]
 
     def _get_index(self) -> int:
         # simulated encounter don't increment the game's
@@ -151,16 +158,15 @@ class RandomEncounter(Encounter):
         self.random_index = self._get_random_index()
         self.zone_index = self._get_zone_index()
 
-    def __str__(self) -> str:
-        string = 'Random ' + super().__str__()
-        parts = string.split('|')
-        parts[0] += f'{self.random_index:>3} {self.zone_index:>3} '
-        return '|'.join(parts)
+    def to_rows(self) -> list[EncounterRow]:
+        row, = super().to_rows()
+        index, *columns = row.columns
+        index += f'{self.random_index:>3} {self.zone_index:>3} '
+        return [replace(row, name='Random Encounter',
+                        columns=(index, *columns))]
 
     def _get_formation(self) -> Formation:
-        rng_value = self._advance_rng(1)
-        formation_index = rng_value % len(self.zone.formations)
-        return self.zone.formations[formation_index]
+        return self.zone.get_formation(self._advance_rng(1))
 
     def _get_random_index(self) -> int:
         self.gamestate.random_encounters_count += 1
@@ -179,35 +185,38 @@ class MultizoneRandomEncounter(Event):
     def __post_init__(self) -> None:
         self.encounters = self._get_encounters()
 
-    def __str__(self) -> str:
-        string = ''
-        zones_names = []
-        formations = []
-        for count, enc in enumerate(self.encounters, 1):
-            if count == 1:
-                string += str(enc).split('|')[0]
-            zone_name = ZONES[enc.name].name
-            zones_names.append(zone_name)
-            formation = f'{enc.formation} {enc.condition}'
-            formations.append(formation)
-        string += (f' | {'/'.join(zones_names)} | '
-                   f'{' | '.join(formations)} | '
-                   f'{enc.icvs_string}')
-        return string
+    def to_rows(self) -> list[EncounterRow]:
+        first_row, = self.encounters[0].to_rows()
+        zones_names = [enc.zone.name for enc in self.encounters]
+        formations = self.get_formations()
+        columns = (f'{first_row.columns[0]} ',
+                   f' {'/'.join(zones_names)} ',
+                   *[f' {f} {c} ' for f, c in formations],
+                   f' {self.encounters[-1].icvs_string}',
+                   )
+        return [replace(first_row, columns=columns, formations=formations)]
+
+    def get_formations(self,
+                       ) -> tuple[tuple[Formation, EncounterCondition], ...]:
+        """Returns the formations of the encounters of every zone
+        and their conditions.
+        """
+        return tuple((enc.formation, enc.condition)
+                     for enc in self.encounters)
 
     def _get_encounters(self) -> list[RandomEncounter]:
         encounters = []
-        tracker = self.gamestate._rng_tracker
-        saved_rng_positions = tracker._rng_current_positions.copy()
+        snapshot = self.gamestate.snapshot()
         for count, zone in enumerate(self.zones, 1):
+            if count > 1:
+                # only one of the encounters will happen, but
+                # every zone keeps count of its own encounters
+                zone_counts = self.gamestate.zone_encounters_counts.copy()
+                self.gamestate.restore(snapshot)
+                self.gamestate.zone_encounters_counts.update(zone_counts)
             encounter = RandomEncounter(
                 gamestate=self.gamestate,
                 name=zone,
             )
             encounters.append(encounter)
-            if count < len(self.zones):
-                self.gamestate.encounters_count -= 1
-                self.gamestate.random_encounters_count -= 1
-                tracker._rng_current_positions.clear()
-                tracker._rng_current_positions.extend(saved_rng_positions)
         return encounters
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from ..data.encounter_formations import Zone
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -16,12 +16,13 @@ class EncounterCheck(Event):
         else:
             self.gamestate.live_distance = self.distance
 
-    def __str__(self) -> str:
-        string = f'Encounter check: {self.zone} | {self.distance} units | '
-        if not self.encounter:
-            string += 'No '
-        string += 'Encounter'
-        return string
+    def to_rows(self) -> list[EventRow]:
+        if self.encounter:
+            encounter = ' Encounter'
+        else:
+            encounter = ' No Encounter'
+        columns = (f' {self.zone} ', f' {self.distance} units ', encounter)
+        return [EventRow('Encounter check', columns)]
 
     def check_encounter(self) -> tuple[bool, int]:
         max_steps = (self.gamestate.live_distance + self.max_distance) // 10
@@ -49,7 +50,7 @@ class EncounterChecks(Event):
     def __post_init__(self) -> None:
         self.checks = self._perform_checks()
 
-    def __str__(self) -> str:
+    def to_rows(self) -> list[EventRow]:
         n_of_encs = sum(c.encounter for c in self.checks)
         total_distance = 0
         encounters = []
@@ -61,13 +62,12 @@ class EncounterChecks(Event):
             distance = 0
         else:
             distance = check.distance
-        string = (f'Encounter checks: {self.zone} '
-                  f'({self.zone.grace_period}) | '
-                  f'{n_of_encs} Encounters | '
-                  f'{', '.join(encounters)} | '
-                  f'{distance // 10} steps before end of the zone'
-                  )
-        return string
+        columns = (f' {self.zone} ({self.zone.grace_period}) ',
+                   f' {n_of_encs} Encounters ',
+                   f' {', '.join(encounters)} ',
+                   f' {distance // 10} steps before end of the zone',
+                   )
+        return [EventRow('Encounter checks', columns)]
 
     def _perform_checks(self) -> list[EncounterCheck]:
         distance = self.max_distance
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from ..data.constants import Character, Status
 from ..ui_functions import ctb_sorter
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -14,7 +14,7 @@ class EndEncounter(Event):
         self.monsters_hps = self._get_monsters_hps()
         self.gamestate.process_end_of_encounter()
 
-    def __str__(self) -> str:
+    def to_rows(self) -> list[EventRow]:
         hps = ' '.join([f'{c[:2]}[{hp}]' for c, hp in self.hps.items()])
         if not hps:
             hps = 'Characters at full HP'
@@ -22,11 +22,11 @@ class EndEncounter(Event):
                                  for m, hp in self.monsters_hps.items()])
         if not monsters_hps:
             monsters_hps = 'Monsters at full HP'
-        string = (f'End: CTBs: {self.ctbs_string}\n'
-                  f'     Characters HPs: {hps}\n'
-                  f'     Monsters HPs: {monsters_hps}'
-                  )
-        return string
+        rows = [EventRow('End', (f' CTBs: {self.ctbs_string}', )),
+                EventRow('     Characters HPs', (f' {hps}', )),
+                EventRow('     Monsters HPs', (f' {monsters_hps}', )),
+                ]
+        return rows
 
     def _get_ctbs_string(self) -> str:
         characters = []
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from ..data.actor import CharacterActor
 from ..data.constants import Status
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -13,13 +13,13 @@ class Escape(Event):
         self.escape = self._get_escape()
         self.ctb = self._get_ctb()
 
-    def __str__(self) -> str:
-        string = f'{self.character} -> Escape [{self.ctb}]: '
+    def to_rows(self) -> list[EventRow]:
+        name = f'{self.character} -> Escape [{self.ctb}]'
         if self.escape:
-            string += 'Succeeded'
+            result = ' Succeeded'
         else:
-            string += 'Failed'
-        return string
+            result = ' Failed'
+        return [EventRow(name, (result, ))]
 
     def _get_escape(self) -> bool:
         index = 20 + self.character.index
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from ..data.constants import Character
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -12,13 +12,13 @@ class Heal(Event):
     def __post_init__(self) -> None:
         self._heal()
 
-    def __str__(self) -> str:
+    def to_rows(self) -> list[EventRow]:
         if len(self.characters) == len(tuple(Character)):
             characters = 'every Character'
         else:
             characters = ', '.join([c for c in self.characters])
-        string = f'Heal: {characters} healed by {self.amount} HP and MP'
-        return string
+        column = f' {characters} healed by {self.amount} HP and MP'
+        return [EventRow('Heal', (column, ))]
 
     def _heal(self) -> None:
         for character in self.characters:
@@ -6,7 +6,7 @@ from ..data.constants import (KILLER_BONUS_CHANCE, Character, EquipmentType,
 from ..data.equipment import Equipment, EquipmentDrop
 from ..data.items import ItemDrop
 from ..data.monsters import Monster
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -38,28 +38,29 @@ class Kill(Event):
         for character in self.ap_credited_characters:
             self.gamestate.characters[character].ap += ap
 
-    def __str__(self) -> str:
-        string = f'Drops: {self.monster} | '
+    def to_rows(self) -> list[EventRow]:
         if self.item_1 and self.item_2:
-            string += f'{self.item_1}, {self.item_2}'
+            items = f'{self.item_1}, {self.item_2}'
         elif self.item_1:
-            string += f'{self.item_1}'
+            items = f'{self.item_1}'
         elif self.item_2:
-            string += f'{self.item_2}'
+            items = f'{self.item_2}'
         else:
-            string += '-'
-        string += f' | {self.monster.ap[self.kill_type]} AP'
+            items = '-'
+        ap = f' {self.monster.ap[self.kill_type]} AP'
         if self.ap_credited_characters:
-            string += f' to {''.join(c[0] for c in self.ap_credited_characters)}'
+            ap += f' to {''.join(c[0] for c in self.ap_credited_characters)}'
         if self.kill_type is KillType.OVERKILL:
-            string += ' (OK)'
+            ap += ' (OK)'
+        columns = [f' {self.monster} ', f' {items} ', ap]
         if self.equipment:
-            string += (f' | Equipment #{self.equipment_index} '
-                       f'{str(self.equipment)}'
-                       f'({self.ability_rolls} ability roll'
-                       f'{'s' * (self.ability_rolls != 1)})'
-                       )
-        return string
+            columns[-1] += ' '
+            columns.append(f' Equipment #{self.equipment_index} '
+                           f'{str(self.equipment)}'
+                           f'({self.ability_rolls} ability roll'
+                           f'{'s' * (self.ability_rolls != 1)})'
+                           )
+        return [EventRow('Drops', tuple(columns))]
 
     def _get_item_1(self) -> ItemDrop | None:
         rng_drop = self._advance_rng(10) % 255
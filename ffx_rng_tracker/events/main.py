@@ -4,14 +4,43 @@ from dataclasses import dataclass
 from ..gamestate import GameState
 
 
+@dataclass(frozen=True)
+class EventRow:
+    """Line of output of an event, split in the name of the event
+    and the columns separated by "|".
+    """
+    name: str
+    columns: tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        if not self.columns:
+            return self.name
+        return f'{self.name}:{'|'.join(self.columns)}'
+
+
+def get_rows(string: str) -> list[EventRow]:
+    """Splits every line of the string in an EventRow."""
+    rows = []
+    for line in string.split('\n'):
+        name, _, rest = line.partition(':')
+        if not rest:
+            rows.append(EventRow(line))
+        else:
+            rows.append(EventRow(name, tuple(rest.split('|'))))
+    return rows
+
+
 @dataclass
 class Event(ABC):
     """Abstract base class for all events."""
     gamestate: GameState
 
-    @abstractmethod
     def __str__(self) -> str:
-        pass
+        return '\n'.join([str(row) for row in self.to_rows()])
+
+    @abstractmethod
+    def to_rows(self) -> list[EventRow]:
+        """Returns the output of the event as a list of rows."""
 
     def _advance_rng(self, index: int) -> int:
         return self.gamestate._rng_tracker.advance_rng(index)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..data.actor import MonsterActor
 from ..data.constants import MonsterSlot, Status
 from ..data.monsters import Monster
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -16,8 +16,9 @@ class MonsterSpawn(Event):
         self.new_monster = self._spawn_monster()
         self.ctb = self._calc_ctb()
 
-    def __str__(self) -> str:
-        return f'Spawn: {self.new_monster} with {self.ctb} CTB'
+    def to_rows(self) -> list[EventRow]:
+        column = f' {self.new_monster} with {self.ctb} CTB'
+        return [EventRow('Spawn', (column, ))]
 
     def _spawn_monster(self) -> MonsterActor:
         actor = MonsterActor(self.monster, self.slot)
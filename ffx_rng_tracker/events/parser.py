@@ -1,60 +1,320 @@
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..configs import Configs
 from ..errors import EventParsingError
-from ..gamestate import GameState
+from ..gamestate import GameState, GameStateSnapshot
 from .comment import Comment
-from .main import Event
-from .parsing_functions import USAGE, ParsingFunction
+from .main import Event, EventRow
+from .parsing_functions import (ARGUMENTS_PARSERS, USAGE, EventFunction,
+                                ParsingFunction)
+
+
+@dataclass(frozen=True)
+class ParsingStep:
+    """Line of text already split and matched to its parsing function."""
+    line_index: int
+    parsing_function: ParsingFunction
+    params: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ParsedLine:
+    """Part of the parsing of a line that doesn't depend on the
+    gamestate: the text of the comment that replaces it or the
+    function that creates its event with the parsed arguments.
+    """
+    text: str = ''
+    parsing_function: ParsingFunction | None = None
+    event_function: EventFunction | None = None
+    arguments: tuple[Any, ...] = ()
+
+
+@dataclass
+class ParsingCache:
+    """Results of the last reparse_to_rows call with a seed."""
+    lines: list[str] = field(default_factory=list)
+    # index of the line of text every line comes from
+    source_indexes: list[int] = field(default_factory=list)
+    lines_events: list[Event] = field(default_factory=list)
+    # None for the lines that were hidden behind a "///" command
+    # when they were parsed
+    lines_rows: list[list[EventRow] | None] = field(default_factory=list)
+    # snapshot of the gamestate before the line
+    # at index n * EventParser.checkpoint_interval
+    checkpoints: list[GameStateSnapshot] = field(default_factory=list)
 
 
 class EventParser:
     """Helper class used to convert strings to events."""
+    # number of lines between gamestate checkpoints used by
+    # reparse_to_rows
+    checkpoint_interval: int = 32
 
     def __init__(self, gamestate: GameState) -> None:
         self.gamestate = gamestate
         self.parsing_functions: dict[str, ParsingFunction] = {}
         self.macros: dict[str, str] = {}
+        # events of the lines before the last "///" command
+        # of the last reparse_to_rows call
+        self.hidden_events: list[Event] = []
+        self.clear_checkpoints()
+
+    def clear_checkpoints(self) -> None:
+        """Makes the next call to reparse_to_rows parse
+        the whole text, the lines parsed by parse_line
+        are split and resolved again.
+        """
+        self._parsing_caches: OrderedDict[int, ParsingCache] = OrderedDict()
+        self._parsed_lines: dict[str, ParsedLine] = {}
+
+    def get_parsing_cache(self, seed: int) -> ParsingCache:
+        """Returns the results of the last reparse_to_rows call
+        with the seed, the ones of the last Configs.seeds_cache_size
+        seeds are kept.
+        """
+        cache = self._parsing_caches.pop(seed, None)
+        if cache is None:
+            cache = ParsingCache()
+        self._parsing_caches[seed] = cache
+        while len(self._parsing_caches) > max(Configs.seeds_cache_size, 1):
+            self._parsing_caches.popitem(last=False)
+        return cache
 
     def apply_macros(self, text: str) -> str:
         """Replace keys found in the self.macros dict with their values."""
-        text = f'\n{text}\n'
-        for name, macro in self.macros.items():
-            text = text.replace(f'\n/macro {name}\n', f'\n{macro}\n')
-        text = text[1:-1]
-        return text
+        lines, _ = self.expand_macros(text)
+        return '\n'.join(lines)
+
+    def expand_macros(self, text: str) -> tuple[list[str], list[int]]:
+        """Returns the lines of text with the "/macro [macro name]"
+        lines replaced by the lines of their macros and the index of
+        the line of text every line comes from.
+
+        Macros can use other macros, a macro used inside itself
+        is not replaced.
+        """
+        lines = []
+        source_indexes = []
+        for index, line in enumerate(text.splitlines()):
+            macro_lines = self._get_macro_lines(line, ())
+            lines.extend(macro_lines)
+            source_indexes.extend(index for _ in macro_lines)
+        return lines, source_indexes
+
+    def _get_macro_lines(self,
+                         line: str,
+                         used_macros: tuple[str, ...],
+                         ) -> list[str]:
+        """Returns the lines that replace line, used_macros are
+        the names of the macros that are being replaced.
+        """
+        if not line.startswith('/macro '):
+            return [line]
+        name = line[7:]
+        if name not in self.macros or name in used_macros:
+            return [line]
+        used_macros = used_macros + (name, )
+        lines = []
+        for macro_line in self.macros[name].splitlines():
+            lines.extend(self._get_macro_lines(macro_line, used_macros))
+        # an empty macro is replaced by an empty line
+        return lines or ['']
 
     def parse_to_string(self, text: str) -> str:
         return '\n'.join([str(e) for e in self.parse(text)])
 
+    def reparse_to_rows(self, text: str) -> list[EventRow]:
+        """Resets the gamestate, parses the text and returns the
+        output of the events as rows. The results of the previous
+        call with the same seed are reused for the lines before
+        the first line that changed.
+
+        The output of the events before the last line starting
+        with "///" is hidden by the trackers, so those events are
+        only simulated: only the rows of comments and commands
+        are included and the events are kept in self.hidden_events.
+
+        The errors of the lines of a macro include the number
+        of the line of text that uses the macro.
+        """
+        text_lines = text.splitlines()
+        lines, source_indexes = self.expand_macros(text)
+        hidden_lines = 0
+        for index in range(len(lines) - 1, -1, -1):
+            if lines[index].startswith('///'):
+                hidden_lines = index
+                break
+        cache = self.get_parsing_cache(self.gamestate.seed)
+        checkpoints = cache.checkpoints
+        unchanged_lines = 0
+        for old_line, line, old_source, source in zip(
+                cache.lines, lines, cache.source_indexes, source_indexes):
+            if old_line != line or old_source != source:
+                break
+            unchanged_lines += 1
+        # the lines that were hidden and are not anymore have no rows,
+        # they are parsed again from the previous checkpoint
+        for index in range(hidden_lines, unchanged_lines):
+            if cache.lines_rows[index] is None:
+                unchanged_lines = index
+                break
+        interval = self.checkpoint_interval
+        # the checkpoints before the first changed line are still valid
+        del checkpoints[unchanged_lines // interval + 1:]
+        if checkpoints:
+            start = (len(checkpoints) - 1) * interval
+            self.gamestate.restore(checkpoints.pop())
+        else:
+            start = 0
+            self.gamestate.reset()
+        lines_events = cache.lines_events[:start]
+        lines_rows = cache.lines_rows[:start]
+        for index, line in enumerate(lines[start:], start):
+            if index % interval == 0:
+                checkpoints.append(self.gamestate.snapshot())
+            event = self.parse_line(line)
+            source_line = text_lines[source_indexes[index]]
+            # the line comes from a macro
+            if (source_line.startswith('/macro ')
+                    and source_line[7:] in self.macros
+                    and isinstance(event, Comment)
+                    and event.text.startswith('Error: ')):
+                text = (f'{event.text} (line {source_indexes[index] + 1}: '
+                        f'{source_line})')
+                event = Comment(self.gamestate, text)
+            lines_events.append(event)
+            if index < hidden_lines and not isinstance(event, Comment):
+                lines_rows.append(None)
+            else:
+                lines_rows.append(event.to_rows())
+        cache.lines = lines
+        cache.source_indexes = source_indexes
+        cache.lines_events = lines_events
+        cache.lines_rows = lines_rows
+        self.hidden_events = lines_events[:hidden_lines]
+        # the lines that were visible when they were parsed
+        # but are now hidden still have their rows
+        rows = [row
+                for event, line_rows in zip(self.hidden_events, lines_rows)
+                if isinstance(event, Comment)
+                for row in line_rows]
+        rows.extend(row for line_rows in lines_rows[hidden_lines:]
+                    for row in line_rows)
+        return rows
+
     def parse(self, text: str) -> list[Event]:
         """Parse through the input text and returns a list of events."""
-        text = self.apply_macros(text)
+        lines, _ = self.expand_macros(text)
 
         events = []
-        for line in text.splitlines():
+        for line in lines:
             event = self.parse_line(line)
             events.append(event)
         return events
 
+    def compile(self, text: str) -> list[ParsingStep]:
+        """Splits the lines of text and resolves their parsing functions
+        once, so that the steps can be executed many times without
+        parsing the text again.
+
+        Lines that don't call a parsing function (comments, commands
+        and unknown events) are left out.
+        """
+        steps = []
+        lines, _ = self.expand_macros(text)
+        for index, line in enumerate(lines):
+            words = line.lower().split()
+            if not words or words[0].startswith(('#', '/')):
+                continue
+            event_name, *params = words
+            parsing_func = self.parsing_functions.get(event_name)
+            if parsing_func is None:
+                continue
+            steps.append(ParsingStep(index, parsing_func, tuple(params)))
+        return steps
+
+    def execute(self,
+                steps: list[ParsingStep],
+                ) -> Iterator[tuple[ParsingStep, Event]]:
+        """Calls the parsing functions of the steps and yields the
+        steps with their events, steps with invalid parameters
+        are skipped.
+        """
+        for step in steps:
+            try:
+                event = step.parsing_function(self.gamestate, *step.params)
+            except EventParsingError:
+                continue
+            yield step, event
+
     def parse_line(self, line: str) -> Event:
         """Parse the input line and returns an event."""
+        parsed_line = self._parsed_lines.get(line)
+        if parsed_line is None:
+            parsed_line = self.get_parsed_line(line)
+            # the errors of the macros depend on self.macros
+            if line.lower().split()[:1] != ['/macro']:
+                if len(self._parsed_lines) >= PARSED_LINES_CACHE_SIZE:
+                    self._parsed_lines.clear()
+                self._parsed_lines[line] = parsed_line
+        if parsed_line.event_function is None:
+            return Comment(self.gamestate, parsed_line.text)
+        try:
+            return parsed_line.event_function(
+                self.gamestate, *parsed_line.arguments)
+        except EventParsingError as error:
+            text = self._get_error_text(parsed_line.parsing_function, error)
+            return Comment(self.gamestate, text)
+
+    def get_parsed_line(self, line: str) -> ParsedLine:
+        """Splits the line, finds its parsing function and parses
+        the arguments that don't depend on the gamestate.
+        """
         words = line.lower().split()
         if not words or words[0].startswith('#'):
-            return Comment(self.gamestate, line)
+            return ParsedLine(line)
         elif words[0] == '/macro':
+            # expand_macros only leaves the macros used inside themselves
+            if line.startswith('/macro ') and line[7:] in self.macros:
+                return ParsedLine(f'Error: Macro "{line[7:]}" uses itself')
             macro_names = ', '.join([f'"{m}"' for m in self.macros])
-            text = f'Error: Possible macros are {macro_names}'
-            return Comment(self.gamestate, text)
+            return ParsedLine(f'Error: Possible macros are {macro_names}')
         elif words[0].startswith('/'):
-            return Comment(self.gamestate, f'Command: {line}')
+            return ParsedLine(f'Command: {line}')
         event_name, *params = words
         try:
             parsing_func = self.parsing_functions[event_name]
         except KeyError:
-            return Comment(
-                self.gamestate, f'Error: No event called "{event_name}"')
+            return ParsedLine(f'Error: No event called "{event_name}"')
+        if parsing_func not in ARGUMENTS_PARSERS:
+            return ParsedLine(
+                parsing_function=parsing_func,
+                event_function=parsing_func,
+                arguments=tuple(params),
+                )
+        arguments_parser, event_function = ARGUMENTS_PARSERS[parsing_func]
         try:
-            return parsing_func(self.gamestate, *params)
+            arguments = arguments_parser(*params)
         except EventParsingError as error:
-            if not str(error):
-                usage = USAGE.get(parsing_func, ['No usage found'])[0]
-                error = f'Usage: {usage}'
-            return Comment(self.gamestate, f'Error: {error}')
+            return ParsedLine(self._get_error_text(parsing_func, error))
+        return ParsedLine(
+            parsing_function=parsing_func,
+            event_function=event_function,
+            arguments=arguments,
+            )
+
+    def _get_error_text(self,
+                        parsing_func: ParsingFunction | None,
+                        error: EventParsingError,
+                        ) -> str:
+        if not str(error):
+            usage = USAGE.get(parsing_func, ['No usage found'])[0]
+            return f'Error: Usage: {usage}'
+        return f'Error: {error}'
+
+
+# number of lines kept by EventParser.parse_line
+PARSED_LINES_CACHE_SIZE = 4096
@@ -1,16 +1,16 @@
 from enum import StrEnum
-from typing import Protocol
+from typing import Any, Protocol
 
-from ..data.actions import ACTIONS, YOJIMBO_ACTIONS
+from ..data.actions import ACTIONS, YOJIMBO_ACTIONS, Action, YojimboAction
 from ..data.actor import Actor, MonsterActor
 from ..data.characters import s_lv_to_total_ap
 from ..data.constants import (SHORT_STATS_NAMES, Autoability, Character,
                               Element, ElementalAffinity, EquipmentType, Item,
                               KillType, MonsterSlot, Stat, TargetType)
-from ..data.encounter_formations import BOSSES, SIMULATIONS, ZONES
+from ..data.encounter_formations import BOSSES, SIMULATIONS, ZONES, Zone
 from ..data.equipment import Equipment
 from ..data.items import ITEM_PRICES
-from ..data.monsters import get_monsters_dict
+from ..data.monsters import Monster, get_monsters_dict
 from ..errors import EventParsingError
 from ..gamestate import GameState
 from ..utils import search_strenum, stringify
@@ -40,6 +40,16 @@ class ParsingFunction(Protocol):
         ...
 
 
+class ArgumentsParser(Protocol):
+    def __call__(self, *args: str) -> tuple[Any, ...]:
+        ...
+
+
+class EventFunction(Protocol):
+    def __call__(self, gs: GameState, *args: Any) -> Event:
+        ...
+
+
 def parse_amount(amount: str,
                  current_amount: int,
                  error_name: str = 'amount',
@@ -88,13 +98,9 @@ def parse_monster_slot(gs: GameState, slot: str) -> MonsterActor:
 
 def parse_party_members_initials(party_members_initials: str,
                                  ) -> list[Character]:
-    party_members = []
-    initials = {stringify(c)[0]: c for c in tuple(Character)[:8]}
-    for letter in party_members_initials:
-        for initial in initials:
-            if letter == initial:
-                party_members.append(initials[initial])
-                break
+    party_members = [PARTY_MEMBERS_INITIALS[letter]
+                     for letter in party_members_initials
+                     if letter in PARTY_MEMBERS_INITIALS]
     # remove duplicates and keep order
     return list(dict.fromkeys(party_members))
 
@@ -154,10 +160,11 @@ def parse_target(gs: GameState, target_name: str) -> Actor:
     return gs.characters[char]
 
 
-def parse_encounter(gs: GameState,
-                    name: str = '',
-                    *zones: str,
-                    ) -> Encounter | MultizoneRandomEncounter:
+def parse_encounter_arguments(
+        name: str = '',
+        *zones: str,
+        ) -> tuple[type[Encounter | MultizoneRandomEncounter],
+                   str | tuple[str, ...]]:
     if not name:
         name = 'dummy'
     elif 'simulated'.startswith(name):
@@ -179,12 +186,25 @@ def parse_encounter(gs: GameState,
         for zone in zones:
             if zone not in ZONES:
                 raise EventParsingError(f'No zone named "{zone}"')
-        return MultizoneRandomEncounter(gs, zones)
+        return MultizoneRandomEncounter, zones
     else:
         raise EventParsingError(f'No encounter named "{name}"')
+    return encounter_type, name
+
+
+def make_encounter(gs: GameState,
+                   encounter_type: type[Encounter | MultizoneRandomEncounter],
+                   name: str | tuple[str, ...],
+                   ) -> Encounter | MultizoneRandomEncounter:
     return encounter_type(gs, name)
 
 
+def parse_encounter(gs: GameState,
+                    *args: str,
+                    ) -> Encounter | MultizoneRandomEncounter:
+    return make_encounter(gs, *parse_encounter_arguments(*args))
+
+
 def parse_encounter_count_change(gs: GameState,
                                  name: str = '',
                                  amount: str = '',
@@ -207,11 +227,10 @@ def parse_encounter_count_change(gs: GameState,
     return Comment(gs, f'{count_name} encounters count set to {count}')
 
 
-def parse_steal(gs: GameState,
-                monster_name: str = '',
-                successful_steals: str = '0',
-                *_,
-                ) -> Steal:
+def parse_steal_arguments(monster_name: str = '',
+                          successful_steals: str = '0',
+                          *_,
+                          ) -> tuple[Monster, int]:
     if not monster_name:
         raise EventParsingError
     monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
@@ -222,16 +241,20 @@ def parse_steal(gs: GameState,
     if successful_steals < 0:
         raise EventParsingError(
             'successful steals must be greater or equal to 0')
-    return Steal(gs, monster, successful_steals)
+    return monster, successful_steals
+
 
+def parse_steal(gs: GameState, *args: str) -> Steal:
+    return Steal(gs, *parse_steal_arguments(*args))
 
-def parse_kill(gs: GameState,
-               monster_name: str = '',
-               killer_name: str = '',
-               ap_characters_string: str = '',
-               overkill: str = '',
-               *_,
-               ) -> Kill:
+
+def parse_kill_arguments(monster_name: str = '',
+                         killer_name: str = '',
+                         ap_characters_string: str = '',
+                         overkill: str = '',
+                         *_,
+                         ) -> tuple[Monster, Character, list[Character],
+                                    KillType]:
     if not monster_name or not killer_name:
         raise EventParsingError
     monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
@@ -241,36 +264,48 @@ def parse_kill(gs: GameState,
         kill_type = KillType.OVERKILL
     else:
         kill_type = KillType.NORMAL
-    return Kill(gs, monster, killer, ap_characters, kill_type)
+    return monster, killer, ap_characters, kill_type
+
+
+def parse_kill(gs: GameState, *args: str) -> Kill:
+    return Kill(gs, *parse_kill_arguments(*args))
 
 
-def parse_bribe(gs: GameState,
-                monster_name: str = '',
-                user_name: str = '',
-                ap_characters_string: str = '',
-                *_,
-                ) -> Bribe:
+def parse_bribe_arguments(monster_name: str = '',
+                          user_name: str = '',
+                          ap_characters_string: str = '',
+                          *_,
+                          ) -> tuple[Monster, Character, list[Character]]:
     if not monster_name or not user_name:
         raise EventParsingError
     monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
     user = parse_enum_member(user_name, Character, 'user')
     ap_characters = parse_party_members_initials(ap_characters_string)
-    return Bribe(gs, monster, user, ap_characters)
+    return monster, user, ap_characters
 
 
-def parse_death(gs: GameState, character_name: str = 'unknown', *_) -> Death:
+def parse_bribe(gs: GameState, *args: str) -> Bribe:
+    return Bribe(gs, *parse_bribe_arguments(*args))
+
+
+def parse_death_arguments(character_name: str = 'unknown',
+                          *_,
+                          ) -> tuple[Character]:
     try:
         character = search_strenum(Character, character_name)
     except ValueError:
         character = Character.UNKNOWN
-    return Death(gs, character)
+    return character,
+
+
+def parse_death(gs: GameState, *args: str) -> Death:
+    return Death(gs, *parse_death_arguments(*args))
 
 
-def parse_roll(gs: GameState,
-               rng_index: str = '',
-               amount: str = '1',
-               *_,
-               ) -> AdvanceRNG:
+def parse_roll_arguments(rng_index: str = '',
+                         amount: str = '1',
+                         *_,
+                         ) -> tuple[int, int]:
     try:
         if rng_index.startswith('rng'):
             rng_index = int(rng_index[3:])
@@ -289,13 +324,16 @@ def parse_roll(gs: GameState,
         raise EventParsingError(f'Can\'t advance rng index {rng_index}')
     if amount > 100000:
         raise EventParsingError('Can\'t advance rng more than 100000 times')
-    return AdvanceRNG(gs, rng_index, amount)
+    return rng_index, amount
+
 
+def parse_roll(gs: GameState, *args: str) -> AdvanceRNG:
+    return AdvanceRNG(gs, *parse_roll_arguments(*args))
 
-def parse_party_change(gs: GameState,
-                       party_formation_string: str = '',
-                       *_,
-                       ) -> ChangeParty:
+
+def parse_party_change_arguments(party_formation_string: str = '',
+                                 *_,
+                                 ) -> tuple[list[Character]]:
     if not party_formation_string:
         raise EventParsingError
     party_formation = parse_party_members_initials(party_formation_string)
@@ -303,10 +341,16 @@ def parse_party_change(gs: GameState,
     if not party_formation:
         raise EventParsingError(
             f'no characters initials in "{party_formation_string}"')
-    return ChangeParty(gs, party_formation)
+    return party_formation,
 
 
-def parse_summon(gs: GameState, aeon_name: str = '', *_) -> ChangeParty:
+def parse_party_change(gs: GameState, *args: str) -> ChangeParty:
+    return ChangeParty(gs, *parse_party_change_arguments(*args))
+
+
+def parse_summon_arguments(aeon_name: str = '',
+                           *_,
+                           ) -> tuple[list[Character]]:
     if not aeon_name:
         raise EventParsingError
     if 'magus_sisters'.startswith(aeon_name):
@@ -318,24 +362,27 @@ def parse_summon(gs: GameState, aeon_name: str = '', *_) -> ChangeParty:
                 break
         else:
             raise EventParsingError(f'No aeon named "{aeon_name}"')
-    return ChangeParty(gs, party_formation)
+    return party_formation,
+
+
+def parse_summon(gs: GameState, *args: str) -> ChangeParty:
+    return ChangeParty(gs, *parse_summon_arguments(*args))
 
 
-def parse_action(gs: GameState,
-                 character_name: str = '',
-                 action_name: str = '',
-                 target_name: str = '',
-                 od_time_remaining: str = '',
-                 od_n_of_hits: str = '',
-                 *_,
-                 ) -> CharacterAction | Escape:
+def parse_action_arguments(character_name: str = '',
+                           action_name: str = '',
+                           target_name: str = '',
+                           od_time_remaining: str = '',
+                           od_n_of_hits: str = '',
+                           *_,
+                           ) -> tuple[Character, Action | None, str, int, int]:
     if not character_name or not action_name:
         raise EventParsingError
     character = parse_enum_member(character_name, Character, 'character')
-    actor = gs.characters[character]
 
+    # escape is not an action, it is returned as None
     if action_name == 'escape':
-        return Escape(gs, actor)
+        return character, None, target_name, 0, 1
 
     action = parse_dict_key(action_name, ACTIONS, 'action')
     if not action.can_use_in_combat:
@@ -356,6 +403,58 @@ def parse_action(gs: GameState,
             text = (f'Action "{action}" requires a target '
                     '(Character/Monster/Monster Slot/"monsters"/"party")')
             raise EventParsingError(text)
+
+    match action.overdrive_user:
+        case Character.TIDUS | Character.AURON | Character.WAKKA:
+            try:
+                time = float(target_name)
+            except ValueError:
+                try:
+                    time = float(od_time_remaining)
+                except ValueError:
+                    time = 0
+                if od_n_of_hits.isdecimal():
+                    n_of_hits = int(od_n_of_hits)
+                else:
+                    n_of_hits = 1
+            else:
+                if od_time_remaining.isdecimal():
+                    n_of_hits = int(od_time_remaining)
+                elif od_n_of_hits.isdecimal():
+                    n_of_hits = int(od_n_of_hits)
+                else:
+                    n_of_hits = 1
+        case Character.LULU:
+            time = 0
+            if target_name.isdecimal():
+                n_of_hits = int(target_name)
+            elif od_time_remaining.isdecimal():
+                n_of_hits = int(od_time_remaining)
+            elif od_n_of_hits.isdecimal():
+                n_of_hits = int(od_n_of_hits)
+            else:
+                n_of_hits = 1
+        case _:
+            time = 0
+            n_of_hits = 1
+    time = int(time * 1000)
+    return character, action, target_name, time, n_of_hits
+
+
+def make_action(gs: GameState,
+                character: Character,
+                action: Action | None,
+                target_name: str,
+                time: int,
+                n_of_hits: int,
+                ) -> CharacterAction | Escape:
+    actor = gs.characters[character]
+
+    if action is None:
+        return Escape(gs, actor)
+
+    # the targets depend on the characters and monsters of the gamestate
+    match action.target:
         case TargetType.SINGLE:
             target = parse_target(gs, target_name)
         case TargetType.SINGLE_CHARACTER:
@@ -394,44 +493,13 @@ def parse_action(gs: GameState,
             target = gs.characters[char]
         case _:
             target = action.target
-
-    match action.overdrive_user:
-        case Character.TIDUS | Character.AURON | Character.WAKKA:
-            try:
-                time = float(target_name)
-            except ValueError:
-                try:
-                    time = float(od_time_remaining)
-                except ValueError:
-                    time = 0
-                if od_n_of_hits.isdecimal():
-                    n_of_hits = int(od_n_of_hits)
-                else:
-                    n_of_hits = 1
-            else:
-                if od_time_remaining.isdecimal():
-                    n_of_hits = int(od_time_remaining)
-                elif od_n_of_hits.isdecimal():
-                    n_of_hits = int(od_n_of_hits)
-                else:
-                    n_of_hits = 1
-        case Character.LULU:
-            time = 0
-            if target_name.isdecimal():
-                n_of_hits = int(target_name)
-            elif od_time_remaining.isdecimal():
-                n_of_hits = int(od_time_remaining)
-            elif od_n_of_hits.isdecimal():
-                n_of_hits = int(od_n_of_hits)
-            else:
-                n_of_hits = 1
-        case _:
-            time = 0
-            n_of_hits = 1
-    time = int(time * 1000)
     return CharacterAction(gs, actor, action, target, time, n_of_hits)
 
 
+def parse_action(gs: GameState, *args: str) -> CharacterAction | Escape:
+    return make_action(gs, *parse_action_arguments(*args))
+
+
 def parse_stat_update(gs: GameState,
                       actor_name: str = '',
                       stat_name: str = '',
@@ -460,18 +528,21 @@ def parse_stat_update(gs: GameState,
     return ChangeStat(gs, actor, stat, stat_value)
 
 
-def parse_yojimbo_action(gs: GameState,
-                         action_name: str = '',
-                         monster_name: str = '',
-                         overdrive: str = '',
-                         *_,
-                         ) -> YojimboTurn:
+def parse_yojimbo_action_arguments(action_name: str = '',
+                                   monster_name: str = '',
+                                   overdrive: str = '',
+                                   *_,
+                                   ) -> tuple[YojimboAction, Monster, bool]:
     if not action_name or not monster_name:
         raise EventParsingError
     action = parse_dict_key(action_name, YOJIMBO_ACTIONS, 'yojimbo action')
     monster = parse_dict_key(monster_name, get_monsters_dict(), 'monster')
     overdrive = overdrive == 'overdrive'
-    return YojimboTurn(gs, action, monster, overdrive)
+    return action, monster, overdrive
+
+
+def parse_yojimbo_action(gs: GameState, *args: str) -> YojimboTurn:
+    return YojimboTurn(gs, *parse_yojimbo_action_arguments(*args))
 
 
 def parse_compatibility_update(gs: GameState,
@@ -519,27 +590,30 @@ def parse_monster_action(gs: GameState,
     return MonsterAction(gs, actor, action, None)
 
 
-def parse_equipment_change(gs: GameState,
-                           equipment_type_name: str = '',
-                           character_name: str = '',
-                           slots: str = '',
-                           *ability_names: str,
-                           ) -> ChangeEquipment:
+def parse_equipment_change_arguments(equipment_type_name: str = '',
+                                     character_name: str = '',
+                                     slots: str = '',
+                                     *ability_names: str,
+                                     ) -> tuple[Equipment]:
     if not all((equipment_type_name, character_name, slots)):
         raise EventParsingError
     equipment = parse_equipment(
         equipment_type_name, character_name, slots, *ability_names)
-    return ChangeEquipment(gs, equipment)
+    return equipment,
+
+
+def parse_equipment_change(gs: GameState, *args: str) -> ChangeEquipment:
+    return ChangeEquipment(gs, *parse_equipment_change_arguments(*args))
 
 
 def parse_end_encounter(gs: GameState, *_) -> EndEncounter:
     return EndEncounter(gs)
 
 
-def parse_heal(gs: GameState,
-               character_name: str = '',
-               amount: str = '99999',
-               *_) -> Heal:
+def parse_heal_arguments(character_name: str = '',
+                         amount: str = '99999',
+                         *_,
+                         ) -> tuple[list[Character], int]:
     if character_name:
         characters = [parse_enum_member(character_name, Character, 'character')]
     else:
@@ -549,7 +623,11 @@ def parse_heal(gs: GameState,
     except ValueError:
         amount = 99999
 
-    return Heal(gs, characters, amount)
+    return characters, amount
+
+
+def parse_heal(gs: GameState, *args: str) -> Heal:
+    return Heal(gs, *parse_heal_arguments(*args))
 
 
 def parse_character_ap(gs: GameState,
@@ -643,11 +721,11 @@ def parse_monster_elemental_affinities_change(gs: GameState,
     return Comment(gs, text)
 
 
-def parse_encounter_checks(gs: GameState,
-                           zone_name: str = '',
-                           steps: str = '',
-                           continue_zone: str = '',
-                           *_) -> EncounterChecks:
+def parse_encounter_checks_arguments(zone_name: str = '',
+                                     steps: str = '',
+                                     continue_zone: str = '',
+                                     *_,
+                                     ) -> tuple[Zone, int, bool]:
     if not zone_name or not steps:
         raise EventParsingError
 
@@ -657,7 +735,11 @@ def parse_encounter_checks(gs: GameState,
     except ValueError:
         raise EventParsingError('Step must be an integer')
     continue_previous_zone = continue_zone == 'true' or continue_zone == 'cpz'
-    return EncounterChecks(gs, zone, distance, continue_previous_zone)
+    return zone, distance, continue_previous_zone
+
+
+def parse_encounter_checks(gs: GameState, *args: str) -> EncounterChecks:
+    return EncounterChecks(gs, *parse_encounter_checks_arguments(*args))
 
 
 def parse_inventory_command(gs: GameState,
@@ -796,6 +878,8 @@ def parse_inventory_command(gs: GameState,
     return Comment(gs, text)
 
 
+PARTY_MEMBERS_INITIALS = {stringify(c)[0]: c for c in tuple(Character)[:8]}
+
 USAGE: dict[ParsingFunction, list[str]] = {
     parse_encounter: [
         'encounter (preemp/ambush/simulated/name/zone)',
@@ -882,3 +966,24 @@ USAGE: dict[ParsingFunction, list[str]] = {
         'inventory autosort',
     ],
 }
+# parsing functions split in the parsing of their arguments, that doesn't
+# depend on the gamestate and can be done once per line, and the creation
+# of their event with the parsed arguments
+ARGUMENTS_PARSERS: dict[ParsingFunction,
+                        tuple[ArgumentsParser, EventFunction]] = {
+    parse_encounter: (parse_encounter_arguments, make_encounter),
+    parse_steal: (parse_steal_arguments, Steal),
+    parse_kill: (parse_kill_arguments, Kill),
+    parse_bribe: (parse_bribe_arguments, Bribe),
+    parse_death: (parse_death_arguments, Death),
+    parse_roll: (parse_roll_arguments, AdvanceRNG),
+    parse_party_change: (parse_party_change_arguments, ChangeParty),
+    parse_summon: (parse_summon_arguments, ChangeParty),
+    parse_action: (parse_action_arguments, make_action),
+    parse_yojimbo_action: (parse_yojimbo_action_arguments, YojimboTurn),
+    parse_equipment_change: (
+        parse_equipment_change_arguments, ChangeEquipment),
+    parse_heal: (parse_heal_arguments, Heal),
+    parse_encounter_checks: (
+        parse_encounter_checks_arguments, EncounterChecks),
+}
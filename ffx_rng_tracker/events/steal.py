@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from ..data.constants import Rarity
 from ..data.items import ItemDrop
 from ..data.monsters import Monster
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -16,13 +16,12 @@ class Steal(Event):
         if self.item:
             self.gamestate.inventory.add(self.item.item, self.item.quantity)
 
-    def __str__(self) -> str:
-        string = f'Steal: {self.monster} | '
+    def to_rows(self) -> list[EventRow]:
         if self.item:
-            string += str(self.item)
+            item = f' {self.item}'
         else:
-            string += 'Failed'
-        return string
+            item = ' Failed'
+        return [EventRow('Steal', (f' {self.monster} ', item))]
 
     def _get_item(self) -> ItemDrop | None:
         rng_steal = self._advance_rng(10) % 255
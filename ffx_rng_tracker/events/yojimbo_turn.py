@@ -6,7 +6,7 @@ from ..data.actions import YOJIMBO_ACTIONS, YojimboAction
 from ..data.constants import (COMPATIBILITY_MODIFIER, GIL_MOTIVATION_MODIFIER,
                               OVERDRIVE_MOTIVATION, ZANMATO_RESISTANCES)
 from ..data.monsters import Monster
-from .main import Event
+from .main import Event, EventRow
 
 
 @dataclass
@@ -27,7 +27,7 @@ class YojimboTurn(Event):
             self.motivation = 0
         self.compatibility = self._update_compatibility()
 
-    def __str__(self) -> str:
+    def to_rows(self) -> list[EventRow]:
         if self.is_attack_free:
             cost = 'free'
         else:
@@ -36,11 +36,10 @@ class YojimboTurn(Event):
             overdrive = ' (OD used)'
         else:
             overdrive = ''
-        string = (f'{self.action} -> {self.monster}: '
-                  f'{cost}{overdrive} '
+        column = (f' {cost}{overdrive} '
                   f'[{self.motivation}/{self.action.needed_motivation} '
                   f'motivation][{self.compatibility}/255 compatibility]')
-        return string
+        return [EventRow(f'{self.action} -> {self.monster}', (column, ))]
 
     def _free_attack_check(self) -> bool:
         rng = self._advance_rng(17) & 255
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from itertools import chain
+from typing import Any
 
 from .configs import Configs
 from .data.actions import Action
@@ -102,7 +104,8 @@ class GameState:
             aeon.set_stat(Stat.LUCK, yuna_stats[Stat.LUCK])
             for stat, (x, y) in stats_constants.items():
                 value = (yuna_stats[stat] * x // 100) + int(power_base * y)
-                enc_value = (enc_stats[stat] * x // 100) + int(enc_power_base * y)
+                enc_value = ((enc_stats[stat] * x // 100)
+                             + int(enc_power_base * y))
                 value = max(value, enc_value) + bonus_stats.get(stat, 0)
                 aeon.set_stat(stat, value)
 
@@ -196,6 +199,30 @@ class GameState:
                 actor.current_hp = 99999
                 actor.current_mp = 9999
 
+    def snapshot(self) -> 'GameStateSnapshot':
+        """Returns a snapshot of the state that can be passed
+        to restore to go back to it.
+        """
+        objects = [self, self.inventory]
+        objects.extend(self.characters.values())
+        objects.extend(self.monster_party)
+        return GameStateSnapshot(
+            tuple(self._rng_tracker._rng_current_positions),
+            tuple([_save_attributes(o) for o in objects]),
+            )
+
+    def restore(self, snapshot: 'GameStateSnapshot') -> None:
+        """Restores the state saved by snapshot, the snapshot
+        can be restored any number of times.
+        """
+        positions = self._rng_tracker._rng_current_positions
+        positions[:] = snapshot.rng_positions
+        for obj, attributes in snapshot.objects:
+            current_attributes = vars(obj)
+            current_attributes.update(attributes)
+            for name in _get_container_attributes(obj):
+                current_attributes[name] = attributes[name].copy()
+
     @property
     def gil(self) -> int:
         return self._gil
@@ -220,3 +247,39 @@ class GameState:
     @seed.setter
     def seed(self, seed: int) -> None:
         self._rng_tracker.__init__(seed)
+
+
+@dataclass(frozen=True)
+class GameStateSnapshot:
+    """State of a GameState saved by GameState.snapshot.
+
+    Stores the attributes of the gamestate, inventory, characters
+    and monsters, only their dicts, lists and sets are copied,
+    every other value is immutable and shared with the gamestate.
+    """
+    rng_positions: tuple[int, ...]
+    objects: tuple[tuple[object, dict[str, Any]], ...]
+
+
+def _save_attributes(obj: object) -> tuple[object, dict[str, Any]]:
+    attributes = vars(obj).copy()
+    for name in _get_container_attributes(obj):
+        attributes[name] = attributes[name].copy()
+    return obj, attributes
+
+
+def _get_container_attributes(obj: object) -> tuple[str, ...]:
+    """returns the names of the attributes of obj that are dicts,
+    lists or sets, every instance of a class is expected to have
+    the same attributes
+    """
+    try:
+        return _CONTAINER_ATTRIBUTES[type(obj)]
+    except KeyError:
+        names = tuple([k for k, v in vars(obj).items()
+                       if isinstance(v, (dict, list, set))])
+        _CONTAINER_ATTRIBUTES[type(obj)] = names
+        return names
+
+
+_CONTAINER_ATTRIBUTES: dict[type, tuple[str, ...]] = {}
@@ -1,5 +1,11 @@
-from collections.abc import Iterator
+import sys
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from weakref import WeakValueDictionary
 
+from .configs import Configs
 from .data.constants import RNG_CONSTANTS_1, RNG_CONSTANTS_2
 
 
@@ -25,17 +31,16 @@ class FFXRNGTracker:
         20-35: damage/crit/escape chance
         36-51: hit chance
         52-67: status landing chance
+
+    The values are generated and cached by the RNGStreams of the
+    seed, that are shared with every other tracker with the same
+    seed, every tracker keeps track of its own positions.
     """
 
     def __init__(self, seed: int) -> None:
         self.seed = seed
-        self.rng_initial_values = self.get_rng_initial_values()
-
-        # get rng generators
-        self._rng_generators = tuple(
-            [self.get_rng_generator(i) for i in range(68)])
-        # create a list of lists used to store rng values
-        self._rng_arrays = [list() for _ in range(68)]
+        self._rng_streams = get_rng_streams(seed)
+        self.rng_initial_values = self._rng_streams.initial_values.copy()
         self._rng_current_positions = [0 for _ in range(68)]
 
     def __repr__(self) -> str:
@@ -43,15 +48,7 @@ class FFXRNGTracker:
 
     def get_rng_initial_values(self, amount: int = 68) -> list[int]:
         """Calculates the starting values of the rng arrays."""
-        rng_value = ((self.seed & 0xffffffff) ^ 0x80000000) - 0x80000000
-        initial_values = []
-        for _ in range(amount):
-            rng_value = rng_value * 0x5d588b65 + 0x3c35
-            rng_value = ((rng_value & 0xffffffff) ^ 0x80000000) - 0x80000000
-            rng_value = (rng_value >> 0x10) + (rng_value << 0x10)
-            rng_value = ((rng_value & 0xffffffff) ^ 0x80000000) - 0x80000000
-            initial_values.append(rng_value & 0x7fffffff)
-        return initial_values
+        return calculate_rng_initial_values(self.seed, amount)
 
     def get_rng_generator(self, rng_index: int) -> Iterator[int]:
         """Returns a generator object that yields rng values
@@ -73,17 +70,248 @@ class FFXRNGTracker:
         """Advances the position of the given rng index and returns
         the next value for that index.
         """
-        array = self._rng_arrays[index]
         position = self._rng_current_positions[index]
         self._rng_current_positions[index] = position + 1
+        array = self._rng_streams.arrays[index]
         try:
-            rng_value = array[position]
+            return array[position]
         except IndexError:
-            rng_value = next(self._rng_generators[index])
-            array.append(rng_value)
-        return rng_value
+            self._rng_streams.generate(index, position + 1 - len(array))
+            return array[position]
 
     def reset(self) -> None:
         """Reset the position of the rng arrays."""
         self._rng_current_positions.clear()
         self._rng_current_positions.extend(0 for _ in range(68))
+
+
+class RNGStreams:
+    """Values generated by the 68 rng streams of a seed, shared by
+    every FFXRNGTracker with that seed through get_rng_streams.
+
+    Values are generated in blocks the first time a position
+    past the cached ones is needed and stored in typed arrays of
+    unsigned 32-bit integers, cached values are never changed.
+    The first block has block_size values and every other block
+    is as big as the values already cached, up to max_block_size,
+    so that trackers used for a handful of values (like the ones
+    used to find seeds) don't calculate values they won't use
+    and long sessions don't keep up to twice the values they used.
+    """
+    block_size: int = 16
+    max_block_size: int = 1024
+
+    def __init__(self, seed: int) -> None:
+        self.seed = seed
+        self.initial_values = calculate_rng_initial_values(seed)
+        # last generated value (before masking) for every rng index
+        self._states = self.initial_values.copy()
+        self.arrays = [array('I') for _ in range(68)]
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(seed=({self.seed}))'
+
+    def generate(self, rng_index: int, amount: int) -> None:
+        """Appends at least amount new values to the array
+        of the given rng index, and at least as many as the values
+        already in it (up to max_block_size) or block_size.
+
+        Same arithmetic as get_rng_generator done on unsigned
+        32-bit values, the sign extension of the signed shift
+        is the subtraction of 0x10000 when the high bit is set.
+        """
+        # the streams are shared by the trackers of every thread
+        # (e.g. the seed search runs in a worker thread), the state
+        # must be read and updated by one thread at a time
+        with self._lock:
+            amount = max(
+                amount,
+                min(len(self.arrays[rng_index]), self.max_block_size),
+                self.block_size,
+                )
+            rng_value = self._states[rng_index]
+            rng_constant_1 = RNG_CONSTANTS_1[rng_index]
+            rng_constant_2 = RNG_CONSTANTS_2[rng_index]
+            values = array('I', bytes(4 * amount))
+            for i in range(len(values)):
+                rng_value = ((rng_value * rng_constant_1 ^ rng_constant_2)
+                             & 0xffffffff)
+                if rng_value & 0x80000000:
+                    rng_value = ((rng_value >> 0x10 | rng_value << 0x10)
+                                 - 0x10000) & 0xffffffff
+                else:
+                    rng_value = ((rng_value >> 0x10 | rng_value << 0x10)
+                                 & 0xffffffff)
+                values[i] = rng_value & 0x7fffffff
+            self._states[rng_index] = rng_value
+            self.arrays[rng_index].extend(values)
+
+
+class BatchRNGTracker:
+    """Counterpart of FFXRNGTracker that tracks the same positions
+    of the rng arrays for many seeds at once.
+
+    The values of every seed are packed in the 64-bit lanes of a
+    single integer (see pack_lanes), so that every step of the rng
+    function is calculated for all the seeds with a few operations.
+    For every rng index the values are cached in rows, one for
+    every position, in the same order as seeds.
+    Only the rng indexes that are used are calculated.
+    """
+
+    def __init__(self, seeds: Iterable[int]) -> None:
+        self.seeds = array('I', seeds)
+        self._ones = get_lanes_ones(len(self.seeds))
+        # 32-bit values used to calculate the next initial values
+        self._seeds_lanes = pack_lanes(self.seeds)
+        self._rng_initial_lanes: list[int] = []
+        self._rng_initial_values: dict[int, array] = {}
+        # last generated 32-bit values of every rng index
+        self._rng_states: list[int | None] = [None for _ in range(68)]
+        self._rng_rows: list[list[int]] = [[] for _ in range(68)]
+        self._rng_current_positions = [0 for _ in range(68)]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(seeds=({len(self.seeds)}))'
+
+    def get_rng_initial_values(self, rng_index: int) -> array:
+        """Returns the starting values of rng_index for every seed."""
+        values = self._rng_initial_values.get(rng_index)
+        if values is None:
+            values = array('I', unpack_lanes(
+                self._get_rng_initial_lanes(rng_index), len(self.seeds)))
+            self._rng_initial_values[rng_index] = values
+        return values
+
+    def _get_rng_initial_lanes(self, rng_index: int) -> int:
+        ones = self._ones
+        mask = ones * 0xffffffff
+        while len(self._rng_initial_lanes) <= rng_index:
+            lanes = (self._seeds_lanes * 0x5d588b65 + ones * 0x3c35) & mask
+            lanes = rotate_rng_lanes(lanes, ones)
+            self._seeds_lanes = lanes
+            self._rng_initial_lanes.append(lanes & ones * 0x7fffffff)
+        return self._rng_initial_lanes[rng_index]
+
+    def _generate_rng_row(self, rng_index: int) -> None:
+        """Calculates the values of every seed
+        for the next position of rng_index.
+        """
+        lanes = self._rng_states[rng_index]
+        if lanes is None:
+            lanes = self._get_rng_initial_lanes(rng_index)
+        ones = self._ones
+        rng_constant_1 = RNG_CONSTANTS_1[rng_index] & 0xffffffff
+        rng_constant_2 = RNG_CONSTANTS_2[rng_index]
+        lanes = (lanes * rng_constant_1 ^ ones * rng_constant_2)
+        lanes = rotate_rng_lanes(lanes & ones * 0xffffffff, ones)
+        self._rng_states[rng_index] = lanes
+        self._rng_rows[rng_index].append(lanes & ones * 0x7fffffff)
+
+    def advance_rng(self, index: int) -> array:
+        """Advances the position of the given rng index and returns
+        the next value of every seed for that index.
+        """
+        return array('I', unpack_lanes(
+            self.advance_rng_lanes(index), len(self.seeds)))
+
+    def advance_rng_lanes(self, index: int) -> int:
+        """Same as advance_rng, but the values are returned
+        packed in lanes.
+        """
+        position = self._rng_current_positions[index]
+        self._rng_current_positions[index] = position + 1
+        rows = self._rng_rows[index]
+        while len(rows) <= position:
+            self._generate_rng_row(index)
+        return rows[position]
+
+    def reset(self) -> None:
+        """Reset the position of the rng arrays."""
+        self._rng_current_positions.clear()
+        self._rng_current_positions.extend(0 for _ in range(68))
+
+
+def pack_lanes(values: Iterable[int]) -> int:
+    """Packs unsigned values of up to 64 bits in the 64-bit lanes
+    of an integer, the first value in the lowest lane.
+
+    Additions, multiplications, subtractions and left shifts
+    of lanes act on every value at once as long as no lane
+    overflows or goes below 0, right shifts and bitwise operations
+    only need a mask (multiplied by get_lanes_ones) to drop the bits
+    that come from the next lane.
+    """
+    values = array('Q', values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return int.from_bytes(values.tobytes(), 'little')
+
+
+def unpack_lanes(lanes: int, amount: int) -> array:
+    """Returns the values in the first amount lanes
+    as an array of unsigned 64-bit integers.
+    """
+    values = array('Q')
+    values.frombytes(lanes.to_bytes(8 * amount, 'little'))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def get_lanes_ones(amount: int) -> int:
+    """Returns amount lanes that are all set to 1."""
+    return int.from_bytes(b'\x01\x00\x00\x00\x00\x00\x00\x00' * amount,
+                          'little')
+
+
+def rotate_rng_lanes(lanes: int, ones: int) -> int:
+    """Rotates every 32-bit value packed in lanes by 16 bits,
+    values with the high bit set get 0x10000 subtracted because
+    the game uses a signed shift.
+    """
+    rotated = (lanes >> 0x10 & ones * 0xffff
+               | lanes << 0x10 & ones * 0xffff0000)
+    # adding 2**32 keeps the lanes positive
+    rotated += (ones << 0x20) - ((lanes >> 0x1f & ones) << 0x10)
+    return rotated & ones * 0xffffffff
+
+
+def calculate_rng_initial_values(seed: int, amount: int = 68) -> list[int]:
+    """Calculates the starting values of the rng arrays of a seed."""
+    rng_value = ((seed & 0xffffffff) ^ 0x80000000) - 0x80000000
+    initial_values = []
+    for _ in range(amount):
+        rng_value = rng_value * 0x5d588b65 + 0x3c35
+        rng_value = ((rng_value & 0xffffffff) ^ 0x80000000) - 0x80000000
+        rng_value = (rng_value >> 0x10) + (rng_value << 0x10)
+        rng_value = ((rng_value & 0xffffffff) ^ 0x80000000) - 0x80000000
+        initial_values.append(rng_value & 0x7fffffff)
+    return initial_values
+
+
+def get_rng_streams(seed: int) -> RNGStreams:
+    """Returns the RNGStreams of the seed, they are shared by every
+    caller for as long as at least one of them keeps a reference.
+
+    The streams of the last Configs.seeds_cache_size seeds
+    are also kept after their trackers change seed, so that
+    changing back to one of them doesn't generate the values again.
+    """
+    with _RNG_STREAMS_LOCK:
+        streams = _RNG_STREAMS.get(seed)
+        if streams is None:
+            streams = RNGStreams(seed)
+            _RNG_STREAMS[seed] = streams
+        _RECENT_RNG_STREAMS[seed] = streams
+        _RECENT_RNG_STREAMS.move_to_end(seed)
+        while len(_RECENT_RNG_STREAMS) > Configs.seeds_cache_size:
+            _RECENT_RNG_STREAMS.popitem(last=False)
+    return streams
+
+
+_RNG_STREAMS: WeakValueDictionary[int, RNGStreams] = WeakValueDictionary()
+_RECENT_RNG_STREAMS: OrderedDict[int, RNGStreams] = OrderedDict()
+# guards the caches of get_rng_streams
+_RNG_STREAMS_LOCK = Lock()
@@ -1,5 +1,6 @@
 from ..data.constants import Character
 from ..data.monsters import get_monsters_dict
+from ..events.main import EventRow
 from ..events.parsing_functions import (
     ParsingFunction, parse_action, parse_actor_status, parse_encounter,
     parse_encounter_count_change, parse_end_encounter, parse_equipment_change,
@@ -7,7 +8,7 @@ from ..events.parsing_functions import (
     parse_monster_elemental_affinities_change, parse_monster_spawn,
     parse_party_change, parse_roll, parse_stat_update, parse_summon)
 from ..utils import stringify
-from .base_tracker import TrackerUI
+from .base_tracker import ENCOUNTER_ROWS_NAMES, TrackerUI
 
 
 class ActionsTracker(TrackerUI):
@@ -65,17 +66,12 @@ class ActionsTracker(TrackerUI):
             input_lines[index] = line
         return '\n'.join(input_lines)
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        # if the text contains /// it hides the lines before it
-        if output.find('Command: ///') >= 0:
-            output = output.split('Command: ///')[-1]
-            output = output[output.find('\n') + 1:]
-        output = (output
-                  .replace('Boss', '')
-                  .replace(' Normal', '')
-                  .replace('Random ', '')
-                  .replace('Simulated ', '')
-                  )
-        if padding:
-            output = self.pad_output(output)
-        return output
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        edited_rows = []
+        for row in self.get_visible_rows(rows):
+            if row.name in ENCOUNTER_ROWS_NAMES:
+                columns = [c.replace('Boss', '').replace(' Normal', '')
+                           for c in row.columns]
+                row = EventRow('Encounter', tuple(columns))
+            edited_rows.append(row)
+        return '\n'.join(self.format_rows(edited_rows, padding))
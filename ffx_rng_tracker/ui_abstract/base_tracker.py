@@ -1,10 +1,11 @@
 import re
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections.abc import Container
 from dataclasses import dataclass, field
 
 from ..configs import REGEX_NEVER_MATCH, UITagConfigs, UIWidgetConfigs
 from ..data.notes import get_notes, save_notes
+from ..events.main import EventRow
 from ..events.parser import EventParser
 from ..events.parsing_functions import USAGE, ParsingFunction, parse_roll
 from .input_widget import InputWidget
@@ -80,51 +81,65 @@ class TrackerUI(ABC):
     def edit_input(self, input_text: str) -> str:
         """Edits the input text to adhere to the parser's syntax."""
 
-    def get_paddings(self,
-                     split_lines: list[list[str]],
-                     ) -> dict[str, dict[int, int]]:
-        paddings: dict[str, dict[int, int]] = defaultdict(dict)
-        for event_name, *line_parts in split_lines:
-            if not line_parts:
+    def get_paddings(self, rows: list[EventRow]) -> dict[str, list[int]]:
+        paddings: dict[str, list[int]] = {}
+        for row in rows:
+            if not row.columns:
                 continue
-            event_paddings = paddings[event_name]
-            for i, line_part in enumerate(line_parts):
-                event_paddings[i] = max(
-                    event_paddings.get(i, 0), len(line_part))
+            event_paddings = paddings.setdefault(row.name, [])
+            for i, column in enumerate(row.columns):
+                if i == len(event_paddings):
+                    event_paddings.append(len(column))
+                elif len(column) > event_paddings[i]:
+                    event_paddings[i] = len(column)
         return paddings
 
-    def pad_output(self, output: str) -> str:
-        split_lines: list[list[str]] = []
-        for line in output.splitlines():
-            if ':' not in line:
-                split_lines.append([line])
-                continue
-            event_name, rest = line.split(':', 1)
-            if not rest:
-                split_lines.append([line])
-                continue
-            split_lines.append([event_name] + rest.split('|'))
-        paddings = self.get_paddings(split_lines)
+    def format_rows(self,
+                    rows: list[EventRow],
+                    padding: bool,
+                    unnamed_events: Container[str] = (),
+                    ) -> list[str]:
+        """Converts the rows to lines of text.
+
+        If padding is set to True the columns are padded to the width
+        of the widest column of the same event. The name is omitted
+        for the events in unnamed_events.
+        """
+        paddings = self.get_paddings(rows) if padding else {}
         lines = []
-        for event_name, *line_parts in split_lines:
-            if not line_parts:
-                lines.append(event_name)
+        for row in rows:
+            if not row.columns:
+                lines.append(row.name)
                 continue
-            if event_name not in paddings:
-                lines.append(f'{event_name}:{'|'.join(line_parts)}')
-                continue
-            parts = []
-            for i, line_part in enumerate(line_parts):
-                parts.append(f'{line_part:{paddings[event_name][i]}}')
-            lines.append(f'{event_name}:{'|'.join(parts)}'.rstrip())
-        return '\n'.join(lines)
+            if padding:
+                event_paddings = paddings[row.name]
+                line = '|'.join([c.ljust(event_paddings[i])
+                                 for i, c in enumerate(row.columns)]
+                                ).rstrip()
+            else:
+                line = '|'.join(row.columns)
+            if row.name in unnamed_events:
+                lines.append(line.removeprefix(' '))
+            else:
+                lines.append(f'{row.name}:{line}')
+        return lines
+
+    def get_visible_rows(self, rows: list[EventRow]) -> list[EventRow]:
+        """Returns the rows after the last "///" command."""
+        for index in range(len(rows) - 1, -1, -1):
+            row = rows[index]
+            if (row.name == 'Command' and row.columns
+                    and row.columns[0].startswith(' ///')):
+                return rows[index + 1:]
+        return rows
 
     @abstractmethod
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        """Edits the output before being sent to the output widget.
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        """Converts the rows of output to the text sent
+        to the output widget.
 
-        If padding is set to True the method pad_output might be called
-        with output as the parameter
+        If padding is set to True the method format_rows might be
+        called with padding set to True
         """
 
     def callback(self) -> None:
@@ -140,10 +155,9 @@ class TrackerUI(ABC):
             edited_output = self.previous_edited_output
         else:
             self.previous_edited_input = edited_input
-            self.parser.gamestate.reset()
-            output = self.parser.parse_to_string(edited_input)
-            padding = 'Command: /nopadding\n' not in output
-            edited_output = self.edit_output(output, padding)
+            rows = self.parser.reparse_to_rows(edited_input)
+            padding = NO_PADDING_ROW not in rows[:-1]
+            edited_output = self.edit_output(rows, padding)
             self.previous_edited_output = edited_output
         self.output_widget.print_output(edited_output)
 
@@ -175,3 +189,9 @@ class TrackerUI(ABC):
         else:
             self.warning_popup.print_output(
                 f'File "{seed}_{self.notes_file}" saved successfully!')
+
+
+# row of the command that disables the padding of the output
+NO_PADDING_ROW = EventRow('Command', (' /nopadding', ))
+# names of the rows of the encounter events
+ENCOUNTER_ROWS_NAMES = ('Encounter', 'Random Encounter', 'Simulated Encounter')
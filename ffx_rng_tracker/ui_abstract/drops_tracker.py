@@ -1,4 +1,5 @@
 from ..data.monsters import get_monsters_dict
+from ..events.main import EventRow
 from ..events.parsing_functions import (ParsingFunction, parse_bribe,
                                         parse_character_ap, parse_death,
                                         parse_inventory_command, parse_kill,
@@ -37,21 +38,14 @@ class DropsTracker(TrackerUI):
             input_lines[index] = line
         return '\n'.join(input_lines)
 
-    def get_paddings(self,
-                     split_lines: list[list[str]]
-                     ) -> dict[str, dict[int, int]]:
-        paddings = super().get_paddings(split_lines)
+    def get_paddings(self, rows: list[EventRow]) -> dict[str, list[int]]:
+        paddings = super().get_paddings(rows)
         if 'Steal' in paddings and 'Drops' in paddings:
             padding = max(paddings['Steal'][0], paddings['Drops'][0])
             paddings['Steal'][0] = padding
             paddings['Drops'][0] = padding + 7
         return paddings
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        # if the text contains /// it hides the lines before it
-        if output.find('Command: ///') >= 0:
-            output = output.split('Command: ///')[-1]
-            output = output[output.find('\n') + 1:]
-        if padding:
-            output = self.pad_output(output)
-        return output.replace('Drops: ', '')
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        rows = self.get_visible_rows(rows)
+        return '\n'.join(self.format_rows(rows, padding, ('Drops', )))
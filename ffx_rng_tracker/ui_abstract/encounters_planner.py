@@ -2,7 +2,10 @@ import re
 from dataclasses import dataclass
 
 from ..configs import REGEX_NEVER_MATCH, UITagConfigs
-from ..data.monsters import get_monsters_dict
+from ..data.monsters import Monster
+from ..events.encounter import (Encounter, EncounterRow,
+                                MultizoneRandomEncounter)
+from ..events.main import EventRow
 from .encounters_tracker import EncountersTracker
 
 
@@ -19,51 +22,50 @@ class EncountersPlanner(EncountersTracker):
     def get_default_input_data(self) -> str:
         return ''
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        output = output.replace('Simulated ', '')
-        # TODO
-        # find a way to find conflicting monster names
-        # instead of hardcoding them
-        conflicting_monster_names = (
-            'Chimera Brain', 'Master Coeurl', 'Master Tonberry',
-            'Great Malboro', 'Behemoth King', 'Gemini#3',
-            )
-        for name in conflicting_monster_names:
-            output = output.replace(name, name.upper())
-
-        monsters_tally = {}
-        for monster in get_monsters_dict().values():
-            name = monster.name
-            if name in conflicting_monster_names:
-                name = name.upper()
-            index = 0
-            while True:
-                try:
-                    index_1 = output.index(f', {name}', index)
-                except ValueError:
-                    index_1 = len(output) + 1
-                try:
-                    index_2 = output.index(f'| {name}', index)
-                except ValueError:
-                    index_2 = len(output) + 1
-                index = min(index_1, index_2)
-                if index > len(output):
-                    break
-                tally = monsters_tally.get(name, 0) + 1
-                monsters_tally[name] = tally
-                index += len(name) + 2
-                output = f'{output[:index]}{{{tally}}}{output[index:]}'
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        # number of times each monster was encountered, variants
+        # of the same monster (e.g. Piranha#2) are counted together
+        # unless they are in SEPARATELY_TALLIED_MONSTERS
+        monsters_tally: dict[str, int] = {}
+        # the encounters hidden behind a "///" are counted too
+        for event in self.parser.hidden_events:
+            if not isinstance(event, (Encounter, MultizoneRandomEncounter)):
+                continue
+            for formation, _ in event.get_formations():
+                for monster in formation.monsters:
+                    name = get_tally_name(monster)
+                    monsters_tally[name] = monsters_tally.get(name, 0) + 1
+        edited_rows = []
+        for row in rows:
+            if not isinstance(row, EncounterRow):
+                edited_rows.append(row)
+                continue
+            columns = list(row.columns)
+            for index, (formation, condition) in enumerate(row.formations, 2):
+                monsters = []
+                for monster in formation.monsters:
+                    name = get_tally_name(monster)
+                    tally = monsters_tally.get(name, 0) + 1
+                    monsters_tally[name] = tally
+                    monsters.append(
+                        f'{name}{{{tally}}}{monster.name[len(name):]}')
+                columns[index] = f' {', '.join(monsters) or '-'} {condition} '
+            name = row.name
+            if name == 'Simulated Encounter':
+                name = 'Encounter'
+            edited_rows.append(EventRow(name, tuple(columns)))
 
         captured_monsters = [re.escape(m)
                              for m, t in monsters_tally.items()
                              if t >= 10]
         tag = self.output_widget.tags['#captured monsters']
         if captured_monsters:
-            pattern = '|'.join(captured_monsters)
+            # only matches the names followed by their tally
+            pattern = f'(?:{'|'.join(captured_monsters)})(?={{)'
             tag.regex_pattern = re.compile(pattern, flags=re.IGNORECASE)
         else:
             tag.regex_pattern = REGEX_NEVER_MATCH
-        return super().edit_output(output, padding)
+        return super().edit_output(edited_rows, padding)
 
     def search_callback(self) -> None:
         search = self.search_bar.get_input()
@@ -79,3 +81,15 @@ class EncountersPlanner(EncountersTracker):
         pattern = '|'.join([re.escape(w) for w in words])
         tag.regex_pattern = re.compile(pattern, flags=re.IGNORECASE)
         self.output_widget.highlight_pattern('#search bar', tag.regex_pattern)
+
+
+def get_tally_name(monster: Monster) -> str:
+    """Returns the name the monster is counted as in the tally."""
+    if monster.name in SEPARATELY_TALLIED_MONSTERS:
+        return monster.name
+    return monster.name.split('#')[0]
+
+
+# variants that are counted separately from the other monsters
+# with the same name, Gemini#3 is encountered together with Gemini
+SEPARATELY_TALLIED_MONSTERS = ('Gemini#3', )
@@ -2,6 +2,7 @@ import re
 from dataclasses import dataclass
 
 from ..configs import REGEX_NEVER_MATCH
+from ..events.main import EventRow
 from .encounters_tracker import EncountersTracker
 
 
@@ -11,46 +12,41 @@ class EncountersTable(EncountersTracker):
     def get_default_input_data(self) -> str:
         return ''
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        # if the text contains /// it hides the lines before it
-        if output.find('Command: ///') >= 0:
-            output = output.split('Command: ///')[-1]
-            output = output[output.find('\n') + 1:]
-        if not output:
-            return output
-        output_lines = output.splitlines()
-        zones = output_lines[0].split(' | ')[1].split('/')
-        for index, line in enumerate(output_lines):
-            parts = line.split(' | ')
-            # remove icvs
-            parts.pop()
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        rows = [r for r in self.get_visible_rows(rows) if r.columns]
+        if not rows:
+            return ''
+        zones = rows[0].columns[1].strip().split('/')
+        edited_rows = [EventRow(
+            'Random Encounter',
+            (' ', ' Condition ', *[f' {z} ' for z in zones[:-1]],
+             f' {zones[-1]}'),
+            )]
+        for row in rows:
+            # remove zone names and icvs
+            index, _, *formations, _ = row.columns
+            # remove the space that separated the icvs
+            formations[-1] = formations[-1][:-1]
             # replace zones with encounter condition
             # some encounters force a particular condition so it's possible
             # to get different ones in different zones
-            parts[1] = ''
-            if 'Ambush' in line:
-                parts[1] += '$amb'
-            if 'Preemptive' in line:
-                if parts[1]:
-                    parts[1] += '/'
-                parts[1] += '$pre'
-            if parts[1] and 'Normal' in line:
-                parts[1] += '/$nor'
-            output_lines[index] = ' | '.join(parts)
-        output_lines.insert(
-            0, f'Random Encounter: | Condition | {' | '.join(zones)}')
-        output = ('\n'.join(output_lines)
-                  .replace(' Normal', '')
-                  .replace('Ambush', '')
-                  .replace('Preemptive', '')
-                  .replace('$nor', 'Normal')
-                  .replace('$amb', 'Ambush')
-                  .replace('$pre', 'Preemptive')
-                  )
-        output = self.pad_output(output).replace('Random Encounter: ', '')
-        output_lines = output.splitlines()
-        output_lines.insert(1, '=' * max(len(line) for line in output_lines))
-        return '\n'.join(output_lines)
+            conditions = []
+            for condition in ('Ambush', 'Preemptive'):
+                if any(condition in f for f in formations):
+                    conditions.append(condition)
+            if conditions and any('Normal' in f for f in formations):
+                conditions.append('Normal')
+            formations = [f.replace(' Normal', '')
+                          .replace('Ambush', '')
+                          .replace('Preemptive', '')
+                          for f in formations]
+            edited_rows.append(EventRow(
+                row.name,
+                (index, f' {'/'.join(conditions)} ', *formations),
+                ))
+        lines = self.format_rows(edited_rows, True, ('Random Encounter', ))
+        lines.insert(1, '=' * max(len(line) for line in lines))
+        return '\n'.join(lines)
 
     def search_callback(self) -> None:
         search = self.search_bar.get_input()
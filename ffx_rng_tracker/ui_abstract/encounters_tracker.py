@@ -1,5 +1,6 @@
 from ..data.encounters import get_encounter_notes
 from ..data.notes import save_notes
+from ..events.main import EventRow
 from ..events.parsing_functions import (ParsingFunction, parse_encounter,
                                         parse_encounter_count_change,
                                         parse_equipment_change, parse_roll)
@@ -49,55 +50,52 @@ class EncountersTracker(TrackerUI):
     def edit_input(self, input_text: str) -> str:
         return input_text
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        # if the text contains /// it hides the lines before it
-        if output.find('Command: ///') >= 0:
-            output = output.split('Command: ///')[-1]
-            output = output[output.find('\n') + 1:]
-
-        output_lines = output.splitlines()
-        for index, line in enumerate(output_lines):
+    def get_encounters_rows(self, rows: list[EventRow]) -> list[EventRow]:
+        """Returns the visible rows without empty lines, commands and
+        equipment changes, with every encounter row renamed
+        to "Encounter" and without zone names and icvs.
+        """
+        edited_rows = []
+        for row in self.get_visible_rows(rows):
             # remove information about initiative equipment
-            if line.startswith('Equipment:') or line.startswith('Command:'):
-                output_lines[index] = ''
+            if row.name in ('Equipment', 'Command'):
                 continue
-
-            if (line.startswith('Random Encounter:')
-                    or line.startswith('Simulated Encounter:')):
-                parts = line.split('|')
-                # remove zone name
-                parts.pop(1)
-                # remove icvs
-                parts.pop()
-                line = '|'.join(parts)
-            elif line.startswith('Encounter:'):
-                parts = line.split('|')
+            # remove empty lines
+            if not row.name and not row.columns:
+                continue
+            if row.name in ('Random Encounter', 'Simulated Encounter'):
+                # remove zone name and icvs
+                columns = [row.columns[0], *row.columns[2:-1]]
+            elif row.name == 'Encounter':
                 # remove icvs
-                parts.pop()
-                line = '|'.join(parts)
-            output_lines[index] = line
+                columns = list(row.columns[:-1])
+            else:
+                edited_rows.append(row)
+                continue
+            columns = [c.replace(' Normal', '') for c in columns]
+            # merge the columns of empty formations with the previous one
+            for index in range(len(columns) - 1, 0, -1):
+                if columns[index].startswith(' -'):
+                    columns[index - 1] += columns.pop(index)[2:]
+            edited_rows.append(EventRow('Encounter', tuple(columns)))
+        return edited_rows
+
+    def add_spacers(self, lines: list[str]) -> list[str]:
+        """Adds a spacer before every label after the first line."""
+        if not lines:
+            return lines
+        spacer = '=' * max(len(line) for line in lines)
+        spaced_lines = lines[:1]
+        for line in lines[1:]:
+            if line.startswith('#    '):
+                spaced_lines.append(spacer)
+            spaced_lines.append(line)
+        return spaced_lines
 
-        # the condition removes empty lines
-        output = '\n'.join([line for line in output_lines if line])
-        if not output:
-            return output
-        output = (output
-                  .replace(' Normal', '')
-                  .replace('Random Encounter:', 'Encounter:')
-                  .replace('Simulated Encounter:', 'Encounter:')
-                  .replace('| -', '')
-                  )
-        if padding:
-            output = self.pad_output(output)
-        output = output.replace('Encounter: ', '')
-        output_lines = output.splitlines()
-        output = '\n'.join(output_lines)
-        spacer = f'{'=' * max(len(line) for line in output_lines)}\n'
-        index = 0
-        while (index := output.find('\n#    ', index)) >= 0:
-            output = output[:index + 1] + spacer + output[index + 1:]
-            index += len(spacer) + 2
-        return output
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        rows = self.get_encounters_rows(rows)
+        lines = self.format_rows(rows, padding, ('Encounter', ))
+        return '\n'.join(self.add_spacers(lines))
 
     def save_input_data(self) -> None:
         seed = self.parser.gamestate.seed
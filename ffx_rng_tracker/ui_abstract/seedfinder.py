@@ -1,14 +1,73 @@
+import os
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from itertools import product
+from itertools import islice, product
+from threading import Event
 
 from ..configs import Configs
 from ..data.constants import DamageFormula
 from ..data.seeds import (DAMAGE_VALUES_NEEDED, FRAMES_FROM_BOOT,
-                          POSSIBLE_XORED_DATETIMES, datetime_to_seed)
+                          POSSIBLE_XORED_DATETIMES, SEEDS_ORIGINS_FILE_PATHS,
+                          ProgressCallback, SeedsOrigins, datetime_to_seed,
+                          run_shards, shard_cancelled, split_frames)
 from ..events.character_action import CharacterAction
+from ..events.parser import EventParser, ParsingStep
+from ..gamestate import GameState
+from ..tracker import FFXRNGTracker
 from .actions_tracker import ActionsTracker
 
 
+@dataclass
+class SeedSearch:
+    """Search for the seed where the damaging actions of the steps
+    with line indexes in indexes have damage_values as damage values.
+    """
+    input_text: str
+    steps: list[ParsingStep]
+    indexes: set[int]
+    damage_values: list[int]
+
+    def run(self,
+            processes: int | None = None,
+            progress_callback: ProgressCallback | None = None,
+            cancel_event: Event | None = None,
+            ) -> int | None:
+        """Searches the seed on processes worker processes (one per
+        cpu if None, in this process if 1), returns the first
+        matching seed ordered by frame or None if there isn't one.
+
+        progress_callback is called with the number of shards done
+        and the total number of shards every time a shard is done,
+        setting cancel_event stops the search and raises
+        SeedSearchCancelledError.
+        """
+        date_times = POSSIBLE_XORED_DATETIMES[Configs.game_version]
+        frames = FRAMES_FROM_BOOT[Configs.game_version]
+        origins_file_path = SEEDS_ORIGINS_FILE_PATHS[Configs.game_version]
+        if not os.path.exists(origins_file_path):
+            origins_file_path = None
+        shards = [
+            (self.steps, self.indexes, self.damage_values, date_times, f,
+             origins_file_path)
+            for f in split_frames(0, frames, SEEDFINDER_SHARD_FRAMES)
+            ]
+        shards_seeds: dict[range, int | None] = {}
+        results = run_shards(_find_seed_shard, shards, processes, cancel_event)
+        for done, (shard, seed) in enumerate(results, 1):
+            if progress_callback is not None:
+                progress_callback(done, len(shards))
+            shards_seeds[shard[4]] = seed
+            # a seed can be returned only when
+            # all the shards before its own are done
+            for *_, shard_frames, _ in shards:
+                if shard_frames not in shards_seeds:
+                    break
+                if shards_seeds[shard_frames] is not None:
+                    results.close()
+                    return shards_seeds[shard_frames]
+        return None
+
+
 @dataclass
 class SeedFinder(ActionsTracker):
 
@@ -19,10 +78,23 @@ class SeedFinder(ActionsTracker):
         return input_data
 
     def find_seed(self) -> None:
+        """Searches the seed and shows the result, the search
+        can be done in another thread by calling prepare_search
+        and show_search_result separately.
+        """
+        search = self.prepare_search()
+        if search is not None:
+            self.show_search_result(search, search.run())
+
+    def prepare_search(self) -> SeedSearch | None:
+        """Parses the input and returns the search for the seed,
+        returns None and shows a warning if the input is not valid.
+        """
         # first 2 lines are always input dvs and "///"
         input_dvs, _, *input_lines = self.input_widget.get_input().splitlines()
         input_text = '\n'.join(input_lines)
         edited_input_text = self.edit_input(input_text)
+        self.parser.gamestate.reset()
         events = self.parser.parse(edited_input_text)
 
         indexes = []
@@ -36,7 +108,7 @@ class SeedFinder(ActionsTracker):
         if len(indexes) < damage_values_needed:
             self.warning_popup.print_output(
                 f'Need {damage_values_needed} damaging actions.')
-            return
+            return None
 
         for symbol in (',', '-', '/', '\\', '.'):
             input_dvs = input_dvs.replace(symbol, ' ')
@@ -47,36 +119,121 @@ class SeedFinder(ActionsTracker):
             error = str(error).split(':', 1)[1]
             self.warning_popup.print_output(
                 f'{error} is not a valid damage value.')
-            return
+            return None
 
         if len(input_dvs) < len(indexes):
             self.warning_popup.print_output(
                 f'Need {len(indexes)} damage values.')
-            return
+            return None
 
         input_dvs = input_dvs[:len(indexes)]
 
-        damage_values = []
-        date_times = POSSIBLE_XORED_DATETIMES[Configs.game_version]
-        frames = FRAMES_FROM_BOOT[Configs.game_version]
-        already_tested_seeds = set()
-        for frame, dt in product(range(frames), date_times):
-            seed = datetime_to_seed(dt, frame)
-            if seed in already_tested_seeds:
+        # the lines after the last damaging action don't matter
+        steps = [s for s in self.parser.compile(edited_input_text)
+                 if s.line_index <= indexes[-1]]
+        return SeedSearch(input_text, steps, set(indexes), input_dvs)
+
+    def show_search_result(self,
+                           search: SeedSearch,
+                           seed: int | None,
+                           ) -> None:
+        if seed is None:
+            self.warning_popup.print_output('Seed not found!')
+            return
+        self.input_widget.set_input(
+            f'# Seed number: {seed}\n{search.input_text}')
+        self.warning_popup.print_output(f'Seed: {seed}')
+        self.change_seed(seed, reload_notes=False)
+
+
+def find_matching_seed(parser: EventParser,
+                       steps: list[ParsingStep],
+                       indexes: set[int],
+                       damage_values: list[int],
+                       seeds: Iterable[int],
+                       ) -> int | None:
+    """Executes the steps for every seed and returns the first one
+    where the damage values of the actions of the steps with line
+    indexes in indexes are damage_values, returns None if none of
+    the seeds matches.
+
+    The steps of a seed stop being executed at the first
+    damage value that doesn't match.
+    """
+    gamestate = parser.gamestate
+    gamestate.reset()
+    # restoring the state after a reset is faster than resetting
+    initial_state = gamestate.snapshot()
+    for seed in seeds:
+        gamestate.seed = seed
+        gamestate.restore(initial_state)
+        seed_damage_values = []
+        for step, event in parser.execute(steps):
+            if step.line_index not in indexes:
                 continue
-            already_tested_seeds.add(seed)
-            self.parser.gamestate.seed = seed
-            self.parser.gamestate.reset()
-            events = self.parser.parse(edited_input_text)
-            damage_values.clear()
-            for index in indexes:
-                event: CharacterAction = events[index]
-                damage_values.extend(r.hp.damage for r in event.results)
-            if damage_values == input_dvs:
-                self.input_widget.set_input(
-                    f'# Seed number: {seed}\n{input_text}')
-                self.warning_popup.print_output(f'Seed: {seed}')
-                self.callback()
+            seed_damage_values.extend(r.hp.damage for r in event.results)
+            if seed_damage_values != damage_values[:len(seed_damage_values)]:
                 break
         else:
-            self.warning_popup.print_output('Seed not found!')
+            if seed_damage_values == damage_values:
+                return seed
+    return None
+
+
+def _get_seeds(date_times: list[int],
+               frames: range,
+               seeds_origins: SeedsOrigins | None = None,
+               ) -> Iterator[int]:
+    """yields the seeds of every combination of frames
+    and date_times once, ordered by frame
+
+    with seeds_origins the seeds that are produced by an earlier
+    frame, even outside of frames, are left out
+    """
+    already_tested_seeds = set()
+    for frame, dt in product(frames, date_times):
+        seed = datetime_to_seed(dt, frame)
+        if seeds_origins is not None:
+            origin = seeds_origins.get_origin(seed)
+            if origin is not None and origin != (frame, dt):
+                continue
+        else:
+            if seed in already_tested_seeds:
+                continue
+            already_tested_seeds.add(seed)
+        yield seed
+
+
+def _find_seed_shard(steps: list[ParsingStep],
+                     indexes: set[int],
+                     damage_values: list[int],
+                     date_times: list[int],
+                     frames: range,
+                     origins_file_path: str | None,
+                     ) -> int | None:
+    """Searches the seed in the frames range with a new parser,
+    used by SeedSearch.run in worker processes.
+    """
+    parser = EventParser(GameState(FFXRNGTracker(0)))
+    seeds_origins = None
+    if origins_file_path is not None:
+        seeds_origins = SeedsOrigins(origins_file_path)
+    try:
+        seeds = _get_seeds(date_times, frames, seeds_origins)
+        while batch := list(islice(seeds, SEEDFINDER_BATCH_SIZE)):
+            if shard_cancelled():
+                return None
+            seed = find_matching_seed(
+                parser, steps, indexes, damage_values, batch)
+            if seed is not None:
+                return seed
+        return None
+    finally:
+        if seeds_origins is not None:
+            seeds_origins.close()
+
+
+# number of frames searched by each worker process task of SeedSearch.run
+SEEDFINDER_SHARD_FRAMES = 60
+# number of seeds tested between checks for cancellation
+SEEDFINDER_BATCH_SIZE = 256
@@ -1,5 +1,6 @@
 from ..data.encounters import get_steps_notes
 from ..data.notes import save_notes
+from ..events.main import EventRow
 from ..events.parsing_functions import ParsingFunction, parse_encounter_checks
 from ..ui_abstract.encounters_tracker import EncountersTracker
 
@@ -25,18 +26,19 @@ class StepsTracker(EncountersTracker):
         ]
         return parsing_functions
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        output = (super().edit_output(output, False)
-                  .replace('Encounters', '')
-                  .replace(' steps before end of the zone', ''))
-        output = ('Encounter checks: Zone (grace period) | # of Encounters'
-                  f' | Trigger Steps | Steps before end of the Zone\n{output}'
-                  )
-        if padding:
-            output = self.pad_output(output)
-        output_lines = output.replace('Encounter checks: ', '').splitlines()
-        output_lines.insert(1, '=' * len(output_lines[0]))
-        return '\n'.join(output_lines)
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        edited_rows = [STEPS_HEADER_ROW]
+        for row in self.get_encounters_rows(rows):
+            if row.name == 'Encounter checks':
+                zone, encounters, steps, distance = row.columns
+                encounters = encounters.replace('Encounters', '')
+                distance = distance.replace(
+                    ' steps before end of the zone', '')
+                row = EventRow(row.name, (zone, encounters, steps, distance))
+            edited_rows.append(row)
+        header, *lines = self.format_rows(
+            edited_rows, padding, ('Encounter checks', 'Encounter'))
+        return '\n'.join([header, '=' * len(header), *self.add_spacers(lines)])
 
     def save_input_data(self) -> None:
         seed = self.parser.gamestate.seed
@@ -79,3 +81,11 @@ class StepsTracker(EncountersTracker):
         else:
             self.warning_popup.print_output(
                 f'File "{seed}_{self.notes_file}" saved successfully!')
+
+
+# first row of the output, with the names of the columns
+STEPS_HEADER_ROW = EventRow(
+    'Encounter checks',
+    (' Zone (grace period) ', ' # of Encounters ', ' Trigger Steps ',
+     ' Steps before end of the Zone'),
+    )
@@ -1,4 +1,5 @@
 from ..data.actions import YOJIMBO_ACTIONS
+from ..events.main import EventRow
 from ..events.parsing_functions import (ParsingFunction,
                                         parse_compatibility_update,
                                         parse_death, parse_roll,
@@ -44,9 +45,5 @@ class YojimboTracker(TrackerUI):
             input_lines[index] = line
         return '\n'.join(input_lines)
 
-    def edit_output(self, output: str, padding: bool = False) -> str:
-        # if the text contains /// it hides the lines before it
-        if output.find('Command: ///') >= 0:
-            output = output.split('Command: ///')[-1]
-            output = output[output.find('\n') + 1:]
-        return output
+    def edit_output(self, rows: list[EventRow], padding: bool = False) -> str:
+        return '\n'.join([str(row) for row in self.get_visible_rows(rows)])
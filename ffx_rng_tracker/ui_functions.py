@@ -1,13 +1,16 @@
+from collections.abc import Iterable
 from itertools import batched, chain
 
 from .data.actor import CharacterActor, MonsterActor
-from .data.constants import Character, EquipmentType, KillType, Stat
+from .data.constants import (Character, EncounterCondition, EquipmentType,
+                             KillType, Stat)
+from .data.encounter_formations import BOSSES, SIMULATIONS, ZONES, Formation
 from .data.monsters import Monster
-from .tracker import FFXRNGTracker
+from .tracker import BatchRNGTracker, FFXRNGTracker
 
 
-def get_equipment_types(seed: int, amount: int, columns: int = 2) -> str:
-    """Returns a table formatted string with equipment types information."""
+def calculate_equipment_types(seed: int, amount: int) -> list[EquipmentType]:
+    """Returns the types of the first amount equipment drops."""
     rng_tracker = FFXRNGTracker(seed)
     equipment_types = []
     for i in range(amount):
@@ -20,6 +23,81 @@ def get_equipment_types(seed: int, amount: int, columns: int = 2) -> str:
         else:
             equipment_type = EquipmentType.ARMOR
         equipment_types.append(equipment_type)
+    return equipment_types
+
+
+def calculate_batch_equipment_types(seeds: Iterable[int],
+                                    amount: int,
+                                    ) -> list[list[EquipmentType]]:
+    """Returns the types of the first amount equipment drops
+    of every seed, in the same order as seeds.
+    """
+    batch_tracker = BatchRNGTracker(seeds)
+    seeds_equipment_types = [[] for _ in batch_tracker.seeds]
+    for _ in range(amount):
+        batch_tracker.advance_rng(12)
+        rng_weapon_or_armor = batch_tracker.advance_rng(12)
+        batch_tracker.advance_rng(12)
+        batch_tracker.advance_rng(12)
+        for equipment_types, rng_value in zip(
+                seeds_equipment_types, rng_weapon_or_armor):
+            if rng_value & 1 == 0:
+                equipment_types.append(EquipmentType.WEAPON)
+            else:
+                equipment_types.append(EquipmentType.ARMOR)
+    return seeds_equipment_types
+
+
+def calculate_batch_status_chances(seeds: Iterable[int],
+                                   amount: int,
+                                   ) -> list[list[tuple[int, ...]]]:
+    """Returns the first amount status chance rolls of every seed,
+    in the same order as seeds, every roll has the chances
+    of the 7 characters, the aeons and the 8 monster slots.
+    """
+    batch_tracker = BatchRNGTracker(seeds)
+    slots_rows = [[batch_tracker.advance_rng(rng_index)
+                   for _ in range(amount)]
+                  for rng_index in range(52, 68)]
+    status_chances = []
+    for seed_index in range(len(batch_tracker.seeds)):
+        status_chances.append(
+            [tuple(row[seed_index] % 101 for row in rows)
+             for rows in zip(*slots_rows)])
+    return status_chances
+
+
+def calculate_batch_encounters(
+        seeds: Iterable[int],
+        names: Iterable[str],
+        initiative: bool = False,
+        ) -> list[list[tuple[Formation, EncounterCondition]]]:
+    """Returns the formations and conditions of the encounters
+    with the names used by the encounter command (bosses,
+    simulations or zones) of every seed, in the same order as seeds.
+    """
+    batch_tracker = BatchRNGTracker(seeds)
+    seeds_encounters = [[] for _ in batch_tracker.seeds]
+    for name in names:
+        if name in ZONES:
+            zone = ZONES[name]
+            formations = [zone.get_formation(v)
+                          for v in batch_tracker.advance_rng(1)]
+        elif name in SIMULATIONS:
+            formations = [SIMULATIONS[name].monsters] * len(seeds_encounters)
+        else:
+            formations = [BOSSES[name].formation] * len(seeds_encounters)
+        for encounters, formation, condition_rng in zip(
+                seeds_encounters, formations, batch_tracker.advance_rng(1)):
+            condition = formation.get_condition(condition_rng & 255,
+                                                initiative)
+            encounters.append((formation, condition))
+    return seeds_encounters
+
+
+def get_equipment_types(seed: int, amount: int, columns: int = 2) -> str:
+    """Returns a table formatted string with equipment types information."""
+    equipment_types = calculate_equipment_types(seed, amount)
 
     spacer = ('-' * ((14 + len(str(amount))) * columns + 1)) + '\n'
     data = f'First {amount} Equipment Types\n{spacer}'
@@ -39,7 +117,7 @@ def get_status_chance_table(seed: int, amount: int) -> str:
     """Returns a table-formatted string of the status
     chance rng rolls for party members and monsters.
     """
-    rng_tracker = FFXRNGTracker(seed)
+    status_chances, = calculate_batch_status_chances([seed], amount)
     digits = len(str(amount))
     columns = (
         f'Roll [{'#' * digits}]', 'Tidus', 'Yuna', 'Auron', 'Kimahri', 'Wakka',
@@ -50,10 +128,10 @@ def get_status_chance_table(seed: int, amount: int) -> str:
     spacer = '-' * len(header)
     data = (f'First {amount} Status Rolls for each Character/Monster Slot\n'
             f'{spacer}\n{header}\n{spacer}\n')
-    for i in range(amount):
+    for i, chances in enumerate(status_chances):
         data += f'| Roll [{i + 1:>{digits}}]'
-        for j, title in zip(range(52, 68), columns[1:]):
-            data += f'| {rng_tracker.advance_rng(j) % 101:>{len(title)}}'
+        for chance, title in zip(chances, columns[1:]):
+            data += f'| {chance:>{len(title)}}'
         data += '|\n'
     data += spacer
     return data
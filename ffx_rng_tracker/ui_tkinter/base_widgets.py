@@ -196,6 +196,56 @@ class BetterScale(ttk.Scale):
         create_command_proxy(self, {'set'}, callback_func)
 
 
+class ProgressFrame(ttk.Frame):
+    """Frame with a Label, a Progressbar and a Cancel button
+    used to show the progress of work done in another thread.
+
+    report can be called from any thread, the widgets are
+    updated when refresh is called, the Progressbar is
+    indeterminate until the first report.
+    """
+
+    def __init__(self,
+                 parent,
+                 text: str,
+                 cancel_command: Callable[[], None],
+                 *args,
+                 **kwargs,
+                 ) -> None:
+        super().__init__(parent, *args, **kwargs)
+        self.text = text
+        self.progress: tuple[int, int] | None = None
+        self.label = ttk.Label(self, text=text)
+        self.label.pack(side='left')
+        self.progress_bar = ttk.Progressbar(self, length=300, maximum=1)
+        self.progress_bar.pack(side='left', padx=5)
+        self.cancel_button = ttk.Button(
+            self, text='Cancel', command=cancel_command)
+        self.cancel_button.pack(side='left')
+
+    def report(self, done: int, total: int) -> None:
+        self.progress = done, total
+
+    def refresh(self) -> None:
+        if self.progress is None:
+            if str(self.progress_bar['mode']) != 'indeterminate':
+                self.progress_bar.config(mode='indeterminate')
+                self.progress_bar.start()
+            return
+        done, total = self.progress
+        self.label.config(text=f'{self.text} ({done}/{total})')
+        if str(self.progress_bar['mode']) != 'determinate':
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate')
+        self.progress_bar.config(value=done / total)
+
+    def reset(self) -> None:
+        self.progress = None
+        self.progress_bar.stop()
+        self.progress_bar.config(mode='determinate', value=0)
+        self.label.config(text=self.text)
+
+
 class TkWarningPopup:
 
     def print_output(self, output: str) -> None:
@@ -64,3 +64,5 @@ def main(*,
             callback_func(Configs.seed, True)
 
     root.mainloop()
+    # destroying the widgets stops the work running in other threads
+    root.destroy()
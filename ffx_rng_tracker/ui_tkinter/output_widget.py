@@ -1,8 +1,131 @@
+import re
+from collections.abc import Container
+
 from ..configs import Configs, UITagConfigs
 from .base_widgets import ScrollableText
 from .tkinter_utils import get_default_font
 
 
+class PatternsScanner:
+    """Finds the matches of several patterns in a line with
+    a single combined pattern, the matches are the same that
+    finditer would find with each pattern on its own.
+
+    The matches are cached per line.
+    """
+
+    def __init__(self, patterns: dict[str, re.Pattern]) -> None:
+        self.patterns = patterns
+        # names and scoped patterns with their number of groups
+        self._names: list[str] = []
+        self._parts: list[tuple[str, int]] = []
+        # patterns that can't be combined are scanned on their own
+        self._separate: list[tuple[str, re.Pattern]] = []
+        for name, pattern in patterns.items():
+            part = get_scoped_pattern(pattern)
+            if part is None:
+                self._separate.append((name, pattern))
+                continue
+            self._names.append(name)
+            self._parts.append((part, pattern.groups))
+        self._scanners: dict[int, tuple[re.Pattern, dict[int, int]]] = {}
+        self._cache: dict[str, list[tuple[str, int, int]]] = {}
+
+    def get_spans(self, line: str) -> list[tuple[str, int, int]]:
+        """Returns the name, start and end of the non-empty
+        matches of the patterns in the line.
+        """
+        spans = self._cache.get(line)
+        if spans is None:
+            spans = self._scan(line)
+            if len(self._cache) >= SCANNER_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[line] = spans
+        return spans
+
+    def _get_scanner(self, first: int) -> tuple[re.Pattern, dict[int, int]]:
+        """Returns the combined pattern of the parts starting
+        from first and the indexes of the parts by group number.
+
+        The combined pattern matches without consuming characters
+        where any of the parts matches, every part is followed by
+        an empty group so that the last matched group is the one
+        of the first part that matched and its start is the end
+        of the match of the part.
+        """
+        scanner = self._scanners.get(first)
+        if scanner is None:
+            alternatives: list[str] = []
+            indexes: dict[int, int] = {}
+            group = 0
+            for index in range(first, len(self._parts)):
+                part, groups = self._parts[index]
+                alternatives.append(f'{part}()')
+                group += groups + 1
+                indexes[group] = index
+            pattern = re.compile(f'(?={'|'.join(alternatives)})')
+            scanner = self._scanners[first] = pattern, indexes
+        return scanner
+
+    def _scan(self, line: str) -> list[tuple[str, int, int]]:
+        spans: list[tuple[str, int, int]] = []
+        separate = self._separate
+        if self._parts:
+            # like finditer a match of a pattern can't start
+            # before the end of its previous match
+            next_starts = [0] * len(self._parts)
+            last_index = len(self._parts) - 1
+            # after an empty match finditer looks for a non-empty
+            # match at the same position, those parts are scanned
+            # on their own
+            empty_matches: set[int] = set()
+            scanner, indexes = self._get_scanner(0)
+            for match in scanner.finditer(line):
+                start = match.start()
+                while True:
+                    group = match.lastindex
+                    index = indexes[group]
+                    end = match.start(group)
+                    if end == start:
+                        empty_matches.add(index)
+                    elif start >= next_starts[index]:
+                        spans.append((self._names[index], start, end))
+                        next_starts[index] = end
+                    if index == last_index:
+                        break
+                    # look for the other parts matching at start
+                    next_scanner, indexes = self._get_scanner(index + 1)
+                    match = next_scanner.match(line, start)
+                    if match is None:
+                        break
+                indexes = self._scanners[0][1]
+            if empty_matches:
+                names = [self._names[i] for i in sorted(empty_matches)]
+                spans = [s for s in spans if s[0] not in names]
+                separate = separate + [(n, self.patterns[n]) for n in names]
+        for name, pattern in separate:
+            for match in pattern.finditer(line):
+                start, end = match.span()
+                if end > start:
+                    spans.append((name, start, end))
+        return spans
+
+
+def get_scoped_pattern(pattern: re.Pattern) -> str | None:
+    """Returns the pattern as a non-capturing group with its flags,
+    None if it can't be part of a combined pattern.
+    """
+    if pattern.groupindex or GROUP_REFERENCE.search(pattern.pattern):
+        return None
+    flags = ''.join(c for c, f in SCOPED_FLAGS.items() if pattern.flags & f)
+    part = f'(?{flags}:{pattern.pattern})'
+    try:
+        re.compile(part)
+    except re.error:
+        return None
+    return part
+
+
 class TkOutputWidget(ScrollableText):
 
     def __init__(self, parent, *args, **kwargs) -> None:
@@ -12,15 +135,103 @@ class TkOutputWidget(ScrollableText):
         super().__init__(parent, *args, **kwargs)
         self.text.tag_configure('wrap margin', lmargin2='1c')
         self.tags: dict[str, UITagConfigs] = {}
+        # lines of the last print_output call
+        self._lines = ['']
+        self._scanner = PatternsScanner({})
 
     def print_output(self, output: str) -> None:
+        """Replaces and highlights only the lines that changed
+        since the last call, the tags whose pattern changed
+        are highlighted again in the whole text.
+        """
+        old_lines = self._lines
+        lines = output.split('\n')
+        self._lines = lines
+        # number of unchanged lines at the start and at the end
+        start = 0
+        max_start = min(len(old_lines), len(lines))
+        while start < max_start and old_lines[start] == lines[start]:
+            start += 1
+        end = 0
+        max_end = max_start - start
+        while end < max_end and old_lines[-1 - end] == lines[-1 - end]:
+            end += 1
+        changed_lines = lines[start:len(lines) - end]
+        changed = len(old_lines) != len(lines) or bool(changed_lines)
+
         self.text.config(state='normal')
-        self.set(output)
-        self.text.tag_add('wrap margin', '1.0', 'end')
-        for name, tag in self.tags.items():
-            self.highlight_pattern(name, tag.regex_pattern, output)
+        if changed:
+            self._replace_lines(old_lines, start, end, changed_lines)
+        patterns = {name: tag.regex_pattern
+                    for name, tag in self.tags.items()}
+        changed_patterns = {name: pattern
+                            for name, pattern in patterns.items()
+                            if self._scanner.patterns.get(name) != pattern}
+        if changed_patterns:
+            for name in changed_patterns:
+                self.clean_tag(name)
+            self._highlight_lines(PatternsScanner(changed_patterns), lines, 1)
+            self._scanner = PatternsScanner(patterns)
+        if changed_lines:
+            self._highlight_lines(
+                self._scanner, changed_lines, start + 1, changed_patterns)
         self.text.config(state='disabled')
 
+    def _highlight_lines(self,
+                         scanner: PatternsScanner,
+                         lines: list[str],
+                         first_line: int,
+                         skipped_tags: Container[str] = (),
+                         ) -> None:
+        """Applies the tags of the scanner to the lines,
+        first_line is the number of the first of the lines.
+        """
+        spans: dict[str, list[str]] = {n: [] for n in scanner.patterns}
+        for i, line in enumerate(lines, first_line):
+            for name, start, end in scanner.get_spans(line):
+                spans[name].extend((f'{i}.{start}', f'{i}.{end}'))
+        for name, tag_spans in spans.items():
+            if tag_spans and name not in skipped_tags:
+                self.text.tag_add(name, *tag_spans)
+
+    def _replace_lines(self,
+                       old_lines: list[str],
+                       start: int,
+                       end: int,
+                       lines: list[str],
+                       ) -> None:
+        """Replaces the old lines between the first start lines
+        and the last end lines and scrolls back to the previous
+        position.
+        """
+        current_number_of_lines = len(old_lines) - (old_lines[-1] == '')
+        last_line = self.text.index(f'@0,{self.winfo_height()}')
+        line_index = int(last_line.split('.')[0])
+        first_visible = self.text.index('@0,0')
+
+        if end:
+            # the lines are followed by unchanged lines
+            first = f'{start + 1}.0'
+            last = f'{len(old_lines) - end + 1}.0'
+            text = ''.join([f'{line}\n' for line in lines])
+        elif start:
+            # the lines are preceded by unchanged lines
+            first = f'{start}.end'
+            last = 'end - 1 chars'
+            text = ''.join([f'\n{line}' for line in lines])
+        else:
+            first = '1.0'
+            last = 'end - 1 chars'
+            text = '\n'.join(lines)
+        self.text.replace(first, last, text, 'wrap margin')
+
+        # scroll down if the last line of the text was visible
+        # but only if there was at least 1 line
+        if line_index == current_number_of_lines and line_index > 1:
+            self.text.yview_pickplace('end')
+        else:
+            self.text.yview(first_visible)
+
     def clean_tag(self, tag_name: str) -> None:
         self.text.tag_remove(tag_name, '1.0', 'end')
 
@@ -45,3 +256,17 @@ class TkOutputWidget(ScrollableText):
             selectforeground=tag.select_foreground,
             selectbackground=tag.select_background,
             )
+
+
+# numbered backreferences and conditional groups
+GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?\(')
+# flags that can be applied to a part of a pattern
+SCOPED_FLAGS = {
+    'a': re.ASCII,
+    'i': re.IGNORECASE,
+    'm': re.MULTILINE,
+    's': re.DOTALL,
+    'x': re.VERBOSE,
+}
+# maximum number of lines with cached matches
+SCANNER_CACHE_SIZE = 4096
@@ -1,11 +1,18 @@
+import os
 from collections.abc import Callable
+from threading import Event
 from tkinter import ttk
 
 from ..configs import Configs, UIWidgetConfigs
-from ..data.seeds import DAMAGE_VALUES_NEEDED, get_seed_from_string
+from ..data.seeds import (DAMAGE_VALUES_NEEDED, SEEDS_FILE_PATHS,
+                          SeedCandidates, SeedsIndex, get_seed_from_string,
+                          get_seed_origin, parse_damage_values)
 from ..errors import InvalidDamageValueError, SeedNotFoundError
-from ..ui_functions import get_equipment_types, get_status_chance_table
+from ..ui_functions import (calculate_batch_equipment_types,
+                            get_equipment_types, get_status_chance_table)
+from .base_widgets import ProgressFrame
 from .output_widget import TkOutputWidget
+from .tkinter_utils import get_default_font, run_in_thread
 
 
 class TkSeedInfo(ttk.Frame):
@@ -29,7 +36,11 @@ class TkSeedInfo(ttk.Frame):
             text += ('Auron1 Tidus1 A2 T2 A3 T3 A4 A5\n'
                      '(A4 and A5 are the first 2 Auron Attacks '
                      'vs Sinspawn Ammes)\n')
-        text += 'Alternatively input a Seed Number to load that seed directly'
+        text += ('Alternatively input a Seed Number to load that seed '
+                 'directly\nor the encounters since the start of the game '
+                 'separated by ";"\n'
+                 '(e.g. "sinscales; ammes; tanker; ...; underwater_ruins '
+                 'piranha#3 ambush")')
         self.info_label = ttk.Label(self.inner_frame, text=text, justify='center')
         self.info_label.pack()
 
@@ -38,6 +49,7 @@ class TkSeedInfo(ttk.Frame):
             self.entry.insert(0, str(Configs.seed))
         self.entry.pack(fill='x')
         self.entry.bind('<Return>', lambda _: self.validate_input())
+        self.entry.bind('<KeyRelease>', lambda _: self.update_candidates())
 
         self.button = ttk.Button(
             self.inner_frame, text='Submit', command=self.validate_input)
@@ -50,6 +62,17 @@ class TkSeedInfo(ttk.Frame):
 
         self.warning_label = ttk.Label(self)
 
+        self.candidates_label = ttk.Label(
+            self, font=get_default_font())
+        self._candidates: SeedCandidates | None = None
+        self.bind('<Destroy>', lambda _: self.close_seeds_file(), add='+')
+
+        self.progress_frame = ProgressFrame(
+            self, 'Looking up seed...', self.cancel_lookup)
+        self._cancel_event: Event | None = None
+        # stop the lookup when the window is closed
+        self.bind('<Destroy>', lambda _: self.cancel_lookup(), add='+')
+
         self.output_widget = TkOutputWidget(self, wrap='none')
         for name in configs.tag_names:
             self.output_widget.register_tag(name)
@@ -66,22 +89,108 @@ class TkSeedInfo(ttk.Frame):
         self.callback_func = callback_func
 
     def validate_input(self) -> None:
+        """Looks up the seed in a separate thread, the result
+        is handled by lookup_callback.
+        """
+        if self._cancel_event is not None:
+            return
         input_string = self.entry.get()
-        try:
-            seed = get_seed_from_string(
-                input_string, Configs.continue_ps2_seed_search)
-        except (InvalidDamageValueError, SeedNotFoundError) as error:
+        cancel_event = Event()
+        self._cancel_event = cancel_event
+        self.button.state(['disabled'])
+
+        def lookup() -> int:
+            return get_seed_from_string(
+                input_string, Configs.continue_ps2_seed_search,
+                self.progress_frame.report, cancel_event)
+
+        run_in_thread(self, lookup, self.lookup_callback, self.show_progress)
+
+    def cancel_lookup(self) -> None:
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def show_progress(self) -> None:
+        if not self.progress_frame.winfo_ismapped():
+            self.progress_frame.pack(after=self.inner_frame)
+        self.progress_frame.refresh()
+
+    def lookup_callback(self,
+                        seed: int | None,
+                        error: Exception | None,
+                        ) -> None:
+        self._cancel_event = None
+        self.button.state(['!disabled'])
+        self.progress_frame.reset()
+        self.progress_frame.forget()
+        if isinstance(error, (InvalidDamageValueError, SeedNotFoundError)):
             self.show_warning(str(error))
             return
+        elif error is not None:
+            raise error
 
         self.show_warning('')
         self.print_output(seed)
         reload_notes = 'selected' in self.reload_notes.state()
         self.callback_func(seed, reload_notes)
 
+    def update_candidates(self) -> None:
+        """Shows how many seeds in the seeds file match the damage
+        values typed so far and the equipment types of the first ones.
+        """
+        candidates = self.get_candidates()
+        if candidates is None:
+            self.show_candidates('')
+            return
+        try:
+            damage_values = parse_damage_values(self.entry.get())
+            candidates.update(damage_values)
+        except (InvalidDamageValueError, SeedNotFoundError):
+            # a single number could be a seed number
+            damage_values = []
+        if not damage_values:
+            self.show_candidates('')
+            return
+        lines = [f'Possible seeds: {len(candidates)}']
+        seeds = candidates.get_seeds(CANDIDATES_SHOWN)
+        seeds_equipment_types = calculate_batch_equipment_types(
+            seeds, CANDIDATES_EQUIPMENT_TYPES)
+        for seed, equipment_types in zip(seeds, seeds_equipment_types):
+            lines.append(
+                f'{seed:>10}: {' '.join(t[0] for t in equipment_types)}')
+        self.show_candidates('\n'.join(lines))
+
+    def get_candidates(self) -> SeedCandidates | None:
+        """Returns the candidates of the seeds file
+        or None if it hasn't been created yet.
+        """
+        if self._candidates is None:
+            file_path = SEEDS_FILE_PATHS[Configs.game_version]
+            if not os.path.exists(file_path):
+                return None
+            self._candidates = SeedCandidates(SeedsIndex(file_path))
+        return self._candidates
+
+    def close_seeds_file(self) -> None:
+        if self._candidates is not None:
+            self._candidates.seeds_index.close()
+            self._candidates = None
+
+    def show_candidates(self, text: str) -> None:
+        if text:
+            self.candidates_label.pack(after=self.inner_frame)
+        else:
+            self.candidates_label.forget()
+        self.candidates_label.config(text=text)
+
     def print_output(self, seed: int) -> None:
+        seed_string = f'Seed Number: {seed}'
+        origin = get_seed_origin(seed)
+        if origin is not None:
+            frame, date_time = origin
+            seed_string += f' (Frame: {frame}, Datetime: {date_time})'
         data = [
-            f'Seed Number: {seed}',
+            seed_string,
             get_equipment_types(seed, 50, 2),
             get_status_chance_table(seed, 99),
         ]
@@ -95,3 +204,9 @@ class TkSeedInfo(ttk.Frame):
         else:
             self.warning_label.forget()
         self.warning_label.config(text=text)
+
+
+# number of candidate seeds whose equipment types are shown
+CANDIDATES_SHOWN = 3
+# number of equipment types shown for every candidate seed
+CANDIDATES_EQUIPMENT_TYPES = 16
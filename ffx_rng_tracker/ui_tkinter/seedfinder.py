@@ -1,12 +1,15 @@
 import tkinter as tk
+from threading import Event
 from tkinter import ttk
 
 from ..configs import UIWidgetConfigs
+from ..errors import SeedSearchCancelledError
 from ..events.parser import EventParser
-from ..ui_abstract.seedfinder import SeedFinder
-from .base_widgets import TkConfirmPopup, TkWarningPopup
+from ..ui_abstract.seedfinder import SeedFinder, SeedSearch
+from .base_widgets import ProgressFrame, TkConfirmPopup, TkWarningPopup
 from .input_widget import TkInputWidget, TkSearchBarWidget
 from .output_widget import TkOutputWidget
+from .tkinter_utils import run_in_thread
 
 
 class TkSeedFinderInputWidget(TkInputWidget):
@@ -49,8 +52,16 @@ class TkSeedFinder(ttk.Frame):
 
         ttk.Entry(frame, textvariable=input_widget.damage_values).pack(fill='x')
 
-        button = ttk.Button(frame, text='Search Seed')
-        button.pack()
+        self.button = ttk.Button(
+            frame, text='Search Seed', command=self.find_seed)
+        self.button.pack()
+
+        self.progress_frame = ProgressFrame(
+            frame, 'Searching...', self.cancel_search)
+        self.progress_frame.progress_bar.config(length=100)
+        self._cancel_event: Event | None = None
+        # stop the search when the window is closed
+        self.bind('<Destroy>', lambda _: self.cancel_search(), add='+')
 
         output_widget = TkOutputWidget(self)
         output_widget.pack(expand=True, fill='both', side='right')
@@ -64,5 +75,46 @@ class TkSeedFinder(ttk.Frame):
             warning_popup=TkWarningPopup(),
             confirmation_popup=TkConfirmPopup(),
         )
-        button.configure(command=self.tracker.find_seed)
         self.tracker.callback()
+
+    def find_seed(self) -> None:
+        """Searches the seed on worker processes from a separate
+        thread, the result is handled by search_callback.
+        """
+        if self._cancel_event is not None:
+            return
+        search = self.tracker.prepare_search()
+        if search is None:
+            return
+        cancel_event = Event()
+        self._cancel_event = cancel_event
+        self.button.state(['disabled'])
+        self.progress_frame.pack(after=self.button, fill='x')
+
+        def run_search() -> int | None:
+            return search.run(progress_callback=self.progress_frame.report,
+                              cancel_event=cancel_event)
+
+        def callback(seed: int | None, error: Exception | None) -> None:
+            self.search_callback(search, seed, error)
+
+        run_in_thread(self, run_search, callback, self.progress_frame.refresh)
+
+    def cancel_search(self) -> None:
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def search_callback(self,
+                        search: SeedSearch,
+                        seed: int | None,
+                        error: Exception | None,
+                        ) -> None:
+        self._cancel_event = None
+        self.button.state(['!disabled'])
+        self.progress_frame.reset()
+        self.progress_frame.forget()
+        if isinstance(error, SeedSearchCancelledError):
+            return
+        elif error is not None:
+            raise error
+        self.tracker.show_search_result(search, seed)
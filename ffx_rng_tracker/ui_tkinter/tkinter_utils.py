@@ -1,3 +1,4 @@
+import threading
 import tkinter as tk
 from collections import deque
 from collections.abc import Callable
@@ -81,5 +82,44 @@ def bind_all_children(widget: tk.Widget,
         widgets.extend(list(widget.children.values()))
 
 
+def run_in_thread[T](widget: tk.Misc,
+                     function: Callable[[], T],
+                     callback_func: Callable[[T | None, Exception | None],
+                                             None],
+                     poll_func: Callable[[], None] | None = None,
+                     ) -> threading.Thread:
+    """Calls function in a separate thread, then calls callback_func
+    on the Tkinter main thread with the value returned by function
+    or with the exception it raised.
+
+    The thread is polled with widget.after, poll_func is called
+    on every poll while the thread is still running.
+    """
+    outcome = []
+
+    def target() -> None:
+        try:
+            outcome.append((function(), None))
+        except Exception as error:
+            outcome.append((None, error))
+
+    def poll() -> None:
+        if thread.is_alive():
+            if poll_func is not None:
+                poll_func()
+            widget.after(THREAD_POLL_INTERVAL, poll)
+        else:
+            callback_func(*outcome[0])
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    widget.after(THREAD_POLL_INTERVAL, poll)
+    return thread
+
+
 def get_default_font() -> tuple[str, int]:
     return 'Courier New', Configs.font_size
+
+
+# milliseconds between checks of the threads started by run_in_thread
+THREAD_POLL_INTERVAL = 50
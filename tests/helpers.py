@@ -0,0 +1,91 @@
+from collections.abc import Callable
+from unittest import mock
+
+from ffx_rng_tracker.configs import Configs, UITagConfigs
+from ffx_rng_tracker.data.constants import SpeedrunCategory, UIWidget
+from ffx_rng_tracker.data.file_functions import get_resource_path
+from ffx_rng_tracker.events.parser import EventParser
+from ffx_rng_tracker.gamestate import GameState
+from ffx_rng_tracker.tracker import FFXRNGTracker
+from ffx_rng_tracker.ui_abstract.base_tracker import TrackerUI
+from ffx_rng_tracker.utils import open_cp1252, stringify
+
+
+class FakeInputWidget:
+
+    def __init__(self) -> None:
+        self.text = ''
+
+    def get_input(self) -> str:
+        return self.text
+
+    def set_input(self, text: str) -> None:
+        self.text = text
+
+    def register_callback(self, callback_func: Callable[[], None]) -> None:
+        return
+
+
+class FakeOutputWidget:
+
+    def __init__(self) -> None:
+        self.tags: dict[str, UITagConfigs] = {}
+        self.output = ''
+
+    def print_output(self, output: str) -> None:
+        self.output = output
+
+    def highlight_pattern(self, *_) -> None:
+        return
+
+    def clean_tag(self, *_) -> None:
+        return
+
+    def register_tag(self,
+                     tag_name: str,
+                     tag: UITagConfigs | None = None,
+                     ) -> None:
+        if tag is None:
+            tag = Configs.ui_tags.get(tag_name)
+            if tag is None:
+                return
+        self.tags[tag_name] = tag
+
+    def seek(self, *_) -> None:
+        return
+
+
+class FakePopup:
+
+    def print_output(self, *_) -> bool:
+        return True
+
+
+def make_tracker[T: TrackerUI](tracker_type: type[T],
+                               widget: UIWidget,
+                               seed: int,
+                               ) -> T:
+    """Returns a tracker with fake widgets and no input,
+    the notes files are not read.
+    """
+    configs = Configs.ui_widgets[widget]
+    parser = EventParser(GameState(FFXRNGTracker(seed)))
+    with mock.patch.object(
+            tracker_type, 'get_default_input_data', return_value=''):
+        return tracker_type(
+            configs=configs,
+            parser=parser,
+            input_widget=FakeInputWidget(),
+            output_widget=FakeOutputWidget(),
+            search_bar=FakeInputWidget(),
+            warning_popup=FakePopup(),
+            confirmation_popup=FakePopup(),
+            )
+
+
+def get_default_notes(file_name: str) -> str:
+    """Returns the default notes of the any% category."""
+    category = stringify(SpeedrunCategory.ANYPERCENT)
+    file_path = get_resource_path(f'data_files/notes/{category}/{file_name}')
+    with open_cp1252(file_path) as notes_file:
+        return notes_file.read()
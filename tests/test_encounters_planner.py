@@ -0,0 +1,55 @@
+import unittest
+
+from ffx_rng_tracker.configs import REGEX_NEVER_MATCH, Configs
+from ffx_rng_tracker.data.constants import UIWidget
+from ffx_rng_tracker.ui_abstract.encounters_planner import EncountersPlanner
+
+from .helpers import make_tracker
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+class TestEncountersPlanner(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tracker = make_tracker(
+            EncountersPlanner, UIWidget.ENCOUNTERS_PLANNER, 3556394350)
+
+    def get_output(self, lines: list[str]) -> str:
+        self.tracker.input_widget.set_input('\n'.join(lines))
+        self.tracker.callback()
+        return self.tracker.output_widget.output
+
+    def test_hidden_encounters_are_counted(self) -> None:
+        encounters = ['encounter kilika_woods'] * 14
+        output = self.get_output(encounters).splitlines()
+        hidden_output = self.get_output(
+            encounters[:12] + ['///'] + encounters[12:]).splitlines()
+        self.assertEqual(hidden_output, output[-2:])
+
+    def test_gemini_variants(self) -> None:
+        output = self.get_output(['encounter omega_ruins_upper'] * 40)
+        lines = [line for line in output.splitlines() if 'Gemini' in line]
+        self.assertTrue(lines)
+        # Gemini#3 is tallied separately from Gemini
+        for tally, line in enumerate(lines, 1):
+            self.assertIn(f'Gemini{{{tally}}}, Gemini#3{{{tally}}}', line)
+
+    def test_captured_monsters(self) -> None:
+        tag = self.tracker.output_widget.tags['#captured monsters']
+        self.get_output(['encounter kilika_woods'])
+        self.assertIs(tag.regex_pattern, REGEX_NEVER_MATCH)
+        encounters = ['encounter kilika_woods'] * 31
+        self.get_output(encounters)
+        pattern = tag.regex_pattern
+        self.assertIsNot(pattern, REGEX_NEVER_MATCH)
+        # the monsters captured in the hidden encounters
+        # are still highlighted
+        self.get_output(encounters[:30] + ['///'] + encounters[30:])
+        self.assertEqual(tag.regex_pattern.pattern, pattern.pattern)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.data.constants import UIWidget
+from ffx_rng_tracker.events.comment import Comment
+from ffx_rng_tracker.events.main import get_rows
+from ffx_rng_tracker.ui_abstract.actions_tracker import ActionsTracker
+from ffx_rng_tracker.ui_abstract.drops_tracker import DropsTracker
+
+from .helpers import get_default_notes, make_tracker
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+class TestRows(unittest.TestCase):
+
+    def assert_rows(self, tracker_type: type, widget: UIWidget) -> None:
+        tracker = make_tracker(tracker_type, widget, 3556394350)
+        text = tracker.edit_input(get_default_notes(tracker.notes_file))
+        events = [e for e in tracker.parser.parse(text)
+                  if not isinstance(e, Comment)]
+        self.assertTrue(events)
+        for event in events:
+            rows = [(r.name, r.columns) for r in event.to_rows()]
+            string_rows = [(r.name, r.columns) for r in get_rows(str(event))]
+            self.assertEqual(rows, string_rows, str(event))
+
+    def test_actions_rows(self) -> None:
+        self.assert_rows(ActionsTracker, UIWidget.ACTIONS)
+
+    def test_drops_rows(self) -> None:
+        self.assert_rows(DropsTracker, UIWidget.DROPS)
+
+    def test_multiple_targets(self) -> None:
+        tracker = make_tracker(ActionsTracker, UIWidget.ACTIONS, 3556394350)
+        _, event = tracker.parser.parse(
+            'encounter tanker\naction auron dragon_fang')
+        first_row, *rows = event.to_rows()
+        self.assertEqual(first_row.name, 'Auron -> Dragon Fang [80]')
+        self.assertEqual(len(rows), 7)
+        # the targets are aligned under the first one
+        indentation = len(str(first_row)) - len(first_row.columns[0]) + 1
+        for row in rows:
+            self.assertEqual(row.columns, ())
+            self.assertEqual(len(row.name) - len(row.name.lstrip()),
+                             indentation)
+
+
+if __name__ == '__main__':
+    unittest.main()
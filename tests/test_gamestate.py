@@ -0,0 +1,55 @@
+import unittest
+
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.data.constants import UIWidget
+from ffx_rng_tracker.ui_abstract.actions_tracker import ActionsTracker
+
+from .helpers import get_default_notes, make_tracker
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tracker = make_tracker(ActionsTracker, UIWidget.ACTIONS, 3556394350)
+        notes = tracker.edit_input(get_default_notes(tracker.notes_file))
+        self.parser = tracker.parser
+        self.gamestate = tracker.parser.gamestate
+        self.lines = self.parser.apply_macros(notes).splitlines()
+
+    def parse(self, lines: list[str]) -> list[str]:
+        return [str(self.parser.parse_line(line)) for line in lines]
+
+    def test_restore(self) -> None:
+        middle = len(self.lines) // 2
+        self.gamestate.reset()
+        self.parse(self.lines[:middle])
+        snapshot = self.gamestate.snapshot()
+        expected = self.parse(self.lines[middle:])
+        # the same snapshot can be restored more than once
+        for _ in range(2):
+            self.gamestate.restore(snapshot)
+            self.assertEqual(self.parse(self.lines[middle:]), expected)
+
+    def test_restore_after_reset(self) -> None:
+        self.gamestate.reset()
+        snapshot = self.gamestate.snapshot()
+        expected = self.parse(self.lines)
+        self.gamestate.restore(snapshot)
+        self.assertEqual(self.parse(self.lines), expected)
+
+    def test_snapshot_is_not_changed(self) -> None:
+        self.gamestate.reset()
+        snapshot = self.gamestate.snapshot()
+        self.parse(self.lines)
+        self.assertEqual(self.gamestate.snapshot(), self.gamestate.snapshot())
+        self.assertNotEqual(self.gamestate.snapshot(), snapshot)
+        self.gamestate.restore(snapshot)
+        self.assertEqual(self.gamestate.snapshot(), snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
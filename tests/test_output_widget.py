@@ -0,0 +1,81 @@
+import re
+import unittest
+
+from ffx_rng_tracker.configs import REGEX_NEVER_MATCH, Configs
+from ffx_rng_tracker.data.constants import UIWidget
+from ffx_rng_tracker.ui_abstract.actions_tracker import ActionsTracker
+from ffx_rng_tracker.ui_tkinter.output_widget import (PatternsScanner,
+                                                      get_scoped_pattern)
+
+from .helpers import get_default_notes, make_tracker
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+class TestPatternsScanner(unittest.TestCase):
+
+    def get_spans(self,
+                  patterns: dict[str, re.Pattern],
+                  line: str,
+                  ) -> list[tuple[str, int, int]]:
+        spans = []
+        for name, pattern in patterns.items():
+            for match in pattern.finditer(line):
+                start, end = match.span()
+                if end > start:
+                    spans.append((name, start, end))
+        return sorted(spans)
+
+    def assert_spans(self,
+                     patterns: dict[str, re.Pattern],
+                     lines: list[str],
+                     ) -> None:
+        scanner = PatternsScanner(patterns)
+        for line in lines:
+            self.assertEqual(sorted(scanner.get_spans(line)),
+                             self.get_spans(patterns, line), line)
+            # cached
+            self.assertEqual(sorted(scanner.get_spans(line)),
+                             self.get_spans(patterns, line), line)
+
+    def test_overlapping_patterns(self) -> None:
+        patterns = {
+            'word': re.compile(r'\w+'),
+            'ab': re.compile('ab'),
+            'aba': re.compile('aba'),
+            'same ab': re.compile('ab'),
+            'case': re.compile('AB', flags=re.IGNORECASE),
+            'groups': re.compile(r'(a)(b)?'),
+            'never': REGEX_NEVER_MATCH,
+            }
+        lines = ['', 'ababab', 'abAB aba-ba', 'xyz', 'a b ab  aab']
+        self.assert_spans(patterns, lines)
+
+    def test_separate_patterns(self) -> None:
+        patterns = {
+            'named group': re.compile(r'(?P<a>a)b'),
+            'reference': re.compile(r'(a)\1'),
+            'empty': re.compile('a*'),
+            'lookahead': re.compile('(?=b)'),
+            'b': re.compile('b+'),
+            }
+        self.assertIsNone(get_scoped_pattern(patterns['named group']))
+        self.assertIsNone(get_scoped_pattern(patterns['reference']))
+        lines = ['', 'aabbaa', 'bab', 'xaax']
+        self.assert_spans(patterns, lines)
+
+    def test_tags(self) -> None:
+        tracker = make_tracker(ActionsTracker, UIWidget.ACTIONS, 3556394350)
+        tracker.input_widget.set_input(
+            tracker.edit_input(get_default_notes(tracker.notes_file)))
+        tracker.callback()
+        lines = tracker.output_widget.output.splitlines()
+        patterns = {name: tag.regex_pattern
+                    for name, tag in tracker.output_widget.tags.items()}
+        self.assert_spans(patterns, lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+import unittest
+from unittest import mock
+
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.data.constants import Character, KillType, UIWidget
+from ffx_rng_tracker.data.monsters import get_monsters_dict
+from ffx_rng_tracker.events.encounter import RandomEncounter
+from ffx_rng_tracker.events.main import EventRow
+from ffx_rng_tracker.events.parser import EventParser
+from ffx_rng_tracker.events.parsing_functions import (ARGUMENTS_PARSERS,
+                                                      parse_action, parse_kill)
+from ffx_rng_tracker.gamestate import GameState
+from ffx_rng_tracker.tracker import FFXRNGTracker
+from ffx_rng_tracker.ui_abstract.actions_tracker import ActionsTracker
+from ffx_rng_tracker.ui_abstract.encounters_planner import EncountersPlanner
+
+from .helpers import make_tracker
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+class TestMacros(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.parser = EventParser(GameState(FFXRNGTracker(0)))
+        self.parser.macros.update({
+            'a': 'line a 1\n/macro b\nline a 2',
+            'b': 'line b',
+            'empty': '',
+            'blank lines': 'line 1\n\nline 2',
+            'self': 'line self\n/macro self',
+            'cycle 1': '/macro cycle 2',
+            'cycle 2': 'line cycle 2\n/macro cycle 1',
+            })
+
+    def expand_macros(self, text: str) -> list[str]:
+        lines, _ = self.parser.expand_macros(text)
+        return lines
+
+    def test_expand_macros(self) -> None:
+        text = 'first\n/macro a\n\n/macro blank lines\nlast'
+        self.assertEqual(
+            self.parser.expand_macros(text),
+            (['first', 'line a 1', 'line b', 'line a 2', '',
+              'line 1', '', 'line 2', 'last'],
+             [0, 1, 1, 1, 2, 3, 3, 3, 4]),
+            )
+        self.assertEqual(self.parser.apply_macros(text),
+                         '\n'.join(self.expand_macros(text)))
+
+    def test_unknown_macros(self) -> None:
+        lines = ['/macro c', '/macro', '/macro  a', '/MACRO b', '/macro a ']
+        self.assertEqual(self.parser.expand_macros('\n'.join(lines)),
+                         (lines, [0, 1, 2, 3, 4]))
+
+    def test_empty_macro(self) -> None:
+        self.assertEqual(
+            self.parser.expand_macros('first\n/macro empty\nlast'),
+            (['first', '', 'last'], [0, 1, 2]),
+            )
+
+    def test_macro_used_inside_itself(self) -> None:
+        self.assertEqual(
+            self.expand_macros('/macro self'),
+            ['line self', '/macro self'],
+            )
+        self.assertEqual(
+            self.expand_macros('/macro cycle 1'),
+            ['line cycle 2', '/macro cycle 1'],
+            )
+        self.assertEqual(
+            self.expand_macros('/macro cycle 2'),
+            ['line cycle 2', '/macro cycle 2'],
+            )
+
+    def test_macro_errors(self) -> None:
+        for line in ('/macro self', '/macro cycle 1'):
+            event = self.parser.parse_line(line)
+            self.assertEqual(
+                str(event), f'Error: Macro "{line[7:]}" uses itself')
+        for line in ('/macro c', '/MACRO b', '/Macro a', '/macro  a'):
+            event = self.parser.parse_line(line)
+            self.assertTrue(
+                str(event).startswith('Error: Possible macros are "a", "b"'),
+                line)
+
+    def test_macro_errors_line_number(self) -> None:
+        text = 'first\n\n/macro cycle 2\n/macro self\n/macro c'
+        rows = [str(r) for r in self.parser.reparse_to_rows(text)]
+        self.assertEqual(rows, [
+            'Error: No event called "first"',
+            '',
+            'Error: No event called "line" (line 3: /macro cycle 2)',
+            'Error: Macro "cycle 2" uses itself (line 3: /macro cycle 2)',
+            'Error: No event called "line" (line 4: /macro self)',
+            'Error: Macro "self" uses itself (line 4: /macro self)',
+            'Error: Possible macros are "a", "b", "empty", "blank lines", '
+            '"self", "cycle 1", "cycle 2"',
+            ])
+        # the same lines coming from the text have no line number
+        text = 'line cycle 2\n/macro cycle 2'
+        rows = [str(r) for r in self.parser.reparse_to_rows(text)]
+        self.assertEqual(rows, [
+            'Error: No event called "line"',
+            'Error: No event called "line" (line 2: /macro cycle 2)',
+            'Error: Macro "cycle 2" uses itself (line 2: /macro cycle 2)',
+            ])
+        # same lines after the expansion, but from a macro
+        rows = self.parser.reparse_to_rows('/macro b')
+        self.assertEqual([str(r) for r in rows],
+                         ['Error: No event called "line" (line 1: /macro b)'])
+        rows = self.parser.reparse_to_rows('line b')
+        self.assertEqual([str(r) for r in rows],
+                         ['Error: No event called "line"'])
+
+
+class TestReparse(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.parser = self.make_parser()
+        self.parser.checkpoint_interval = 4
+        self.lines = ['encounter kilika_woods'] * 40
+
+    def make_parser(self) -> EventParser:
+        tracker = make_tracker(
+            EncountersPlanner, UIWidget.ENCOUNTERS_PLANNER, 3556394350)
+        return tracker.parser
+
+    def fresh_parse(self, text: str) -> tuple[list[EventRow], list[str]]:
+        parser = self.make_parser()
+        rows = parser.reparse_to_rows(text)
+        return rows, [str(e) for e in parser.hidden_events]
+
+    def assert_reparse(self, lines: list[str]) -> None:
+        text = '\n'.join(lines)
+        rows = self.parser.reparse_to_rows(text)
+        hidden_events = [str(e) for e in self.parser.hidden_events]
+        self.assertEqual((rows, hidden_events), self.fresh_parse(text))
+
+    def test_edits(self) -> None:
+        self.assert_reparse(self.lines)
+        self.assert_reparse(self.lines[:30])
+        self.assert_reparse(self.lines[:10] + ['advance rng1 5']
+                            + self.lines[10:])
+        self.assert_reparse(self.lines)
+        self.assert_reparse(['encounter tanker'] + self.lines)
+
+    def test_hidden_lines(self) -> None:
+        self.assert_reparse(self.lines)
+        for index in (40, 20, 35, 5, 0, 39):
+            lines = self.lines.copy()
+            lines.insert(index, '///')
+            self.assert_reparse(lines)
+        self.assert_reparse(self.lines)
+        lines = self.lines.copy()
+        lines[30:30] = ['///', '# comment']
+        lines[10:10] = ['///']
+        self.assert_reparse(lines)
+        del lines[31]
+        self.assert_reparse(lines)
+
+    def test_hidden_lines_are_not_rendered(self) -> None:
+        lines = (['/nopadding', 'encounter tanker']
+                 + self.lines[:20] + ['# comment', '///'] + self.lines[20:])
+        with mock.patch.object(RandomEncounter, 'to_rows', autospec=True,
+                               side_effect=RandomEncounter.to_rows) as to_rows:
+            rows = self.parser.reparse_to_rows('\n'.join(lines))
+        self.assertEqual(to_rows.call_count, 20)
+        hidden_events = [str(e) for e in self.parser.hidden_events]
+        self.assertEqual(len(hidden_events), 23)
+        self.assertEqual([str(r) for r in rows[:3]],
+                         ['Command: /nopadding', '# comment', 'Command: ///'])
+        self.assertEqual(len(rows), 23)
+        # the events are the same as when they are visible
+        visible_rows, _ = self.fresh_parse('\n'.join(lines[:-21]))
+        self.assertEqual(hidden_events, [str(r) for r in visible_rows[:23]])
+
+
+class TestParsedLines(unittest.TestCase):
+
+    def setUp(self) -> None:
+        tracker = make_tracker(ActionsTracker, UIWidget.ACTIONS, 3556394350)
+        self.parser = tracker.parser
+        self.parser.parsing_functions['kill'] = parse_kill
+
+    def test_arguments(self) -> None:
+        parsed_line = self.parser.get_parsed_line('Kill Piranha Tidus ty ok')
+        self.assertIs(parsed_line.parsing_function, parse_kill)
+        self.assertEqual(
+            parsed_line.arguments,
+            (get_monsters_dict()['piranha'], Character.TIDUS,
+             [Character.TIDUS, Character.YUNA], KillType.OVERKILL),
+            )
+        parsed_line = self.parser.get_parsed_line('kill nope tidus')
+        self.assertIsNone(parsed_line.event_function)
+        self.assertEqual(parsed_line.text, 'Error: No monster named "nope"')
+        parsed_line = self.parser.get_parsed_line('kill')
+        self.assertTrue(parsed_line.text.startswith('Error: Usage: kill'))
+
+    def test_arguments_are_parsed_once(self) -> None:
+        arguments_parser, event_function = ARGUMENTS_PARSERS[parse_action]
+        arguments_parser = mock.Mock(wraps=arguments_parser)
+        parsers = {parse_action: (arguments_parser, event_function)}
+        line = 'action tidus attack m1'
+        with mock.patch.dict(ARGUMENTS_PARSERS, parsers):
+            for _ in range(3):
+                self.parser.parse_line(line)
+        arguments_parser.assert_called_once_with('tidus', 'attack', 'm1')
+
+    def test_events_depend_on_the_gamestate(self) -> None:
+        line = 'action tidus attack m1'
+        self.assertEqual(str(self.parser.parse_line(line)),
+                         'Error: No monster in slot 1')
+        self.parser.parse_line('encounter tanker')
+        self.assertNotIn('Error', str(self.parser.parse_line(line)))
+        self.parser.parse_line('encounter dummy')
+        self.assertEqual(str(self.parser.parse_line(line)),
+                         'Error: No monster in slot 1')
+
+    def test_cached_lines(self) -> None:
+        lines = ['action tidus attack m1', 'encounter tanker', '# comment',
+                 'kill piranha tidus', 'action yuna cure m1', '/nopadding',
+                 'nope', 'action tidus attack m1', 'monsteraction m1']
+        self.parser.gamestate.reset()
+        events = [str(self.parser.parse_line(line)) for line in lines]
+        self.parser.gamestate.reset()
+        self.assertEqual(
+            [str(self.parser.parse_line(line)) for line in lines], events)
+        parser = make_tracker(
+            ActionsTracker, UIWidget.ACTIONS, 3556394350).parser
+        parser.parsing_functions['kill'] = parse_kill
+        self.assertEqual([str(parser.parse_line(line)) for line in lines],
+                         events)
+
+    def test_macro_errors_are_not_cached(self) -> None:
+        self.parser.macros.clear()
+        self.assertEqual(str(self.parser.parse_line('/macro a')),
+                         'Error: Possible macros are ')
+        self.parser.macros['b'] = ''
+        self.assertEqual(str(self.parser.parse_line('/macro a')),
+                         'Error: Possible macros are "b"')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,369 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from random import Random
+from threading import Event
+from unittest import mock
+
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.data import seeds
+from ffx_rng_tracker.data.constants import (EncounterCondition,
+                                            GameVersion)
+from ffx_rng_tracker.data.seeds import (EncountersIndex, ObservedEncounter,
+                                        SeedCandidates, SeedsIndex,
+                                        SeedsOrigins, damage_rolls_to_values,
+                                        datetime_to_seed, filter_seeds,
+                                        get_damage_rolls,
+                                        get_damage_rolls_keys,
+                                        get_seed_from_string,
+                                        get_seeds_from_encounters,
+                                        make_encounters_file, make_seeds_file,
+                                        make_seeds_origins_file,
+                                        parse_observed_encounters, run_shards,
+                                        search_seed)
+from ffx_rng_tracker.errors import SeedNotFoundError, SeedSearchCancelledError
+from ffx_rng_tracker.events.parser import EventParser
+from ffx_rng_tracker.events.parsing_functions import parse_encounter
+from ffx_rng_tracker.gamestate import GameState
+from ffx_rng_tracker.tracker import FFXRNGTracker
+
+DATE_TIMES = [0, 1, 2, 3]
+ENDING_FRAME = 60
+# the encounters of the route that use the first
+# ENCOUNTERS_FILE_VALUES rng values of rng index 1
+ENCOUNTERS = ['sinscales', 'ammes', 'tanker', 'sahagins', 'geosgaeno',
+              'klikk_1', 'klikk_2', 'underwater_ruins', 'piranhas', 'tros',
+              'besaid_lagoon', 'besaid_lagoon', 'kimahri',
+              ]
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+def get_config(name: str) -> object:
+    return getattr(Configs, name)
+
+
+class TestSeedsFile(unittest.TestCase):
+
+    def setUp(self) -> None:
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.directory = temp_directory.name
+        # more than one chunk so that the chunks are merged
+        patcher = mock.patch.object(seeds, 'SEEDS_FILE_CHUNK_FRAMES', 25)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_seeds(self) -> list[int]:
+        return [datetime_to_seed(d, f)
+                for f in range(ENDING_FRAME) for d in DATE_TIMES]
+
+    def test_find(self) -> None:
+        file_path = os.path.join(self.directory, 'seeds.bin')
+        make_seeds_file(file_path, DATE_TIMES, ENDING_FRAME, processes=1)
+        tracker = FFXRNGTracker(0)
+        with SeedsIndex(file_path) as seeds_index:
+            keys = [seeds_index[i] for i in range(len(seeds_index))]
+            self.assertEqual(keys, sorted(set(keys)))
+            for seed in self.get_seeds():
+                tracker.seed = seed
+                damage_rolls = get_damage_rolls(tracker)
+                indexes = seeds_index.find(damage_rolls)
+                self.assertEqual(len(indexes), 1)
+                found_seed = seeds_index.get_seed(indexes[0])
+                if found_seed != seed:
+                    # only the lowest seed of the same damage rolls is kept
+                    self.assertLess(found_seed, seed)
+                    tracker.seed = found_seed
+                    self.assertEqual(get_damage_rolls(tracker), damage_rolls)
+                self.assertIn(indexes[0], seeds_index.find(damage_rolls[:3]))
+
+    def test_empty_file(self) -> None:
+        file_path = os.path.join(self.directory, 'seeds.bin')
+        make_seeds_file(file_path, DATE_TIMES, 0, processes=1)
+        with SeedsIndex(file_path) as seeds_index:
+            self.assertEqual(len(seeds_index), 0)
+            self.assertFalse(seeds_index.find([1, 2, 3]))
+
+    def test_get_origin(self) -> None:
+        file_path = os.path.join(self.directory, 'seeds_origins.bin')
+        make_seeds_origins_file(
+            file_path, DATE_TIMES, ENDING_FRAME, processes=1)
+        with SeedsOrigins(file_path) as seeds_origins:
+            seeds = [seeds_origins[i] for i in range(len(seeds_origins))]
+            self.assertEqual(seeds, sorted(set(seeds)))
+            seen_seeds = set()
+            for frame in range(ENDING_FRAME):
+                for date_time in DATE_TIMES:
+                    seed = datetime_to_seed(date_time, frame)
+                    origin = seeds_origins.get_origin(seed)
+                    if seed in seen_seeds:
+                        # only the first frame and datetime are kept
+                        self.assertNotEqual(origin, (frame, date_time))
+                    else:
+                        self.assertEqual(origin, (frame, date_time))
+                    seen_seeds.add(seed)
+            self.assertEqual(len(seeds_origins), len(seen_seeds))
+            self.assertIsNone(seeds_origins.get_origin(max(seen_seeds) + 1))
+            self.assertIsNone(seeds_origins.get_origin(min(seen_seeds) - 1))
+
+    def test_processes(self) -> None:
+        file_path = os.path.join(self.directory, 'seeds.bin')
+        make_seeds_file(file_path, DATE_TIMES, ENDING_FRAME, processes=1)
+        processes_file_path = os.path.join(self.directory, 'processes.bin')
+        make_seeds_file(
+            processes_file_path, DATE_TIMES, ENDING_FRAME, processes=2)
+        with (open(file_path, 'rb') as file_object,
+              open(processes_file_path, 'rb') as processes_file_object):
+            self.assertEqual(processes_file_object.read(), file_object.read())
+
+    def test_resume(self) -> None:
+        file_path = os.path.join(self.directory, 'seeds.bin')
+        make_seeds_file(file_path, DATE_TIMES, ENDING_FRAME, processes=1)
+        with open(file_path, 'rb') as file_object:
+            expected = file_object.read()
+
+        resumed_file_path = os.path.join(self.directory, 'resumed.bin')
+        cancel_event = Event()
+        chunks_done = []
+
+        def progress_callback(done: int, total: int) -> None:
+            chunks_done.append(done)
+            cancel_event.set()
+
+        with self.assertRaises(SeedSearchCancelledError):
+            make_seeds_file(resumed_file_path, DATE_TIMES, ENDING_FRAME,
+                            processes=1, progress_callback=progress_callback,
+                            cancel_event=cancel_event)
+        self.assertFalse(os.path.exists(resumed_file_path))
+        self.assertEqual(chunks_done, [1])
+        # the chunk already done is not calculated again
+        make_seeds_file(resumed_file_path, DATE_TIMES, ENDING_FRAME,
+                        processes=1,
+                        progress_callback=lambda d, _: chunks_done.append(d))
+        self.assertEqual(chunks_done, [1, 2, 3])
+        with open(resumed_file_path, 'rb') as file_object:
+            self.assertEqual(file_object.read(), expected)
+        self.assertFalse(os.path.exists(resumed_file_path + '.partial'))
+
+    def test_restart_with_different_arguments(self) -> None:
+        file_path = os.path.join(self.directory, 'seeds.bin')
+        cancel_event = Event()
+        with self.assertRaises(SeedSearchCancelledError):
+            make_seeds_file(file_path, DATE_TIMES, ENDING_FRAME, processes=1,
+                            progress_callback=lambda *_: cancel_event.set(),
+                            cancel_event=cancel_event)
+        make_seeds_file(file_path, DATE_TIMES[:2], ENDING_FRAME, processes=1)
+        expected_file_path = os.path.join(self.directory, 'expected.bin')
+        make_seeds_file(
+            expected_file_path, DATE_TIMES[:2], ENDING_FRAME, processes=1)
+        with (open(file_path, 'rb') as file_object,
+              open(expected_file_path, 'rb') as expected_file):
+            self.assertEqual(file_object.read(), expected_file.read())
+
+
+class TestSeedCandidates(unittest.TestCase):
+
+    def setUp(self) -> None:
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.file_path = os.path.join(temp_directory.name, 'seeds.bin')
+        make_seeds_file(self.file_path, DATE_TIMES, ENDING_FRAME, processes=1)
+        self.seeds_index = SeedsIndex(self.file_path)
+        self.addCleanup(self.seeds_index.close)
+
+    def get_damage_values(self, seed: int) -> list[int]:
+        tracker = FFXRNGTracker(seed)
+        return damage_rolls_to_values(get_damage_rolls(tracker))
+
+    def test_update(self) -> None:
+        candidates = SeedCandidates(self.seeds_index)
+        self.assertEqual(len(candidates), len(self.seeds_index))
+        seed = datetime_to_seed(2, ENDING_FRAME // 2)
+        damage_values = self.get_damage_values(seed)
+        for n_of_values in range(1, 9):
+            old_length = len(candidates)
+            candidates.update(damage_values[:n_of_values])
+            self.assertLessEqual(len(candidates), old_length)
+            for candidate in candidates.get_seeds():
+                self.assertEqual(
+                    self.get_damage_values(candidate)[:n_of_values],
+                    damage_values[:n_of_values])
+        self.assertEqual(candidates.get_seeds(), [seed])
+
+    def test_change_last_value(self) -> None:
+        damage_values = self.get_damage_values(datetime_to_seed(1, 10))
+        other_values = self.get_damage_values(datetime_to_seed(3, 40))
+        candidates = SeedCandidates(self.seeds_index)
+        candidates.update(damage_values[:3])
+        candidates.update(damage_values[:2] + other_values[2:3])
+        candidates.update(other_values[:3])
+        new_candidates = SeedCandidates(self.seeds_index)
+        new_candidates.update(other_values[:3])
+        self.assertEqual(candidates.get_seeds(), new_candidates.get_seeds())
+        self.assertEqual(candidates.get_seeds(1),
+                         new_candidates.get_seeds()[:1])
+
+
+class TestEncountersIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        self.seeds_file_path = os.path.join(temp_directory.name, 'seeds.bin')
+        make_seeds_file(
+            self.seeds_file_path, DATE_TIMES, ENDING_FRAME, processes=1)
+        self.file_path = os.path.join(temp_directory.name, 'encounters.bin')
+        # more than one chunk so that the chunks are joined
+        with mock.patch.object(seeds, 'ENCOUNTERS_FILE_CHUNK_SEEDS', 100):
+            make_encounters_file(
+                self.file_path, self.seeds_file_path, processes=1)
+        for name, value in (
+                ('get_seeds_file', lambda *_: self.seeds_file_path),
+                ('ENCOUNTERS_FILE_PATHS',
+                 {Configs.game_version: self.file_path}),
+                ):
+            patcher = mock.patch.object(seeds, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_encounters_string(self, seed: int) -> str:
+        """Returns the encounters of the seed as they are
+        input in the seed info.
+        """
+        parser = EventParser(GameState(FFXRNGTracker(seed)))
+        encounters = []
+        for name in ENCOUNTERS:
+            event = parse_encounter(parser.gamestate, name)
+            encounters.append(f'{name} {event.formation} {event.condition}')
+        return '; '.join(encounters)
+
+    def test_values(self) -> None:
+        with (SeedsIndex(self.seeds_file_path) as seeds_index,
+              EncountersIndex(self.file_path) as encounters_index):
+            self.assertEqual(len(encounters_index), len(seeds_index))
+            for index in range(0, len(seeds_index), 7):
+                tracker = FFXRNGTracker(seeds_index.get_seed(index))
+                values = [encounters_index.get_column(p)[index]
+                          for p in range(seeds.ENCOUNTERS_FILE_VALUES)]
+                self.assertEqual(
+                    values,
+                    [tracker.advance_rng(1) for _ in values])
+
+    def test_find_seed(self) -> None:
+        with SeedsIndex(self.seeds_file_path) as seeds_index:
+            test_seeds = [seeds_index.get_seed(i)
+                          for i in range(0, len(seeds_index), 23)]
+        for seed in test_seeds:
+            encounters_string = self.get_encounters_string(seed)
+            found_seeds = get_seeds_from_encounters(
+                parse_observed_encounters(encounters_string))
+            self.assertIn(seed, found_seeds)
+            for found_seed in found_seeds:
+                self.assertEqual(self.get_encounters_string(found_seed),
+                                 encounters_string)
+            if len(found_seeds) == 1:
+                self.assertEqual(get_seed_from_string(encounters_string),
+                                 seed)
+            else:
+                with self.assertRaises(SeedNotFoundError):
+                    get_seed_from_string(encounters_string)
+
+    def test_partial_encounters(self) -> None:
+        seed = datetime_to_seed(2, ENDING_FRAME // 2)
+        encounters = parse_observed_encounters(
+            self.get_encounters_string(seed))
+        # without formations only the conditions are checked
+        encounters = [ObservedEncounter(e.name, condition=e.condition)
+                      for e in encounters]
+        found_seeds = get_seeds_from_encounters(encounters)
+        self.assertIn(seed, found_seeds)
+        for found_seed in found_seeds:
+            found_encounters = parse_observed_encounters(
+                self.get_encounters_string(found_seed))
+            self.assertEqual([e.condition for e in found_encounters],
+                             [e.condition for e in encounters])
+        with self.assertRaises(SeedNotFoundError):
+            get_seeds_from_encounters(
+                [ObservedEncounter(e.name) for e in encounters])
+
+    def test_parse_errors(self) -> None:
+        with self.assertRaises(SeedNotFoundError):
+            parse_observed_encounters('sinscales; not_an_encounter')
+        with self.assertRaises(SeedNotFoundError):
+            parse_observed_encounters('underwater_ruins tanker')
+        encounter, = parse_observed_encounters(
+            ' Kilika_Woods initiative preemptive ; ')
+        self.assertEqual(encounter, ObservedEncounter(
+            'kilika_woods', None, EncounterCondition.PREEMPTIVE, True))
+
+
+class TestRunShards(unittest.TestCase):
+
+    def test_workers_configs(self) -> None:
+        # spawned worker processes don't inherit the configs
+        context = multiprocessing.get_context('spawn')
+        executor = partial(ProcessPoolExecutor, mp_context=context)
+        shards = [('game_version', ), ('seeds_cache_size', ), ('seed', )]
+        with (mock.patch.object(Configs, 'game_version', GameVersion.PS2JP),
+              mock.patch.object(Configs, 'seeds_cache_size', 17),
+              mock.patch.object(Configs, 'seed', 3556394350),
+              mock.patch.object(seeds, 'multiprocessing', context),
+              mock.patch.object(seeds, 'ProcessPoolExecutor', executor)):
+            results = dict(run_shards(get_config, shards, processes=2))
+        self.assertEqual(results, {('game_version', ): GameVersion.PS2JP,
+                                   ('seeds_cache_size', ): 17,
+                                   ('seed', ): 3556394350,
+                                   })
+
+
+class TestSearchSeed(unittest.TestCase):
+
+    def test_lowest_frame(self) -> None:
+        def run_shards(function, shards, processes, cancel_event):
+            # the shards finish in reverse order, the ones starting
+            # at an odd multiple of 1800 frames find a seed
+            for shard in reversed(shards):
+                frames = shard[2]
+                if frames.start // 1800 % 2:
+                    yield shard, frames.start
+                else:
+                    yield shard, None
+
+        with (mock.patch.object(Configs, 'game_version', GameVersion.PS2NA),
+              mock.patch.object(seeds, 'run_shards', run_shards)):
+            seed = search_seed([0] * 8)
+        frames_from_boot = seeds.FRAMES_FROM_BOOT[GameVersion.PS2NA]
+        self.assertEqual(seed, frames_from_boot + 1800)
+
+    def test_filter_seeds(self) -> None:
+        random = Random(0)
+        seeds_list = [0, 1, 0x7fffffff, 0x80000000, 0xffffffff]
+        seeds_list.extend(random.getrandbits(32) for _ in range(1000))
+        tracker = FFXRNGTracker(0)
+        damage_rolls = []
+        for seed in seeds_list:
+            tracker.seed = seed
+            damage_rolls.append(get_damage_rolls(tracker))
+        keys = get_damage_rolls_keys(seeds_list)
+        for key, rolls in zip(keys, damage_rolls):
+            self.assertEqual(
+                [int.from_bytes(key) >> 6 * (7 - i) & 63 for i in range(8)],
+                rolls)
+        for rolls in random.sample(damage_rolls, 20):
+            for amount in (1, 2, 8):
+                self.assertEqual(
+                    filter_seeds(seeds_list, rolls[:amount]),
+                    [s for s, r in zip(seeds_list, damage_rolls)
+                     if r[:amount] == rolls[:amount]])
+        self.assertEqual(filter_seeds(seeds_list, []), seeds_list)
+        self.assertEqual(filter_seeds(seeds_list, damage_rolls[0] + [0]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
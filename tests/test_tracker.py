@@ -0,0 +1,114 @@
+import sys
+import threading
+import unittest
+from itertools import islice
+
+from ffx_rng_tracker.tracker import (BatchRNGTracker, FFXRNGTracker,
+                                     RNGStreams, get_lanes_ones, pack_lanes,
+                                     unpack_lanes)
+
+SEEDS = (0, 1, 3556394350, 0xffffffff, 0x80000000)
+RNG_INDEXES = (0, 1, 2, 10, 20, 22, 36, 52, 67)
+
+
+def get_expected_values(seed: int, rng_index: int, amount: int) -> list[int]:
+    tracker = FFXRNGTracker(seed)
+    return list(islice(tracker.get_rng_generator(rng_index), amount))
+
+
+class TestRNGStreams(unittest.TestCase):
+
+    def test_advance_rng(self) -> None:
+        # more values than max_block_size, so that blocks
+        # of every size are generated
+        amount = RNGStreams.max_block_size * 3 + 5
+        for seed in SEEDS:
+            tracker = FFXRNGTracker(seed)
+            for rng_index in RNG_INDEXES:
+                with self.subTest(seed=seed, rng_index=rng_index):
+                    values = [tracker.advance_rng(rng_index)
+                              for _ in range(amount)]
+                    self.assertEqual(
+                        values, get_expected_values(seed, rng_index, amount))
+
+    def test_shared_streams(self) -> None:
+        tracker_1 = FFXRNGTracker(SEEDS[2])
+        tracker_2 = FFXRNGTracker(SEEDS[2])
+        expected = get_expected_values(SEEDS[2], 20, 100)
+        values_1 = [tracker_1.advance_rng(20) for _ in range(50)]
+        values_2 = [tracker_2.advance_rng(20) for _ in range(100)]
+        values_1.extend(tracker_1.advance_rng(20) for _ in range(50))
+        self.assertEqual(values_1, expected)
+        self.assertEqual(values_2, expected)
+        tracker_1.reset()
+        self.assertEqual(tracker_1.advance_rng(20), expected[0])
+
+    def test_threads(self) -> None:
+        seed = 123456789
+        amount = RNGStreams.max_block_size * 4
+        expected = get_expected_values(seed, 1, amount)
+        results: list[list[int]] = []
+
+        def advance_rng() -> None:
+            tracker = FFXRNGTracker(seed)
+            results.append([tracker.advance_rng(1) for _ in range(amount)])
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=advance_rng)
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertEqual(len(results), len(threads))
+        for values in results:
+            self.assertEqual(values, expected)
+
+
+class TestBatchRNGTracker(unittest.TestCase):
+
+    def test_advance_rng(self) -> None:
+        amount = 40
+        batch_tracker = BatchRNGTracker(SEEDS)
+        for rng_index in RNG_INDEXES:
+            rows = [batch_tracker.advance_rng(rng_index)
+                    for _ in range(amount)]
+            for i, seed in enumerate(SEEDS):
+                with self.subTest(seed=seed, rng_index=rng_index):
+                    self.assertEqual(
+                        [row[i] for row in rows],
+                        get_expected_values(seed, rng_index, amount))
+
+    def test_initial_values(self) -> None:
+        batch_tracker = BatchRNGTracker(SEEDS)
+        for i, seed in enumerate(SEEDS):
+            initial_values = FFXRNGTracker(seed).get_rng_initial_values()
+            self.assertEqual(
+                [batch_tracker.get_rng_initial_values(r)[i]
+                 for r in range(68)],
+                initial_values)
+
+    def test_lanes(self) -> None:
+        values = [0, 1, 2**32 - 1, 2**64 - 1, 2**63]
+        lanes = pack_lanes(values)
+        self.assertEqual(list(unpack_lanes(lanes, len(values))), values)
+        ones = get_lanes_ones(len(values))
+        self.assertEqual(list(unpack_lanes(ones, len(values))), [1] * 5)
+        self.assertEqual(
+            list(unpack_lanes(lanes >> 1 & ones * 0x7fffffff, len(values))),
+            [v >> 1 & 0x7fffffff for v in values])
+
+    def test_reset(self) -> None:
+        batch_tracker = BatchRNGTracker(SEEDS)
+        first_row = batch_tracker.advance_rng(5)
+        batch_tracker.advance_rng(5)
+        batch_tracker.reset()
+        self.assertEqual(batch_tracker.advance_rng(5), first_row)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from ffx_rng_tracker.configs import Configs
+from ffx_rng_tracker.events.parsing_functions import (parse_encounter,
+                                                      parse_equipment_change)
+from ffx_rng_tracker.gamestate import GameState
+from ffx_rng_tracker.tracker import FFXRNGTracker
+from ffx_rng_tracker.ui_functions import (calculate_batch_encounters,
+                                          calculate_batch_equipment_types,
+                                          calculate_batch_status_chances,
+                                          calculate_equipment_types)
+
+SEEDS = (0, 1, 3556394350, 0xffffffff, 0x80000000)
+ENCOUNTERS = ['sinscales', 'underwater_ruins', 'besaid_lagoon', 'simulation',
+              'kilika_woods', 'kilika_woods', 'dummy_preemptive', 'tros',
+              ]
+
+
+def setUpModule() -> None:
+    Configs.init_configs()
+
+
+class TestBatchFunctions(unittest.TestCase):
+
+    def test_equipment_types(self) -> None:
+        seeds_equipment_types = calculate_batch_equipment_types(SEEDS, 50)
+        self.assertEqual(
+            seeds_equipment_types,
+            [calculate_equipment_types(s, 50) for s in SEEDS])
+        self.assertEqual(calculate_batch_equipment_types(SEEDS, 0),
+                         [[] for _ in SEEDS])
+
+    def test_status_chances(self) -> None:
+        seeds_status_chances = calculate_batch_status_chances(SEEDS, 20)
+        for seed, status_chances in zip(SEEDS, seeds_status_chances,
+                                        strict=True):
+            tracker = FFXRNGTracker(seed)
+            rolls = [[tracker.advance_rng(i) % 101 for _ in range(20)]
+                     for i in range(52, 68)]
+            self.assertEqual(status_chances, list(zip(*rolls)))
+
+    def test_encounters(self) -> None:
+        for initiative in (False, True):
+            seeds_encounters = calculate_batch_encounters(
+                SEEDS, ENCOUNTERS, initiative)
+            for seed, encounters in zip(SEEDS, seeds_encounters,
+                                        strict=True):
+                gamestate = GameState(FFXRNGTracker(seed))
+                if initiative:
+                    parse_equipment_change(
+                        gamestate, 'weapon', 'tidus', '1', 'initiative')
+                expected = []
+                for name in ENCOUNTERS:
+                    event = parse_encounter(gamestate, name)
+                    expected.append((event.formation, event.condition))
+                with self.subTest(seed=seed, initiative=initiative):
+                    self.assertEqual(encounters, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()